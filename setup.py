@@ -0,0 +1,25 @@
+import os
+import importlib.util
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+
+class BuildPy(build_py):
+    '''构建时把内置文本图标包编译为 `.zicons` ，编译结果只写入构建目录，随包发布'''
+    def run(self):
+        super().run()
+        # 按路径加载编译模块，不导入 ZenWidgets 包本身，构建环境无需安装 PySide6
+        spec = importlib.util.spec_from_file_location(
+            '_zen_icon_package', os.path.join('src', 'ZenWidgets', 'gui', 'resource', 'package.py'))
+        package = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(package)
+        source_folder = os.path.join('src', 'ZenWidgets', 'gui', 'resource', 'packages')
+        target_folder = os.path.join(self.build_lib, 'ZenWidgets', 'gui', 'resource', 'packages')
+        os.makedirs(target_folder, exist_ok=True)
+        for name in sorted(os.listdir(source_folder)):
+            if not name.endswith('.icons'): continue
+            target = os.path.join(target_folder, os.path.splitext(name)[0] + package.compiled_suffix)
+            package.compileIconPackage(os.path.join(source_folder, name), target)
+
+
+setup(cmdclass={'build_py': BuildPy})
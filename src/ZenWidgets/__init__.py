@@ -1,8 +1,14 @@
-from .component import *
-from .core import *
-from .gui import *
+from . import core, gui, component
+from .core.utils.factory.lazy import lazyExports
 
-# __all__ = ['ZButton', 'ZNavBarButton', 'ZNavBarToggleButton', 'ZNavigationBar',
-#            'ZPage', 'ZScrollPage', 'ZStackPanel', 'ZTextBlock', 'ZToggleButton',
-#            'ZToolTip', 'ZFramelessWindow','ZImage','ZGlobal','ZTheme','ZSlider',
-#            'ZCard','ZThemeMode']
\ No newline at end of file
+# 组件、工具与主题的名称全部按需导入：导入 ZenWidgets 本身只加载这几个包的索引，
+# 不会导入任何组件，也不会创建主题管理器等单例
+__getattr__, __dir__, __all__ = lazyExports(__name__, {
+    '.component': (*component.__all__, *component.unstarred_exports),
+    '.core': tuple(core.__all__),
+    '.gui': tuple(gui.__all__),
+    # 以前经星号导入间接导出的 Qt 名称，保留以兼容 `from ZenWidgets import *` 的用户代码
+    'PySide6.QtCore': ('Qt', 'QRect', 'QTimer', 'QEvent', 'Signal', 'Slot'),
+    'PySide6.QtGui': ('QColor', 'QIcon', 'QPainter', 'QPen', 'QEnterEvent', 'QMouseEvent'),
+    'PySide6.QtWidgets': ('QWidget',),
+}, unstarred=component.unstarred_exports)
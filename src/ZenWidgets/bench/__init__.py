@@ -0,0 +1,5 @@
+'''
+ZenWidgets 性能基准
+
+通过 `python -m ZenWidgets.bench <command>` 运行，使用 `--help` 查看可用的基准
+'''
@@ -0,0 +1,32 @@
+import argparse
+from ZenWidgets.bench import animation, construction, startup
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m ZenWidgets.bench', description='ZenWidgets 性能基准')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    anim = commands.add_parser('anim', help='指数动画每帧开销的微基准')
+    anim.add_argument('--ticks', type=int, default=20000, help='每项测量推进的帧数')
+    anim.add_argument('--count', type=int, default=300, help='批量步进测量中同时运行的动画数量')
+    anim.set_defaults(func=animation.run)
+
+    construct = commands.add_parser('construct', help='公开组件的构造耗时、QObject 数量与内存（offscreen 平台）')
+    construct.add_argument('widgets', nargs='*', help='只测量指定的组件，默认测量全部')
+    construct.add_argument('--count', type=int, default=200, help='每个组件构造的实例数量')
+    construct.add_argument('--show', action='store_true', help='构造后显示并处理一次事件')
+    construct.add_argument('--json', metavar='PATH', help='把结果写入 JSON 文件，用于与基线比较')
+    construct.set_defaults(func=construction.run)
+
+    start = commands.add_parser('startup', help='各启动阶段的耗时与内存（每次运行都使用全新的解释器）')
+    start.add_argument('--repeat', type=int, default=5, help='计时运行的次数，结果取中位数')
+    start.add_argument('--imports', type=int, default=0, metavar='N', help='同时列出自身导入耗时最多的 N 个模块')
+    start.add_argument('--json', metavar='PATH', help='把结果写入 JSON 文件，可作为基线')
+    start.add_argument('--baseline', metavar='PATH', help='与基线 JSON 比较，出现回归时以非零状态退出')
+    start.add_argument('--tolerance', type=float, default=0.2, help='与基线比较时允许的相对增幅')
+    start.set_defaults(func=startup.run)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+if __name__ == '__main__':
+    main()
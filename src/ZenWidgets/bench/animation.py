@@ -0,0 +1,109 @@
+import time
+import numpy
+from PySide6.QtCore import QObject, Property
+from ZenWidgets.core.animation import ZExpPropertyAnimation, ZExpScalarAnimation, ZExpAnimationStore
+
+__all__ = ['benchScalarTick', 'benchBatchTick', 'run']
+
+class _Target(QObject):
+    '''只有一个 float 属性的动画目标'''
+    def __init__(self):
+        super().__init__()
+        self._value = .0
+
+    def getValue(self) -> float: return self._value
+
+    def setValue(self, v: float) -> None: self._value = v
+
+    value: float = Property(float, getValue, setValue)
+
+
+def _prepare(anim: ZExpPropertyAnimation) -> ZExpPropertyAnimation:
+    # 目标值足够远、因子足够小，保证测量期间动画不会到达终点
+    anim.init(factor=1e-9, bias=1.0, current_value=.0, end_value=1e12)
+    return anim
+
+
+def _baseline_tick(anim: ZExpPropertyAnimation) -> None:
+    '''改为批量步进之前 `ZExpPropertyAnimation.updateCurrentTime` 的逐帧运算，作为比较的基线'''
+    distance = anim._end_value - anim._current_value
+    if (distance == 0).all(): return
+    flag = numpy.array(abs(distance) <= anim.bias, dtype="int8")
+    step = abs(distance) * anim.factor + anim.bias
+    step = step * (numpy.array(distance > 0, dtype="int8") * 2 - 1)
+    step = step * (1 - flag) + distance * flag
+    anim._velocity = anim._velocity * anim._velocity_inertia + step * (1 - anim._velocity_inertia)
+    anim._current_value = anim._current_value + anim._velocity
+    anim.valueChanged.emit(anim._current_value)
+    anim._target.setProperty(anim._property_name, anim._out_func(anim._current_value))
+
+
+def _measure(tick, ticks: int) -> float:
+    start = time.perf_counter()
+    for _ in range(ticks): tick()
+    return (time.perf_counter() - start) / ticks * 1e6
+
+
+def benchScalarTick(ticks: int = 20000) -> dict[str, float]:
+    '''
+    比较单值属性每帧的开销
+
+    - baseline: 原先逐个推进的 NumPy 实现
+    - numpy: 现在的 `ZExpPropertyAnimation.updateCurrentTime`
+    - scalar: 纯 float 的 `ZExpScalarAnimation`
+
+    :return: 每帧耗时（微秒）
+    '''
+    baseline = _prepare(ZExpPropertyAnimation(_Target(), 'value'))
+    anim = _prepare(ZExpPropertyAnimation(_Target(), 'value'))
+    scalar = _prepare(ZExpScalarAnimation(_Target(), 'value'))
+    return {
+        'baseline': _measure(lambda: _baseline_tick(baseline), ticks),
+        'numpy': _measure(lambda: anim.updateCurrentTime(16), ticks),
+        'scalar': _measure(lambda: scalar.updateCurrentTime(16), ticks),
+    }
+
+
+def benchBatchTick(count: int = 300, ticks: int = 2000) -> dict[str, float]:
+    '''
+    比较 count 个动画每帧的开销
+
+    - baseline: 原先逐个推进的 NumPy 实现
+    - per_object: 逐个调用现在的 `updateCurrentTime`
+    - batch: 在 ZExpAnimationStore 中批量推进
+
+    逐个推进的两种方式与批量步进一样，每个动画每帧都会发出 valueChanged 并写回属性，
+    这部分开销无法向量化，动画数量多时占每帧耗时的大部分
+
+    :return: 每帧耗时（微秒）
+    '''
+    baseline = [_prepare(ZExpPropertyAnimation(_Target(), 'value')) for _ in range(count)]
+    anims = [_prepare(ZExpPropertyAnimation(_Target(), 'value')) for _ in range(count)]
+
+    def step_baseline():
+        for anim in baseline: _baseline_tick(anim)
+
+    def step_per_object():
+        for anim in anims: anim.updateCurrentTime(16)
+
+    result = {'baseline': _measure(step_baseline, ticks), 'per_object': _measure(step_per_object, ticks)}
+    store = ZExpAnimationStore()
+    for anim in anims: store.add(_prepare(anim))
+    result['batch'] = _measure(lambda: store.step(16), ticks)
+    return result
+
+
+def run(args) -> None:
+    scalar = benchScalarTick(args.ticks)
+    print(f"single value tick, {args.ticks} ticks")
+    print(f"  baseline per-object tick       : {scalar['baseline']:8.2f} us/tick")
+    print(f"  ZExpPropertyAnimation (NumPy)  : {scalar['numpy']:8.2f} us/tick")
+    print(f"  ZExpScalarAnimation   (float)  : {scalar['scalar']:8.2f} us/tick")
+    print(f"  speedup over baseline          : {scalar['baseline'] / scalar['scalar']:8.1f}x")
+    ticks = max(1, args.ticks // 10)
+    batch = benchBatchTick(args.count, ticks)
+    print(f"{args.count} animations, {ticks} ticks (every animation emits valueChanged and sets its property)")
+    print(f"  baseline per-object tick       : {batch['baseline']:8.2f} us/frame")
+    print(f"  per-object updateCurrentTime   : {batch['per_object']:8.2f} us/frame")
+    print(f"  ZExpAnimationStore.step        : {batch['batch']:8.2f} us/frame")
+    print(f"  speedup over baseline          : {batch['baseline'] / batch['batch']:8.1f}x")
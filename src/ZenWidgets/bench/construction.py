@@ -0,0 +1,108 @@
+import gc
+import os
+import sys
+import json
+import time
+import inspect
+import tracemalloc
+from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtCore import QObject
+
+__all__ = ['publicWidgets', 'benchConstruction', 'run']
+
+_skipped_widgets = ('ZTitleBar', 'ZFramelessWindow', 'ZStandardFramelessWindow')
+'''`component.window` 导出的组件依赖 Windows 原生窗口，在其他平台上无法导入，也无法在 offscreen 平台上构造'''
+
+
+def _application() -> QApplication:
+    # 必须在创建 QApplication 之前设置平台
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+
+def publicWidgets() -> dict[str, type[QWidget]]:
+    '''ZenWidgets 顶层导出的所有可实例化组件（排除抽象基类与平台相关的窗口）'''
+    import ZenWidgets
+    widgets = {}
+    for name in sorted(dir(ZenWidgets)):
+        # 先按名称过滤，被跳过的组件不会被按需导入
+        if not name.startswith('Z') or name in _skipped_widgets: continue
+        widget_type = getattr(ZenWidgets, name)
+        if not (inspect.isclass(widget_type) and issubclass(widget_type, QWidget)): continue
+        widgets[name] = widget_type
+    return widgets
+
+
+def _count_qobjects(widgets: list[QWidget]) -> int:
+    return sum(1 + len(w.findChildren(QObject)) for w in widgets)
+
+
+def benchConstruction(widget_type: type[QWidget], count: int = 200, show: bool = False) -> dict[str, float]:
+    '''
+    测量组件的构造开销
+
+    - time: 每个实例的构造耗时（微秒）
+    - qobjects: 每个实例的 QObject 树大小（自身加所有子对象）
+    - memory: 每个实例在 Python 侧分配的内存（字节，tracemalloc 统计，实例保持存活）
+
+    :param show: 为真时构造后立即显示并处理一次事件，把首次绘制中才创建的控制器计入
+    '''
+    app = _application()
+
+    def construct() -> tuple[QWidget, list[QWidget]]:
+        parent = QWidget()
+        widgets = [widget_type(parent=parent) for _ in range(count)]
+        if show:
+            parent.show()
+            app.processEvents()
+        return parent, widgets
+
+    def dispose(parent: QWidget) -> None:
+        parent.deleteLater()
+        app.processEvents()
+        gc.collect()
+
+    # 预热：首次构造会加载样式数据、图标等
+    warmup = QWidget()
+    widget_type(parent=warmup)
+    dispose(warmup)
+    # 计时与内存分开测量，避免 tracemalloc 的开销计入构造耗时
+    start = time.perf_counter()
+    parent, widgets = construct()
+    elapsed = time.perf_counter() - start
+    qobjects = _count_qobjects(widgets)
+    del widgets
+    dispose(parent)
+
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+    parent, widgets = construct()
+    memory = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(snapshot, 'filename'))
+    tracemalloc.stop()
+    del widgets
+    dispose(parent)
+    return {
+        'time': elapsed / count * 1e6,
+        'qobjects': qobjects / count,
+        'memory': memory / count,
+    }
+
+
+def run(args) -> None:
+    _application()
+    widgets = publicWidgets()
+    if args.widgets: widgets = {name: widgets[name] for name in args.widgets if name in widgets}
+    results: dict[str, dict[str, float]] = {}
+    print(f"{'widget':<24}{'time (us)':>12}{'qobjects':>10}{'memory (B)':>12}")
+    for name, widget_type in widgets.items():
+        try:
+            result = benchConstruction(widget_type, args.count, args.show)
+        except TypeError as e:
+            # 需要额外构造参数的组件
+            print(f"{name:<24}{'skipped':>12}  {e}")
+            continue
+        results[name] = result
+        print(f"{name:<24}{result['time']:>12.1f}{result['qobjects']:>10.1f}{result['memory']:>12.0f}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'count': args.count, 'show': args.show, 'results': results}, f, indent=2)
@@ -0,0 +1,154 @@
+import os
+import sys
+import json
+import statistics
+import subprocess
+
+__all__ = ['startupPhases', 'importProfile', 'benchStartup', 'compareBaseline', 'run']
+
+startupPhases = ('import', 'init', 'icons', 'resources', 'window')
+'''
+启动过程的各个阶段，按顺序在同一个全新的解释器中执行
+
+- import: `import ZenWidgets`
+- init: `ZGlobal.initZenWidgets()` ，创建主题管理器与样式数据管理器、初始化日志
+- icons: 首次访问 `ZGlobal.iconPack` ，读取并解析图标包
+- resources: 注册 `gui/resource/icons_rc.py` 中的内置资源
+- window: 创建 QApplication 与一个包含常用组件的窗口，显示并处理完首轮事件
+'''
+
+# 在子进程中执行：测量前不能导入 ZenWidgets 的任何模块，因此以源码字符串的形式传给解释器
+_probe_script = r'''
+import os, sys, json, time, tracemalloc
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+trace = sys.argv[1] == 'memory'
+result = {}
+def phase(name, func):
+    if trace: tracemalloc.start(); tracemalloc.reset_peak()
+    start = time.perf_counter()
+    value = func()
+    elapsed = time.perf_counter() - start
+    entry = {'time': elapsed * 1000}
+    if trace:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        entry = {'memory': current / 1024, 'peak': peak / 1024}
+    result[name] = entry
+    return value
+
+def import_():
+    import ZenWidgets
+    return ZenWidgets
+
+def window():
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    from ZenWidgets import ZPanel, ZVBoxLayout, ZHeadLine, ZButton, ZLineEdit, ZSwitch, ZSlider
+    panel = ZPanel()
+    layout = ZVBoxLayout(panel)
+    for widget in (ZHeadLine(text='ZenWidgets'), ZButton(text='Button'), ZLineEdit(), ZSwitch(), ZSlider()):
+        layout.addWidget(widget)
+    panel.resize(480, 360)
+    panel.show()
+    app.processEvents()
+    return panel
+
+ZenWidgets = phase('import', import_)
+phase('init', lambda: ZenWidgets.ZGlobal.initZenWidgets())
+phase('icons', lambda: ZenWidgets.ZGlobal.iconPack)
+phase('resources', lambda: ZenWidgets.gui.loadBuiltinResources())
+panel = phase('window', window)
+print(json.dumps(result))
+'''
+
+
+def _environment() -> dict[str, str]:
+    # 子进程从当前使用的 ZenWidgets 所在目录导入，而不是环境中可能安装的其他版本
+    import ZenWidgets
+    root = os.path.dirname(os.path.dirname(os.path.abspath(ZenWidgets.__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (root, env.get('PYTHONPATH'))))
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return env
+
+
+def _probe(mode: str, flags: tuple[str, ...] = ()) -> subprocess.CompletedProcess:
+    completed = subprocess.run([sys.executable, *flags, '-c', _probe_script, mode],
+                               env=_environment(), capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"启动探测进程失败:\n{completed.stderr}")
+    return completed
+
+
+def benchStartup(repeat: int = 5) -> dict[str, dict[str, float]]:
+    '''
+    在全新的解释器中测量各启动阶段
+
+    - time: 耗时（毫秒），取 `repeat` 次运行的中位数
+    - memory: 阶段结束时 Python 侧新增并仍存活的内存（KiB，tracemalloc 统计）
+    - peak: 阶段内的内存峰值（KiB）
+
+    计时与内存分开运行，避免 tracemalloc 的开销计入耗时
+    '''
+    times: dict[str, list[float]] = {name: [] for name in startupPhases}
+    for _ in range(max(1, repeat)):
+        sample = json.loads(_probe('time').stdout.splitlines()[-1])
+        for name in startupPhases: times[name].append(sample[name]['time'])
+    memory = json.loads(_probe('memory').stdout.splitlines()[-1])
+    return {name: {'time': statistics.median(times[name]), **memory[name]} for name in startupPhases}
+
+
+def importProfile(top: int = 15) -> list[dict[str, float | str]]:
+    '''
+    用 `-X importtime` 统计 `import ZenWidgets` 及首个窗口期间导入的模块
+
+    :return: 按自身耗时降序的前 `top` 个模块，时间单位为毫秒
+    '''
+    completed = _probe('time', ('-X', 'importtime'))
+    modules = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line: continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.append({'module': name.strip(), 'self': int(self_us) / 1000, 'cumulative': int(cumulative_us) / 1000})
+    modules.sort(key=lambda m: m['self'], reverse=True)
+    return modules[:top]
+
+
+def compareBaseline(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]],
+                    tolerance: float = 0.2) -> list[str]:
+    '''
+    与基线比较耗时
+
+    :param tolerance: 允许的相对增幅，超过则视为回归
+    :return: 回归描述，没有回归时为空列表
+    '''
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline: continue
+        before, after = baseline[name]['time'], result['time']
+        if after > before * (1 + tolerance):
+            regressions.append(f"{name}: {before:.1f} ms -> {after:.1f} ms (+{(after / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def run(args) -> None:
+    results = benchStartup(args.repeat)
+    print(f"{'phase':<12}{'time (ms)':>12}{'memory (KiB)':>14}{'peak (KiB)':>12}")
+    for name, result in results.items():
+        print(f"{name:<12}{result['time']:>12.1f}{result['memory']:>14.0f}{result['peak']:>12.0f}")
+    print(f"{'total':<12}{sum(r['time'] for r in results.values()):>12.1f}")
+    imports = []
+    if args.imports:
+        imports = importProfile(args.imports)
+        print(f"\n{'module':<56}{'self (ms)':>10}{'cumul (ms)':>12}")
+        for module in imports:
+            print(f"{module['module']:<56}{module['self']:>10.1f}{module['cumulative']:>12.1f}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'repeat': args.repeat, 'python': sys.version.split()[0], 'results': results, 'imports': imports}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compareBaseline(results, baseline, args.tolerance)
+        for regression in regressions: print(f"regression: {regression}")
+        if regressions: sys.exit(1)
@@ -1,10 +1,29 @@
-from .base import *
-from .layouts import *
-from .cards import *
-from .info import *
-from .input import *
-from .text import *
-from .navigations import *
-from .media import *
-from .dialogs import *
-from .window import *
+import sys
+from ZenWidgets.core.utils.factory.lazy import lazyExports
+
+window_exports = ('ZTitleBar', 'ZFramelessWindow', 'ZStandardFramelessWindow')
+'''依赖 Windows 原生窗口的组件，其他平台上导入会失败，因此只在 Windows 上参与星号导入'''
+unstarred_exports = () if sys.platform == 'win32' else window_exports
+
+__getattr__, __dir__, __all__ = lazyExports(__name__, {
+    '.base': ('ABCPooledController', 'ABCAnimatedColor', 'ZAnimatedColor', 'ZAnimatedLinearGradient',
+              'ZWindowBackGround', 'ABCAnimatedOpacity', 'ZAnimatedOpacity', 'ZWindowOpacity', 'ABCAnimatedPoint',
+              'ZAnimatedPoint', 'ZAnimatedPointF', 'ZWidgetPosition', 'ABCAnimatedRect', 'ZAnimatedRect',
+              'ZWidgetRect', 'ABCAnimatedSize', 'ZAnimatedSize', 'ZWidgetSize', 'ZOpacityEffect', 'ZFlashEffect',
+              'ABCAnimatedInt', 'ZAnimatedInt', 'ABCAnimatedFloat', 'ZAnimatedFloat', 'ZStyleController',
+              'ZStyleDispatcher', 'ZWidget', 'ZPlaceHolderWidget', 'ZContentWidget', 'ABCButton', 'ABCToggleButton',
+              'ABCRepeatButton', 'ABCLongPressButton', 'ABCProgressButton', 'ZButtonGroup'),
+    '.layouts': ('ZBoxLayout', 'ZHBoxLayout', 'ZVBoxLayout', 'ZGridLayout', 'ZPanel', 'ZScrollPanel', 'ABCScrollDelegate',
+                 'ZStackContainer', 'ZHContainer', 'ZVContainer', 'ABCDenseContainer', 'ZHDenseContainer',
+                 'ZVDenseContainer', 'ABCFlowContainer', 'ZFlowContainer', 'ZMasonryContainer', 'ABCMasonrySource',
+                 'ZMasonryView'),
+    '.cards': ('ZCard',),
+    '.info': ('ZToolTip',),
+    '.input': ('ZButton', 'ZToggleButton', 'ZRepeatButton', 'ZLongPressButton', 'ZProgressButton', 'ZSwitch',
+               'ZSlider', 'ZComboBox'),
+    '.text': ('ZHeadLine', 'ZTextBlock', 'ZLineEdit', 'ZLoginEdit', 'ZNumberEdit'),
+    '.navigations': ('ZNavigationBar',),
+    '.media': ('ZImage',),
+    '.dialogs': ('ZDialog',),
+    '.window': window_exports,
+}, unstarred=unstarred_exports)
@@ -1,3 +1,4 @@
+from .pooled import *
 from .color import *
 from .opacity import *
 from .position import *
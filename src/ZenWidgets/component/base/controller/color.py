@@ -2,7 +2,7 @@ from typing import overload,cast
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import QObject,QPropertyAnimation,QEasingCurve,Property,Signal,QRect,QRectF
 from PySide6.QtGui import QColor,Qt,QPainter,QPen
-from ZenWidgets.core import ZDirection,ZExpPropertyAnimation
+from ZenWidgets.core import ZDirection,ZExpPropertyAnimation,ZAnimationDriver,isWidgetHidden
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ZenWidgets.component.window.framelesswindow import ZFramelessWindow
@@ -61,13 +61,17 @@ class ABCAnimatedColor(QObject):
 
     def setColorTo(self, arg1: QColor, arg2: QColor | None = None,/) -> None:
         self._anim.stop()
+        if isinstance(self._anim, QPropertyAnimation) and isWidgetHidden(self.parent()):
+            # 控件不可见时直接设为终点颜色，省去启动动画再跳到终点的开销（例如主题切换时的大量隐藏控件）
+            self.setColor(arg1 if arg2 is None else arg2)
+            return
         if arg2 is None:
             self._anim.setStartValue(self._color)
             self._anim.setEndValue(QColor(arg1))
         else:
             self._anim.setStartValue(QColor(arg1))
             self._anim.setEndValue(QColor(arg2))
-        self._anim.start()
+        self._start_(self._anim)
 
     @overload
     def setAlphaTo(self, alpha: int,/) -> None: ...
@@ -83,7 +87,7 @@ class ABCAnimatedColor(QObject):
         else:
             self._anim_alpha.setStartValue(float(arg1/255))
             self._anim_alpha.setEndValue(float(arg1/255))
-        self._anim_alpha.start()
+        self._start_(self._anim_alpha)
 
     @overload
     def setAlphaFTo(self, alpha: float,/) -> None: ...
@@ -99,7 +103,7 @@ class ABCAnimatedColor(QObject):
         else:
             self._anim_alpha.setStartValue(float(arg1))
             self._anim_alpha.setEndValue(float(arg1))
-        self._anim_alpha.start()
+        self._start_(self._anim_alpha)
 
     def toTransparent(self):
         self.setAlphaFTo(0.0)
@@ -107,18 +111,26 @@ class ABCAnimatedColor(QObject):
     def toOpaque(self):
         self.setAlphaFTo(1.0)
 
+    def _start_(self, anim: QPropertyAnimation) -> None:
+        anim.start()
+        # 控件不可见时（例如堆叠容器中的非当前页）直接跳到终点，不再逐帧重绘
+        if isinstance(anim, QPropertyAnimation) and isWidgetHidden(self.parent()):
+            anim.setCurrentTime(anim.totalDuration())
+
 
 # region ZAnimatedColor
 class ZAnimatedColor(ABCAnimatedColor):
     '''具有原生属性动画的颜色控制器'''
     def __init__(self, parent: QWidget, color: QColor = QColor('#909090')):
         super().__init__(parent, color)
-        self._anim = QPropertyAnimation(self, b'color')
+        self._anim = QPropertyAnimation(self, b'color', self)
         self._anim.setDuration(250)
         self._anim.setEasingCurve(QEasingCurve.Type.OutCirc)
-        self._anim_alpha = QPropertyAnimation(self, b'alphaF')
+        ZAnimationDriver().watch(self._anim)
+        self._anim_alpha = QPropertyAnimation(self, b'alphaF', self)
         self._anim_alpha.setDuration(250)
         self._anim_alpha.setEasingCurve(QEasingCurve.Type.OutCirc)
+        ZAnimationDriver().watch(self._anim_alpha)
 
     @property
     def animation(self) -> QPropertyAnimation: return self._anim
@@ -126,7 +138,7 @@ class ZAnimatedColor(ABCAnimatedColor):
     @property
     def animationAlpha(self) -> QPropertyAnimation: return self._anim_alpha
 
-    def _update_(self): self.parent().update()
+    def _update_(self): ZAnimationDriver().markDirty(self.parent())
 
     def parent(self) -> QWidget:
         return super().parent()
@@ -163,7 +175,7 @@ class ZAnimatedLinearGradient(QObject):
             self._linear_points = (0, 0, 1, 1)
         elif self._direction is ZDirection.DiagonalReverse:
             self._linear_points = (1, 0, 0, 1)
-        self.parent().update()
+        ZAnimationDriver().markDirty(self.parent())
 
 
     @property
@@ -172,7 +184,7 @@ class ZAnimatedLinearGradient(QObject):
     @reverse.setter
     def reverse(self, value: bool) -> None:
         self._reverse = value
-        self.parent().update()
+        ZAnimationDriver().markDirty(self.parent())
 
 
     @property
@@ -182,7 +194,7 @@ class ZAnimatedLinearGradient(QObject):
     def linearPoints(self, value: tuple[float, float, float, float]) -> None:
         self._linear_points = value
         self._direction = ZDirection.Custom
-        self.parent().update()
+        ZAnimationDriver().markDirty(self.parent())
 
     def parent(self) -> QWidget:
         return super().parent()
@@ -193,12 +205,14 @@ class ZWindowBackGround(ABCAnimatedColor):
     '''具有原生属性动画的窗口背景控制器，直接作用于 windows 系统的窗口'''
     def __init__(self, window: 'ZFramelessWindow', color: QColor = QColor('#202020')):
         super().__init__(window, color)
-        self._anim = QPropertyAnimation(self, b'color')
+        self._anim = QPropertyAnimation(self, b'color', self)
         self._anim.setDuration(250)
         self._anim.setEasingCurve(QEasingCurve.Type.OutCirc)
-        self._anim_alpha = QPropertyAnimation(self, b'alphaF')
+        ZAnimationDriver().watch(self._anim)
+        self._anim_alpha = QPropertyAnimation(self, b'alphaF', self)
         self._anim_alpha.setDuration(250)
         self._anim_alpha.setEasingCurve(QEasingCurve.Type.OutCirc)
+        ZAnimationDriver().watch(self._anim_alpha)
 
     @property
     def animation(self) -> QPropertyAnimation: return self._anim
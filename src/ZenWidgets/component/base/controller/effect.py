@@ -2,6 +2,7 @@ from typing import cast
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import Qt,QPropertyAnimation,Property,QEasingCurve,QObject,QRect,QElapsedTimer
 from PySide6.QtGui import QPainter,QColor
+from ZenWidgets.core import ZAnimationDriver
 
 __all__ = [
     'ZFlashEffect',
@@ -13,22 +14,23 @@ class ABCAnimatedEffect(QObject):
     def __init__(self, parent: QWidget):
         super().__init__(parent)
         self._color: QColor = QColor(130, 130, 130, 0)
-        self._anim = QPropertyAnimation(self, b'alphaF')
+        self._anim = QPropertyAnimation(self, b'alphaF', self)
         self._anim.setDuration(250)
         self._anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+        ZAnimationDriver().watch(self._anim)
 
     @property
     def animation(self) -> QPropertyAnimation: return self._anim
 
     def getAlphaF(self) -> float: return self._color.alphaF()
 
-    def setAlphaF(self, opacity: float): self._color.setAlphaF(min(1.0, max(0.0, opacity))); self.parent().update()
+    def setAlphaF(self, opacity: float): self._color.setAlphaF(min(1.0, max(0.0, opacity))); ZAnimationDriver().markDirty(self.parent())
 
     alphaF: float = cast(float, Property(float, getAlphaF, setAlphaF))
 
     def getColor(self) -> QColor: return self._color
 
-    def setColor(self, color: QColor): self._color = QColor(color); self.parent().update()
+    def setColor(self, color: QColor): self._color = QColor(color); ZAnimationDriver().markDirty(self.parent())
 
     color: QColor = cast(QColor, Property(QColor, getColor, setColor))
 
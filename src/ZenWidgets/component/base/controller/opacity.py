@@ -1,7 +1,8 @@
 from typing import overload,cast
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import QObject, Property, Signal
-from ZenWidgets.core import ZExpPropertyAnimation
+from ZenWidgets.core import ZExpScalarAnimation,ZAnimationDriver
+from .pooled import ABCPooledController
 
 __all__ = [
     "ABCAnimatedOpacity",
@@ -10,17 +11,18 @@ __all__ = [
 ]
 
 # region ABCAnimatedOpacity
-class ABCAnimatedOpacity(QObject):
+class ABCAnimatedOpacity(ABCPooledController):
     '''具有属性动画的透明度控制器抽象类'''
     opacityChanged = Signal(float)
     completelyHide = Signal()
     completelyShow = Signal()
+    __animation_type__ = ZExpScalarAnimation
+    __animation_property__ = "opacity"
     def __init__(self, parent: QWidget):
-        super().__init__(parent)
-        self._anim: ZExpPropertyAnimation | None = None
+        super().__init__(parent, factor=0.2, bias=0.01)
 
     @property
-    def animation(self): raise NotImplementedError
+    def animation(self) -> ZExpScalarAnimation: return super().animation
 
     def getOpacity(self) -> float: raise NotImplementedError
 
@@ -35,68 +37,52 @@ class ABCAnimatedOpacity(QObject):
     def fadeTo(self, start: float, end: float) -> None: ...
 
     def fadeTo(self, arg1: float, arg2: float | None = None) -> None:
-        self._anim.stop()
+        anim = self._acquire_()
+        anim.stop()
         if arg2 is None:
-            self._anim.setEndValue(arg1)
+            anim.setEndValue(arg1)
         else:
-            self._anim.setStartValue(arg1)
-            self._anim.setEndValue(arg2)
-        self._anim.start()
+            anim.setStartValue(arg1)
+            anim.setEndValue(arg2)
+        self._start_()
 
     def fadeIn(self) -> None:
-        self._anim.stop()
-        self._anim.setEndValue(1.0)
-        self._anim.start()
+        anim = self._acquire_()
+        anim.stop()
+        anim.setEndValue(1.0)
+        self._start_()
 
     def fadeOut(self) -> None:
-        self._anim.stop()
-        self._anim.setEndValue(.0)
-        self._anim.start()
+        anim = self._acquire_()
+        anim.stop()
+        anim.setEndValue(.0)
+        self._start_()
 
-    def _on_finished_(self) -> None:
+    def _on_animation_finished_(self) -> None:
+        super()._on_animation_finished_()
         if self.opacity == 0:
             self.completelyHide.emit()
         elif self.opacity == 1:
             self.completelyShow.emit()
 
-    def parent(self) -> QWidget:
-        return super().parent()
-
 # region ZAnimatedOpacity
 class ZAnimatedOpacity(ABCAnimatedOpacity):
     '''具有属性动画的透明度控制器'''
     def __init__(self, parent: QWidget, opacity: float = 1.0):
         super().__init__(parent)
         self._opacity = opacity
-        self._anim = ZExpPropertyAnimation(self, "opacity")
-        self._anim.finished.connect(self._on_finished_)
-        self._anim.setBias(0.01)
-        self._anim.setFactor(0.2)
-
-    @property
-    def animation(self) -> ZExpPropertyAnimation: return self._anim
 
     def getOpacity(self) -> float: return self._opacity
 
     def setOpacity(self, opacity: float) -> None:
         self._opacity = max(min(opacity, 1.0), 0)
-        self.parent().update()
+        ZAnimationDriver().markDirty(self.parent())
 
     opacity: float = cast(float, Property(float, getOpacity, setOpacity, notify=ABCAnimatedOpacity.opacityChanged))
 
 # region ZWindowOpacity
 class ZWindowOpacity(ABCAnimatedOpacity):
     '''具有属性动画的透明度控制器，直接作用于窗口透明度'''
-    def __init__(self, parent: QWidget):
-        super().__init__(parent)
-        self._anim = ZExpPropertyAnimation(self, "opacity")
-        self._anim.finished.connect(self._on_finished_)
-        self._anim.setBias(0.01)
-        self._anim.setFactor(0.2)
-
-    @property
-    def animation(self) -> ZExpPropertyAnimation: return self._anim
-
     def getOpacity(self) -> float: return self.parent().windowOpacity()
 
     def setOpacity(self, opacity: float) -> None: self.parent().setWindowOpacity(opacity)
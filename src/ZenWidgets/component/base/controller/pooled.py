@@ -0,0 +1,68 @@
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QObject, QTimer
+from ZenWidgets.core import ZExpPropertyAnimation, ZAnimationPool
+
+__all__ = ['ABCPooledController']
+
+# region ABCPooledController
+class ABCPooledController(QObject):
+    '''
+    按需使用动画的控制器抽象类
+
+    - 动画对象在第一次需要时从 `ZAnimationPool` 取出，结束后归还，大多数从不动画的控件因此不持有动画对象
+    - 子类通过 `__animation_type__` 与 `__animation_property__` 指定动画类型和作用的属性
+    - 外部访问 `animation` 属性（连接信号、修改参数等）后控制器会固定持有该动画，不再归还
+    '''
+    __animation_type__: type[ZExpPropertyAnimation] = ZExpPropertyAnimation
+    '''动画类型'''
+    __animation_property__: str = ''
+    '''动画作用的属性名'''
+    def __init__(self, parent: QWidget, factor: float = 0.2, bias: float = 1):
+        super().__init__(parent)
+        self._anim: ZExpPropertyAnimation | None = None
+        self._anim_factor: float = factor
+        self._anim_bias: float = bias
+        self._anim_pinned: bool = False
+
+    @property
+    def animation(self) -> ZExpPropertyAnimation:
+        self._anim_pinned = True
+        return self._acquire_()
+
+    def isAnimating(self) -> bool: return self._anim is not None and self._anim.isRunning()
+
+    def stopAnimation(self) -> None:
+        if self._anim is not None: self._anim.stop()
+
+    def setAnimationFactor(self, factor: float) -> None:
+        self._anim_factor = factor
+        if self._anim is not None: self._anim.setFactor(factor)
+
+    def setAnimationBias(self, bias: float) -> None:
+        self._anim_bias = bias
+        if self._anim is not None: self._anim.setBias(bias)
+
+    def _acquire_(self) -> ZExpPropertyAnimation:
+        if self._anim is None:
+            self._anim = ZAnimationPool().acquire(self.__animation_type__, self, self.__animation_property__)
+            self._anim.setFactor(self._anim_factor)
+            self._anim.setBias(self._anim_bias)
+            self._anim.finished.connect(self._on_animation_finished_)
+        return self._anim
+
+    def _start_(self) -> None:
+        self._anim.start()
+        # 已经处于终点时动画不会运行，也不会发出 finished ，直接归还
+        if not self._anim.isRunning(): self._release_()
+
+    def _release_(self) -> None:
+        if self._anim is None or self._anim_pinned or self._anim.isRunning(): return
+        animation, self._anim = self._anim, None
+        ZAnimationPool().release(animation)
+
+    def _on_animation_finished_(self) -> None:
+        # finished 也会在重新设定目标前的 stop() 中发出，推迟到本轮事件循环结束后再判断是否归还
+        QTimer.singleShot(0, self, self._release_)
+
+    def parent(self) -> QWidget:
+        return super().parent()
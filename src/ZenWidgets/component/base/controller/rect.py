@@ -1,7 +1,8 @@
 from typing import overload, cast
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import QObject, Property, QRect, Signal,QSize
-from ZenWidgets.core import ZExpPropertyAnimation
+from ZenWidgets.core import ZAnimationDriver
+from .pooled import ABCPooledController
 
 __all__ = [
     'ABCAnimatedRect',
@@ -10,15 +11,9 @@ __all__ = [
 ]
 
 # region ABCAnimatedRect
-class ABCAnimatedRect(QObject):
+class ABCAnimatedRect(ABCPooledController):
     rectChanged = Signal()
-    def __init__(self, parent: QWidget):
-        super().__init__(parent)
-        self._anim: ZExpPropertyAnimation | None = None
-
-    @property
-    def animation(self) -> ZExpPropertyAnimation:
-        return self._anim
+    __animation_property__ = "rect"
 
     def getRect(self) -> QRect:
         raise NotImplementedError
@@ -35,49 +30,44 @@ class ABCAnimatedRect(QObject):
     def moveResizeTo(self, x: int, y: int, width: int, height: int) -> None: ...
 
     def moveResizeTo(self, *args) -> None:
-        self._anim.stop()
+        anim = self._acquire_()
+        anim.stop()
         if len(args) == 1 and isinstance(args[0], QRect):
-            self._anim.setEndValue(args[0])
+            anim.setEndValue(args[0])
         else:
-            self._anim.setEndValue(QRect(*args))
-        self._anim.start()
+            anim.setEndValue(QRect(*args))
+        self._start_()
 
     def moveResizeFromTo(self, start: QRect, end: QRect) -> None:
-        self._anim.stop()
-        self._anim.setStartValue(start)
-        self._anim.setEndValue(end)
-        self._anim.start()
+        anim = self._acquire_()
+        anim.stop()
+        anim.setStartValue(start)
+        anim.setEndValue(end)
+        self._start_()
 
     def scaleIn(self, target_rect: QRect) -> None:
-        self._anim.stop()
+        anim = self._acquire_()
+        anim.stop()
         center = target_rect.center()
         start_rect = QRect(center, QSize(0, 0))
-        self._anim.setStartValue(start_rect)
-        self._anim.setEndValue(target_rect)
-        self._anim.start()
+        anim.setStartValue(start_rect)
+        anim.setEndValue(target_rect)
+        self._start_()
 
     def scaleOut(self) -> None:
-        self._anim.stop()
+        anim = self._acquire_()
+        anim.stop()
         current_rect = self.getRect()
         center = current_rect.center()
         end_rect = QRect(center, QSize(0, 0))
-        self._anim.setStartValue(current_rect)
-        self._anim.setEndValue(end_rect)
-        self._anim.start()
-
-    def parent(self) -> QWidget:
-        return super().parent()
+        anim.setStartValue(current_rect)
+        anim.setEndValue(end_rect)
+        self._start_()
 
 
 # region ZWidgetRect
 class ZWidgetRect(ABCAnimatedRect):
     '''具有属性动画的 QWidget 矩形控制器，直接作用于父 QWidget 的位置和大小'''
-    def __init__(self, parent: QWidget):
-        super().__init__(parent)
-        self._anim = ZExpPropertyAnimation(self, "rect")
-        self._anim.setBias(1)
-        self._anim.setFactor(0.2)
-
     def getRect(self) -> QRect:
         return self.parent().geometry()
 
@@ -93,19 +83,12 @@ class ZAnimatedRect(ABCAnimatedRect):
     def __init__(self, parent: QWidget, rect: QRect = QRect(0, 0, 0, 0)):
         super().__init__(parent)
         self._rect = rect
-        self._anim = ZExpPropertyAnimation(self, "rect")
-        self._anim.setBias(1)
-        self._anim.setFactor(0.2)
-
-    @property
-    def animation(self) -> ZExpPropertyAnimation:
-        return self._anim
 
     def getRect(self) -> QRect:
         return self._rect
 
     def setRect(self, rect: QRect) -> None:
         self._rect = rect
-        self.parent().update()
+        ZAnimationDriver().markDirty(self.parent())
 
     rect: QRect = cast(QRect, Property(QRect, getRect, setRect, notify=ABCAnimatedRect.rectChanged))
\ No newline at end of file
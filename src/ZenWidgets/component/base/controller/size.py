@@ -1,7 +1,8 @@
 from typing import overload,cast
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import QObject, Property, QSize, Signal
-from ZenWidgets.core import ZExpPropertyAnimation
+from ZenWidgets.core import ZAnimationDriver
+from .pooled import ABCPooledController
 
 __all__ = [
     'ABCAnimatedSize',
@@ -10,14 +11,9 @@ __all__ = [
 ]
 
 # region ABCAnimatedSize
-class ABCAnimatedSize(QObject):
+class ABCAnimatedSize(ABCPooledController):
     sizeChanged = Signal()
-    def __init__(self, parent:QWidget):
-        super().__init__(parent)
-        self._anim: ZExpPropertyAnimation|None = None
-
-    @property
-    def animation(self) -> ZExpPropertyAnimation: return self._anim
+    __animation_property__ = "size"
 
     def getSize(self) -> QSize: raise NotImplementedError
 
@@ -33,29 +29,22 @@ class ABCAnimatedSize(QObject):
     def resizeTo(self, x:int, y:int) -> None: ...
 
     def resizeTo(self, *args) -> None:
-        self._anim.stop()
-        self._anim.setEndValue(QSize(*args))
-        self._anim.start()
+        anim = self._acquire_()
+        anim.stop()
+        anim.setEndValue(QSize(*args))
+        self._start_()
 
     def resizeFromTo(self, start: QSize, end: QSize) -> None:
-        self._anim.stop()
-        self._anim.setStartValue(start)
-        self._anim.setEndValue(end)
-        self._anim.start()
-
-    def parent(self) -> QWidget:
-        return super().parent()
+        anim = self._acquire_()
+        anim.stop()
+        anim.setStartValue(start)
+        anim.setEndValue(end)
+        self._start_()
 
 
 # region ZWidgetSize
 class ZWidgetSize(ABCAnimatedSize):
     '''具有属性动画的 QWidget 尺寸控制器，直接作用于父 QWidget'''
-    def __init__(self, parent:QWidget):
-        super().__init__(parent)
-        self._anim = ZExpPropertyAnimation(self, "size")
-        self._anim.setBias(1)
-        self._anim.setFactor(0.2)
-
 
     def getSize(self) -> QSize: return self.parent().size()
 
@@ -69,17 +58,11 @@ class ZAnimatedSize(ABCAnimatedSize):
     def __init__(self, parent:QWidget, size: QSize = QSize(0, 0)):
         super().__init__(parent)
         self._size = size
-        self._anim = ZExpPropertyAnimation(self, "size")
-        self._anim.setBias(1)
-        self._anim.setFactor(0.2)
-
-    @property
-    def animation(self) -> ZExpPropertyAnimation: return self._anim
 
     def getSize(self) -> QSize: return self._size
 
     def setSize(self, size: QSize) -> None:
         self._size = size
-        self.parent().update()
+        ZAnimationDriver().markDirty(self.parent())
 
     size: QSize = cast(QSize, Property(QSize, getSize, setSize, notify=ABCAnimatedSize.sizeChanged))
\ No newline at end of file
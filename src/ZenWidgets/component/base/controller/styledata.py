@@ -1,17 +1,19 @@
-import copy
+import weakref
+from time import perf_counter
 from typing import Dict,Generic
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import QObject, Signal,Slot
+from PySide6.QtCore import QObject, QTimer, Signal,Slot
 from PySide6.QtGui import QColor
-from ZenWidgets.core import ZGlobal
-from ZenWidgets.gui import StyleDataT,ZStyleDataKey
+from ZenWidgets.core import ZGlobal,isWidgetHidden
+from ZenWidgets.core.utils import Singleton
+from ZenWidgets.gui import StyleDataT,ZStyleDataKey,ZStyleDataFactory
 
-__all__ = ['ZStyleController']
+__all__ = ['ZStyleController', 'ZStyleDispatcher']
 
 class ZStyleController(QObject, Generic[StyleDataT]):
     '''样式管理器
     - 决定控件的当前样式
-    - 存储自定义样式数据
+    - 存储自定义样式数据：完整替换的记录与逐字段的覆盖（写时复制，只保存差异）
     '''
     styleChanged = Signal()
     def __init__(self, parent: QWidget, key: str=''):
@@ -20,8 +22,12 @@ class ZStyleController(QObject, Generic[StyleDataT]):
         self._key: str = key
         self._data: StyleDataT = None
         self._custom_data: Dict[str, StyleDataT] = {'Light': None, 'Dark': None}
+        self._custom_delta: Dict[str, Dict[str, QColor]] = {'Light': {}, 'Dark': {}}
+        # 主题切换由调度器统一分发，不再每个控制器单独连接主题信号
+        # 先取得调度器：首次创建时可能同步系统主题，之后再读取样式数据
+        dispatcher = ZStyleDispatcher()
         if key: self._data = ZGlobal.styleDataManager.getStyleData(key)
-        ZGlobal.themeManager.themeChanged.connect(self._theme_change_handler_)
+        dispatcher.register(self)
 
     @property
     def data(self) -> StyleDataT:return self._data
@@ -32,7 +38,7 @@ class ZStyleController(QObject, Generic[StyleDataT]):
         接收主题改变信号,更新样式数据的槽函数
         '''
         if self._custom:
-            self._data = self._custom_data[theme]
+            self._data = self._resolve_(theme)
         else:
             self._data = ZGlobal.styleDataManager.getStyleData(self._key)
         self.styleChanged.emit()
@@ -44,8 +50,10 @@ class ZStyleController(QObject, Generic[StyleDataT]):
         :param key: 样式数据键
         :param update: 是否立即更新样式数据
         '''
+        ZStyleDispatcher().unregister(self)
         self._key = key
         self._data = ZGlobal.styleDataManager.getStyleData(key)
+        ZStyleDispatcher().register(self)
         if update: self.styleChanged.emit()
 
 
@@ -58,10 +66,11 @@ class ZStyleController(QObject, Generic[StyleDataT]):
         '''
         if theme not in self._custom_data:
             raise ValueError(f"不支持的主题: {theme}，必须是 'Light' 或 'Dark'")
-        self._custom_data[theme] = data
+        self._custom_data[theme] = ZStyleDataFactory.intern(data)
+        self._custom_delta[theme] = {}
         self._custom = True
         if update and theme == ZGlobal.themeManager.getThemeName():
-            self._data = data
+            self._data = self._custom_data[theme]
             self.styleChanged.emit()
 
     def setCustomData(self, theme: str, data_key: ZStyleDataKey, value: QColor, /, update: bool = False) -> None:
@@ -74,25 +83,132 @@ class ZStyleController(QObject, Generic[StyleDataT]):
         '''
         if theme not in self._custom_data:
             raise ValueError(f"不支持的主题: {theme}，必须是 'Light' 或 'Dark'")
-        # 获取基础数据（优先用已有自定义数据，否则用默认数据）
-        base_data = self._custom_data[theme] if self._custom_data[theme] is not None else ZGlobal.styleDataManager.getStyleDataByTheme(self._key, theme)
-        new_data = copy.deepcopy(base_data)
-        if not hasattr(new_data, data_key.value):
+        base_data = self._base_data_(theme)
+        if data_key.value not in ZStyleDataFactory.fieldNames(type(base_data)):
             raise AttributeError(f"StyleDataT 没有字段: {data_key}")
-        setattr(new_data, data_key.value, value)
-        self._custom_data[theme] = new_data
+        # 只记录差异，样式数据在需要时由共享的基础记录与差异合成
+        self._custom_delta[theme][data_key.value] = ZStyleDataFactory.internColor(value)
         self._custom = True
         if update and theme == ZGlobal.themeManager.getThemeName():
-            self._data = new_data
+            self._data = self._resolve_(theme)
             self.styleChanged.emit()
 
+    def _base_data_(self, theme: str) -> StyleDataT:
+        '''基础数据：优先用完整替换的自定义数据，否则用默认数据'''
+        if self._custom_data[theme] is not None: return self._custom_data[theme]
+        return ZGlobal.styleDataManager.getStyleDataByTheme(self._key, theme)
+
+    def _resolve_(self, theme: str) -> StyleDataT:
+        return ZStyleDataFactory.replace(self._base_data_(theme), **self._custom_delta[theme])
+
     def setDefault(self):
         self._data = ZGlobal.styleDataManager.getStyleData(self._key)
         self.styleChanged.emit()
 
+    def key(self) -> str: return self._key
+
+    def isCustom(self) -> bool: return self._custom
+
     def parent(self) -> QWidget:
         return super().parent()
 
+
+# region ZStyleDispatcher
+@Singleton
+class ZStyleDispatcher(QObject):
+    '''
+    主题切换调度器
+
+    - 只有调度器连接主题改变信号，样式控制器按样式数据键分组登记
+    - 主题改变时每个键只取一次样式数据，所有控制器的数据立即更新
+    - `styleChanged` 按批发出：可见控件优先，每批不超过 `budget` 毫秒，批与批之间让出事件循环，
+      同一批启动的颜色动画在驱动器的下一帧一起打包推进
+    - 全部控制器处理完毕后发出一次 `themeApplied`
+    '''
+    themeApplied = Signal(str)
+    '''所有控制器都已收到新主题的样式数据后发出'''
+    def __init__(self):
+        super().__init__()
+        self._groups: dict[str, weakref.WeakSet[ZStyleController]] = {}
+        self._pending: list[ZStyleController] = []
+        self._theme: str = ''
+        self._budget: float = 8.0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._dispatch_)
+        ZGlobal.themeManager.themeChanged.connect(self._theme_change_handler_)
+        # 主题管理器通常在 QApplication 之前创建，系统主题的监听推迟到第一个控件创建时启动
+        ZGlobal.themeManager.startMonitoring()
+
+    # region public
+    def budget(self) -> float: return self._budget
+
+    def setBudget(self, budget: float) -> None:
+        '''设置每批分发样式改变的时间预算（毫秒）'''
+        self._budget = max(.0, budget)
+
+    def register(self, controller: ZStyleController) -> None:
+        group = self._groups.get(controller.key())
+        if group is None: group = self._groups[controller.key()] = weakref.WeakSet()
+        group.add(controller)
+
+    def unregister(self, controller: ZStyleController) -> None:
+        group = self._groups.get(controller.key())
+        if group is not None: group.discard(controller)
+
+    def controllerCount(self) -> int: return sum(len(group) for group in self._groups.values())
+
+    def pendingCount(self) -> int: return len(self._pending)
+
+    def isDispatching(self) -> bool: return bool(self._pending)
+
+    def flush(self) -> None:
+        '''立即分发所有尚未处理的样式改变'''
+        self._timer.stop()
+        pending, self._pending = self._pending, []
+        for controller in pending: self._emit_(controller)
+        if pending: self.themeApplied.emit(self._theme)
+
+    # region private
+    @Slot(str)
+    def _theme_change_handler_(self, theme: str) -> None:
+        self._timer.stop()
+        self._theme = theme
+        manager = ZGlobal.styleDataManager
+        visible: list[ZStyleController] = []
+        hidden: list[ZStyleController] = []
+        for key, group in self._groups.items():
+            data = manager.getStyleData(key) if key else None
+            for controller in tuple(group):
+                try:
+                    if controller.isCustom(): controller._data = controller._resolve_(theme)
+                    elif data is not None: controller._data = data
+                    (hidden if isWidgetHidden(controller.parent()) else visible).append(controller)
+                except RuntimeError:
+                    # 控制器已被销毁
+                    group.discard(controller)
+        self._pending = visible + hidden
+        self._pending.reverse()
+        self._dispatch_()
+
+    def _dispatch_(self) -> None:
+        deadline = perf_counter() + self._budget / 1000
+        pending = self._pending
+        while pending:
+            self._emit_(pending.pop())
+            if perf_counter() >= deadline: break
+        # 剩余的控制器在事件循环处理完绘制与输入事件后继续
+        if pending:
+            self._timer.start(0)
+        else:
+            self.themeApplied.emit(self._theme)
+
+    def _emit_(self, controller: ZStyleController) -> None:
+        try:
+            controller.styleChanged.emit()
+        except RuntimeError:
+            pass
+
 # import sys
 # from PySide6.QtWidgets import QApplication
 # from PySide6.QtGui import QColor
@@ -1,7 +1,7 @@
 from typing import overload,cast
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import QPropertyAnimation,QObject,Property,QEasingCurve,Signal
-from ZenWidgets.core import ZExpPropertyAnimation
+from ZenWidgets.core import ZExpPropertyAnimation,ZAnimationDriver
 
 __all__ = [
     'ABCAnimatedInt',
@@ -25,7 +25,7 @@ class ABCAnimatedInt(QObject):
 
     def setValue(self, value: int) -> None:
         self._value = max(self._min, min(self._max, value))
-        self.parent().update()
+        ZAnimationDriver().markDirty(self.parent())
 
     value: int = cast(int, Property(int, getValue, setValue, notify=valueChanged))
 
@@ -53,9 +53,10 @@ class ZAnimatedInt(ABCAnimatedInt):
     '''具有原生属性动画的整数控制器'''
     def __init__(self, parent: QWidget, value: int = 0):
         super().__init__(parent, value)
-        self._anim = QPropertyAnimation(self, b'value')
+        self._anim = QPropertyAnimation(self, b'value', self)
         self._anim.setDuration(150)
         self._anim.setEasingCurve(QEasingCurve.Type.Linear)
+        ZAnimationDriver().watch(self._anim)
 
     @property
     def animation(self) -> QPropertyAnimation: return self._anim
@@ -75,7 +76,7 @@ class ABCAnimatedFloat(QObject):
 
     def setValue(self, value: float) -> None:
         self._value = value
-        self.parent().update()
+        ZAnimationDriver().markDirty(self.parent())
 
     value: float = cast(float, Property(float, getValue, setValue, notify=valueChanged))
 
@@ -103,9 +104,10 @@ class ZAnimatedFloat(ABCAnimatedFloat):
     '''具有原生属性动画的浮点数控制器'''
     def __init__(self, parent: QWidget, value: int|float = .0):
         super().__init__(parent, value)
-        self._anim = QPropertyAnimation(self, b'value')
+        self._anim = QPropertyAnimation(self, b'value', self)
         self._anim.setDuration(150)
         self._anim.setEasingCurve(QEasingCurve.Type.Linear)
+        ZAnimationDriver().watch(self._anim)
 
     @property
     def animation(self) -> QPropertyAnimation: return self._anim
@@ -4,12 +4,39 @@ from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import Qt,QEvent,QPoint,QSize,Signal
 from PySide6.QtGui import QMouseEvent
 from ZenWidgets.component.base.controller import *
-from ZenWidgets.core import make_getter,ZState,ZStyle
+from ZenWidgets.core import ZState,ZStyle,ZAnimationDriver
 if TYPE_CHECKING:
     from ZenWidgets.component.layouts.layout import ZBoxLayout
 
 T = TypeVar('T')
 
+class ZLazyController:
+    '''
+    控制器描述符
+
+    首次访问时以控件为父对象创建控制器，并写入实例字典（同时保留 `_<name>` 属性），
+    之后的访问直接命中实例字典，不再经过描述符
+    '''
+    __slots__ = ('name', 'type', 'kwargs', 'is_style')
+    def __init__(self, ctrl_type: type, kwargs: dict[str, Any] | None = None, name: str = ''):
+        self.name: str = name
+        self.type: type = ctrl_type
+        self.kwargs: dict[str, Any] = kwargs or {}
+        self.is_style: bool = issubclass(get_origin(ctrl_type) or ctrl_type, ZStyleController)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Optional['ZWidget'], owner: type | None = None):
+        if instance is None: return self
+        controller = self.type(instance, **self.kwargs)
+        instance.__dict__[self.name] = controller
+        instance.__dict__[f'_{self.name}'] = controller
+        # 如果是样式控制器，则绑定样式改变时的槽函数
+        if self.is_style: cast(ZStyleController[T], controller).styleChanged.connect(instance._style_change_handler_)
+        return controller
+
+
 class ZPlaceHolderWidget(QWidget):
     '''占位组件'''
 
@@ -54,6 +81,11 @@ class ZWidget(QWidget):
     '''控制器类型'''
     __controllers_kwargs__: dict[str, Any] = {}
     '''控制器参数'''
+    windowOpacityCtrl: ZWindowOpacity = ZLazyController(ZWindowOpacity)
+    widgetSizeCtrl: ZWidgetSize = ZLazyController(ZWidgetSize)
+    widgetPositionCtrl: ZWidgetPosition = ZLazyController(ZWidgetPosition)
+    widgetRectCtrl: ZWidgetRect = ZLazyController(ZWidgetRect)
+    opacityCtrl: ZAnimatedOpacity = ZLazyController(ZAnimatedOpacity)
     dragged = Signal(QPoint)
     '''拖拽信号'''
     moved = Signal(QPoint)
@@ -81,62 +113,35 @@ class ZWidget(QWidget):
         self._move_anchor: QPoint = move_anchor
         self._draggable: bool = dragable
         self._drag_pos: QPoint | None = None
-        self._windowOpacityCtrl: ZWindowOpacity = ZWindowOpacity(self)
-        self._widgetSizeCtrl: ZWidgetSize = ZWidgetSize(self)
-        self._widgetPositionCtrl: ZWidgetPosition = ZWidgetPosition(self)
-        self._widgetRectCtrl: ZWidgetRect = ZWidgetRect(self)
-        self._opacityCtrl: ZAnimatedOpacity = ZAnimatedOpacity(self)
-        self._create_controllers_()
-
-    # region property
-    @property
-    def windowOpacityCtrl(self) -> ZWindowOpacity: return self._windowOpacityCtrl
-
-    @property
-    def widgetSizeCtrl(self) -> ZWidgetSize: return self._widgetSizeCtrl
 
-    @property
-    def widgetPositionCtrl(self) -> ZWidgetPosition: return self._widgetPositionCtrl
-
-    @property
-    def widgetRectCtrl(self) -> ZWidgetRect: return self._widgetRectCtrl
-
-    @property
-    def opacityCtrl(self) -> ZAnimatedOpacity: return self._opacityCtrl
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._resolve_controllers_()
 
     # region private method
-    def _create_controllers_(self) -> None:
-        '''创建控制器，不需要子类重写'''
-        allowed_types = self.__controllers_types__
+    @classmethod
+    def _resolve_controllers_(cls) -> None:
+        '''
+        解析控制器注解，在类定义时执行一次，不需要子类重写
+
+        控制器不会在构造时创建，而是以 `ZLazyController` 描述符的形式绑定到类上，首次访问时才创建
+        '''
+        allowed_types = cls.__controllers_types__
         controllers_kwargs: dict[str, Any] = {}
         annotations: dict[str, Any] = {}
         # 遍历类的继承链，从ZWidget类和其子类中获取注解和控制器参数，让子类的注解覆盖父类的注解
-        for cls in reversed(self.__class__.__mro__):
-            if not issubclass(cls, ZWidget): continue
-            controllers_kwargs.update(getattr(cls, '__controllers_kwargs__', {}))
-            annotations.update(getattr(cls, '__annotations__', {}))
+        for base in reversed(cls.__mro__):
+            if not issubclass(base, ZWidget): continue
+            controllers_kwargs.update(base.__dict__.get('__controllers_kwargs__', {}))
+            annotations.update(inspect.get_annotations(base))
 
-        # 过滤出属于控制器类型的注解
-        filtered_annotations: dict[str, Any] = {}
         for name, ctrl_type in annotations.items():
-            # 获取注解的实际类型
+            # 获取注解的实际类型，只处理属于控制器类型的注解
             origin_type = get_origin(ctrl_type) or ctrl_type
-            # 如果注解类型是控制器类型，则添加到过滤后的注解中
-            if inspect.isclass(origin_type) and issubclass(origin_type, allowed_types):
-                filtered_annotations[name] = ctrl_type
-
-        # 创建控制器实例并绑定到实例与类上（若需要则创建 property）
-        for name, ctrl_type in filtered_annotations.items():
-            ckwargs = controllers_kwargs.get(name, {})
-            controller = ctrl_type(self, **ckwargs)
-            # 创建实例变量
-            setattr(self, f'_{name}', controller)
-            # 创建类属性
-            if not hasattr(self.__class__, name): setattr(self.__class__, name, property(make_getter(name)))
-            # 如果是样式控制器，则绑定样式改变时的槽函数
-            if ctrl_type.__name__ == 'ZStyleController':
-                style_controller = cast(ZStyleController[T], controller)
-                style_controller.styleChanged.connect(self._style_change_handler_)
+            if not (inspect.isclass(origin_type) and issubclass(origin_type, allowed_types)): continue
+            # 类中显式定义的同名属性优先
+            if name in cls.__dict__ and not isinstance(cls.__dict__[name], ZLazyController): continue
+            setattr(cls, name, ZLazyController(ctrl_type, controllers_kwargs.get(name, {}), name))
 
     def _init_style_(self) -> None:
         '''初始化样式'''
@@ -173,13 +178,13 @@ class ZWidget(QWidget):
 
     def isDraggable(self) -> bool: return self._draggable
 
-    def isMoving(self) -> bool: return self.widgetPositionCtrl.animation.isRunning()
+    def isMoving(self) -> bool: return self.widgetPositionCtrl.isAnimating()
 
-    def isResizing(self) -> bool: return self.widgetSizeCtrl.animation.isRunning()
+    def isResizing(self) -> bool: return self.widgetSizeCtrl.isAnimating()
 
-    def isFading(self) -> bool: return self.opacityCtrl.animation.isRunning()
+    def isFading(self) -> bool: return self.opacityCtrl.isAnimating()
 
-    def isWindowFading(self) -> bool: return self.windowOpacityCtrl.animation.isRunning()
+    def isWindowFading(self) -> bool: return self.windowOpacityCtrl.isAnimating()
 
     def setDraggable(self, d: bool) -> None:
         if d == self._draggable: return
@@ -262,6 +267,16 @@ class ZWidget(QWidget):
         super().resizeEvent(event)
         self.resized.emit(self.size())
 
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # 隐藏后动画过程不可见，直接结束（父控件隐藏时子控件也会收到隐藏事件）
+        ZAnimationDriver().finishAnimations(self)
+
+    def changeEvent(self, event: QEvent):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and self.isWindow() and self.isMinimized():
+            ZAnimationDriver().finishAnimations(self, recursive=True)
+
     def mousePressEvent(self, event: QMouseEvent):
         super().mousePressEvent(event)
         if self._draggable and event.button() == Qt.MouseButton.LeftButton:
@@ -11,7 +11,7 @@ from ZenWidgets.component.base import (
     ZWidget,
     ZContentWidget
 )
-from ZenWidgets.core import ZDebug,ZPosition,ZPadding,ZMargin
+from ZenWidgets.core import ZDebug,ZPosition,ZPadding,ZMargin,ZAnimationDriver
 from ZenWidgets.gui import ZToolTipStyleData,ZWidgetEffect
 
 # region ZToolTip
@@ -56,8 +56,11 @@ class ZToolTip(ZWidget):
         self._show_cd = 33
         self._cd_timer = QElapsedTimer()
 
+        # 跟随动画驱动器的帧率，帧率被调节器降低时一同降低
+        driver = ZAnimationDriver()
         self._tracker_timer = QTimer()
-        self._tracker_timer.setInterval(int(1000/60))
+        self._tracker_timer.setInterval(driver.interval())
+        driver.fpsChanged.connect(self._on_fps_changed_)
         self._tracker_timer.timeout.connect(self._update_pos_for_tracker)
 
         self._show_timer = QTimer(singleShot=True, interval=1000)
@@ -86,6 +89,9 @@ class ZToolTip(ZWidget):
         self.bodyColorCtrl.setColorTo(data.Body)
         self.borderColorCtrl.setColorTo(data.Border)
 
+    def _on_fps_changed_(self, fps: int):
+        self._tracker_timer.setInterval(int(1000/fps))
+
     def _update_pos_for_tracker(self):
         self.widgetPositionCtrl.moveFromTo(self.pos(), self._get_pos_should_be_move())
 
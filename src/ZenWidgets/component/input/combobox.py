@@ -410,8 +410,8 @@ class ZComboBox(ABCButton):
         self._options_view = ZComboBoxView(self, self._options.keys())
         self._options_view.selected.connect(self._select_handler_)
 
-        self.dropIconPosCtrl.animation.setBias(0.1)
-        self.dropIconPosCtrl.animation.setFactor(0.2)
+        self.dropIconPosCtrl.setAnimationBias(0.1)
+        self.dropIconPosCtrl.setAnimationFactor(0.2)
         self._init_style_()
         self.resize(self.sizeHint())
         self.dropIconPosCtrl.setPos(self._get_drop_icon_pos())
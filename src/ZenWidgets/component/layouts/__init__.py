@@ -3,5 +3,6 @@ from .container import *
 from .stackcontainer import *
 from .densecontainer import *
 from .flowcontainer import *
+from .masonryview import *
 from .panel import ZPanel
-from .scrollpanel import ZScrollPanel
\ No newline at end of file
+from .scrollpanel import ZScrollPanel, ABCScrollDelegate
\ No newline at end of file
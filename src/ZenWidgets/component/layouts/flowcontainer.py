@@ -1,4 +1,7 @@
+import heapq
 import random
+from bisect import bisect_right
+from collections.abc import Iterable
 from PySide6.QtWidgets import QWidget,QSizePolicy
 from PySide6.QtCore import QTimer,QPoint,QRectF,QSize
 from PySide6.QtGui import QPainter
@@ -13,18 +16,34 @@ __all__ = [
 
 # region ABCFlowContainer
 class ABCFlowContainer(QWidget):
+    '''
+    流式容器的抽象类
+
+    - 子控件的尺寸在首次排列时读取并缓存，`ZWidget` 子控件调整大小后自动失效，
+      其他情况下尺寸提示改变时调用 `invalidate`
+    - 记录第一个位置失效的控件索引，子类只需从该位置开始重新排列
+    - `beginBatch` 与 `endBatch` 之间的排列请求推迟到批次结束时执行一次
+    - 外部直接调用 `arrangeWidgets` 时重新读取所有控件的尺寸，并把所有控件放回各自的位置
+    '''
     def __init__(self, parent: ZWidget | None = None):
         super().__init__(parent,sizePolicy=QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.MinimumExpanding))
         self._widgets:list[ZWidget] = []
         self._dragging_widget:ZWidget = None
         self._margin = ZMargin(8, 8, 8, 8)
         self._spacing = [8, 8]
+        self._sizes: dict[ZWidget, QSize] = {}
+        self._stale: set[ZWidget] = set()
+        self._dirty_from: int = 0
+        self._batch_depth: int = 0
+        self._batch_arrange: dict | None = None
+        self._arrange_requested: bool = False
 
     def setSpacing(self, horizontal=None, vertical=None):
         if horizontal is not None:
             self._spacing[0] = horizontal
         if vertical is not None:
             self._spacing[1] = vertical
+        self._invalidate_(0)
 
     def widgets(self):
         return self._widgets
@@ -33,8 +52,42 @@ class ABCFlowContainer(QWidget):
         """ Add widget to this container """
         widget.setParent(self)
         self._widgets.append(widget)
+        self._invalidate_(len(self._widgets) - 1)
+        if isinstance(widget, ZWidget): widget.resized.connect(self._on_child_resized_)
         if arrange:
-            self.arrangeWidgets(ani=ani)
+            self._request_arrange_(ani=ani)
+
+    def addWidgets(self, widgets: Iterable[ZWidget], arrange=True, ani=True):
+        """ Add widgets to this container and arrange them once """
+        self.beginBatch()
+        try:
+            for widget in widgets: self.addWidget(widget, arrange, ani)
+        finally:
+            self.endBatch()
+
+    def beginBatch(self):
+        '''开始批量修改，排列推迟到对应的 `endBatch` ，可以嵌套'''
+        self._batch_depth += 1
+
+    def endBatch(self):
+        '''结束批量修改，最外层批次结束时执行批次中请求过的排列'''
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if self._batch_depth == 0 and self._batch_arrange is not None:
+            kwargs, self._batch_arrange = self._batch_arrange, None
+            self._request_arrange_(**kwargs)
+
+    def invalidate(self, widget: ZWidget | None = None):
+        '''
+        丢弃缓存的控件尺寸，下次排列时重新读取
+
+        :param widget: 尺寸提示改变的控件，为 None 时丢弃所有控件的尺寸
+        '''
+        if widget is None:
+            self._sizes.clear()
+            self._invalidate_(0)
+        else:
+            self._sizes.pop(widget, None)
+            self._stale.add(widget)
 
     def removeWidget(self, widget:ZWidget,
                      has_existence_check: bool = True,
@@ -42,7 +95,12 @@ class ABCFlowContainer(QWidget):
                      fade_out: bool = False,
                      fade_out_delay: int = 0):
         if widget in self._widgets:
-            self._widgets.pop(self._widgets.index(widget))
+            index = self._widgets.index(widget)
+            self._widgets.pop(index)
+            self._invalidate_(index)
+            self._sizes.pop(widget, None)
+            self._stale.discard(widget)
+            if isinstance(widget, ZWidget): widget.resized.disconnect(self._on_child_resized_)
 
             if fade_out:
                 widget.fadeOut()
@@ -63,26 +121,23 @@ class ABCFlowContainer(QWidget):
 
     def shuffle(self, **kwargs):
         random.shuffle(self._widgets)
-        self.arrangeWidgets(**kwargs)
+        self._invalidate_(0)
+        self._request_arrange_(**kwargs)
 
     def swapByIndex(self, from_index, to_index):
         widget_a = self.widgets()[from_index]
         widget_b = self.widgets()[to_index]
         self._widgets[from_index] = widget_b
         self._widgets[to_index] = widget_a
-        self.arrangeWidgets()
+        self._invalidate_(min(from_index, to_index))
+        self._request_arrange_()
 
     def insertToByIndex(self, from_index, to_index, **kwargs):
-        widget = self.widgets()[from_index]
-        self._widgets[from_index] = None
-
-        if from_index > to_index:
-            self._widgets = self._widgets[:to_index] + [widget] + self._widgets[to_index:]
-        else:
-            self._widgets = self._widgets[:to_index + 1] + [widget] + self._widgets[to_index + 1:]
-
-        self._widgets.pop(self._widgets.index(None))
-        self.arrangeWidgets(**kwargs)
+        # 移除后插入到 to_index ，向前或向后移动时控件都落在 to_index 处
+        widget = self._widgets.pop(from_index)
+        self._widgets.insert(to_index, widget)
+        self._invalidate_(min(from_index, to_index))
+        self._request_arrange_(**kwargs)
 
     def regDraggableWidget(self, widget: ZWidget):
         def on_dragging(delta: QPoint):
@@ -115,11 +170,13 @@ class ABCFlowContainer(QWidget):
 
     def mouseReleaseEvent(self, event):
         if self._dragging_widget:
+            # 拖拽中的控件由鼠标移动，松开后需要回到它的位置
+            self._invalidate_(self._widgets.index(self._dragging_widget))
             self._dragging_widget = None
-            self.arrangeWidgets()
+            self._request_arrange_()
 
     def resizeEvent(self, event):
-        self.arrangeWidgets()
+        self._request_arrange_()
 
 
     def paintEvent(self, event):
@@ -129,20 +186,77 @@ class ABCFlowContainer(QWidget):
         if ZDebug.draw_rect: ZDebug.drawRect(painter, rect)
         event.accept()
 
+    # region private
+    def _size_of_(self, widget: ZWidget) -> QSize:
+        size = self._sizes.get(widget)
+        if size is None:
+            size = widget.sizeHint()
+            if size == QSize(-1, -1): size = widget.size()
+            self._sizes[widget] = size
+        return size
+
+    def _invalidate_(self, index: int):
+        self._dirty_from = min(self._dirty_from, index)
+
+    def _take_dirty_(self) -> int:
+        '''返回第一个位置失效的控件索引，并把所有控件标记为已排列'''
+        if self._stale:
+            for index, widget in enumerate(self._widgets):
+                if widget in self._stale:
+                    self._invalidate_(index)
+                    break
+            self._stale.clear()
+        dirty_from, self._dirty_from = self._dirty_from, len(self._widgets)
+        return dirty_from
+
+    def _request_arrange_(self, **kwargs):
+        '''内部触发的排列，只处理失效的部分'''
+        if self._batch_depth:
+            self._batch_arrange = kwargs
+            return
+        self._arrange_requested = True
+        try:
+            self.arrangeWidgets(**kwargs)
+        finally:
+            self._arrange_requested = False
+
+    def _refresh_sizes_(self):
+        '''重新读取已缓存的控件尺寸，尺寸改变的控件标记为失效；隐藏的控件调整大小时不会发出 resized'''
+        for widget, size in list(self._sizes.items()):
+            self._sizes.pop(widget)
+            if self._size_of_(widget) != size: self._stale.add(widget)
+
+    def _on_child_resized_(self, size: QSize):
+        widget = self.sender()
+        if widget not in self._sizes: return
+        self._sizes.pop(widget)
+        self._stale.add(widget)
+
 # region ZFlowContainer
 class ZFlowContainer(ABCFlowContainer):
+    '''
+    流式容器，控件从左到右排列，放不下时换行
+
+    - 记录每个控件的位置与每行第一个控件的索引，排列时从第一个失效控件所在行的前一行开始，
+      之前的行保持不变：逐个添加控件时每次只排列最后一行
+    - 宽度不变时调整高度不会重新排列
+    '''
     def __init__(self, parent: ZWidget | None = None):
         super().__init__(parent)
         self._line_height = 32
         self._preferred_height = 0
+        self._positions: list[tuple[int, int]] = []
+        self._line_starts: list[int] = []
+        self._arranged_width: int | None = None
 
     def adjustSize(self):
         self.resize(self.width(), self._preferred_height)
 
     def setLineHeight(self, height, rearrange=True):
         self._line_height = height
+        self._invalidate_(0)
         if rearrange:
-            self.arrangeWidgets(ani=True)
+            self._request_arrange_(ani=True)
 
     def arrangeWidgets(self,
                        ani: bool = True,
@@ -151,35 +265,66 @@ class ZFlowContainer(ABCFlowContainer):
                        fade_in_delay_cumulate_rate: int = 10,
                        no_arrange_exceptions: list[ZWidget]|None = None,
                        no_ani_exceptions: list[ZWidget]|None = None):
+        no_arrange_exceptions = set(no_arrange_exceptions or ())
+        no_ani_exceptions = set(no_ani_exceptions or ())
+        if all_fade_in:
+            for widget in self._widgets:
+                if widget not in no_ani_exceptions: widget.fadeIn()
+
+        explicit = not self._arrange_requested
+        if explicit: self._refresh_sizes_()
+        if self.width() != self._arranged_width:
+            self._arranged_width = self.width()
+            self._invalidate_(0)
+        count = len(self._widgets)
+        start = self._take_dirty_()
+        if start >= count and len(self._positions) == count:
+            if not explicit: return
+            start = count
+
+        # 换行与否取决于之前的控件，失效控件所在行的第一个控件也可能并入前一行，因此从前一行开始
+        line = bisect_right(self._line_starts, start) - 2
+        if line > 0:
+            index = self._line_starts[line]
+            used_height = self._positions[index][1]
+            del self._line_starts[line + 1:]
+        else:
+            index = 0
+            used_height = self._margin.top
+            self._line_starts = [0]
         used_width = self._margin.left
-        used_height = self._margin.top
-        delay_counter = 0
-        if no_arrange_exceptions is None:
-            no_arrange_exceptions = []
-        if no_ani_exceptions is None:
-            no_ani_exceptions = []
-
-        for widget in self._widgets:
-            available_width = self.width() - self._margin.left - self._margin.right
-            size = widget.sizeHint()
-            if size == QSize(-1, -1): size = widget.size()
-            if available_width - (used_width - self._margin.left) - self._spacing[0] < size.width():
+        resumed = index > 0
+        del self._positions[index:]
+        if explicit:
+            # 之前的行位置不变，但控件可能仍在动画中或被手动移动过，放回各自的位置
+            for i in range(index):
+                widget = self._widgets[i]
+                if widget in no_arrange_exceptions: continue
+                if (not ani) or (widget in no_ani_exceptions): widget.move(*self._positions[i])
+                else: widget.moveTo(*self._positions[i])
+
+        available_width = self.width() - self._margin.left - self._margin.right
+        for i in range(index, count):
+            widget = self._widgets[i]
+            size = self._size_of_(widget)
+            if resumed:
+                # 继续排列的行首控件已经确定换行
+                resumed = False
+            elif available_width - (used_width - self._margin.left) - self._spacing[0] < size.width():
                 used_height += self._spacing[1] + self._line_height
                 used_width = self._margin.left
+                if self._line_starts[-1] != i: self._line_starts.append(i)
+            self._positions.append((used_width, used_height))
 
-            if all_fade_in and (widget not in no_ani_exceptions):
-                widget.fadeIn()
-            delay_counter += fade_in_delay_cumulate_rate
-
-            if (not ani) or (widget in no_ani_exceptions):
-                if (widget in no_arrange_exceptions) is False:
+            if widget not in no_arrange_exceptions:
+                if (not ani) or (widget in no_ani_exceptions):
                     widget.move(used_width, used_height)
-            else:
-                if (widget in no_arrange_exceptions) is False:
+                else:
                     widget.moveTo(used_width, used_height)
 
             used_width += size.width() + self._spacing[0]
 
+        used_height = self._positions[-1][1] if self._positions else self._margin.top
         self._preferred_height = used_height + self._line_height + self._margin.bottom
         self.adjustSize()
 
@@ -208,24 +353,25 @@ class ZMasonryContainer(ABCFlowContainer):
                        adjust_size: bool = True):
         columns = max(1, int(self._columns))
         used_height = [self._margin.top for _ in range(columns)]
-        if no_arrange_exceptions is None:
-            no_arrange_exceptions = []
-        if no_ani_exceptions is None:
-            no_ani_exceptions = []
+        # 按 (已用高度, 列索引) 组成的堆选择最短的列，高度相同时取左侧的列
+        heap = [(height, i) for i, height in enumerate(used_height)]
+        no_arrange_exceptions = set(no_arrange_exceptions or ())
+        no_ani_exceptions = set(no_ani_exceptions or ())
 
+        if not self._arrange_requested: self._refresh_sizes_()
+        self._take_dirty_()
         for widget in self._widgets:
-            column_index = int(min(range(columns), key=lambda i: used_height[i]))
+            y, column_index = heap[0]
 
             if widget not in no_arrange_exceptions:
                 x = self._margin.left + column_index * (self._column_width + self._spacing[0])
-                y = used_height[column_index]
                 if ani and (widget not in no_ani_exceptions):
                     widget.moveTo(x, y)
                 else:
                     widget.move(x, y)
-            size = widget.sizeHint()
-            if size == QSize(-1, -1): size = widget.size()
+            size = self._size_of_(widget)
             used_height[column_index] += size.height() + self._spacing[1]
+            heapq.heapreplace(heap, (used_height[column_index], column_index))
 
         self._preferred_height = max(max(used_height) - self._spacing[1], 0) + self._margin.bottom
         if adjust_size:
@@ -0,0 +1,279 @@
+import heapq
+from bisect import bisect_right
+from PySide6.QtWidgets import QWidget, QSizePolicy
+from PySide6.QtCore import QObject, QEvent, QPoint, QRect, QRectF, QSize, Signal
+from PySide6.QtGui import QPainter
+from ZenWidgets.core import ZDebug, ZMargin
+from .scrollpanel import ZScrollPanel
+
+__all__ = [
+    "ABCMasonrySource",
+    "ZMasonryView",
+]
+
+# region ABCMasonrySource
+class ABCMasonrySource(QObject):
+    '''
+    瀑布流视图的数据来源
+
+    - `count` 与 `itemHeight` 决定布局，只在数据改变或列宽改变时调用
+    - 视图只为可见区域内的条目准备图块：`createTile` 创建新图块，`bindTile` 把条目数据绑定到图块，
+      图块离开可见区域后被回收，之后可能绑定到其他条目
+    - 数据整体改变后发出 `reset` ，在末尾追加条目后发出 `appended` ，视图只为新条目计算位置
+    '''
+    reset = Signal()
+    appended = Signal(int)
+    '''追加的条目数量'''
+    def count(self) -> int: raise NotImplementedError
+
+    def itemHeight(self, index: int, width: int) -> int:
+        '''条目在给定列宽下的高度，例如按图片的宽高比计算'''
+        raise NotImplementedError
+
+    def createTile(self, parent: QWidget) -> QWidget: raise NotImplementedError
+
+    def bindTile(self, tile: QWidget, index: int) -> None: raise NotImplementedError
+
+    def unbindTile(self, tile: QWidget, index: int) -> None:
+        '''图块被回收时调用，可以在这里释放图片等资源'''
+
+
+# region ZMasonryView
+class ZMasonryView(QWidget):
+    '''
+    由数据来源驱动的瀑布流视图
+
+    - 条目的位置由 `ABCMasonrySource` 提供的高度计算，按 (列底部, 列索引) 组成的堆放入最短的列，
+      计算 N 个条目的复杂度为 O(N log C)
+    - 只为外层 `ZScrollPanel` 视口内（加上 `overscan` ）的条目绑定图块，离开视口的图块隐藏后回收，
+      滚动时每列二分查找可见条目，开销与条目总数无关
+    - 不在 `ZScrollPanel` 中时以自身的可见区域为准
+    '''
+    def __init__(self, parent: QWidget | None = None, source: ABCMasonrySource | None = None):
+        super().__init__(parent, sizePolicy=QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed))
+        self._source: ABCMasonrySource | None = None
+        self._margin = ZMargin(8, 8, 8, 8)
+        self._spacing = [8, 8]
+        self._columns: int = 2
+        self._column_width: int = 160
+        self._auto_adjust_column_amount: bool = False
+        self._overscan: int = 200
+        # 每个条目的列与位置
+        self._item_columns: list[int] = []
+        self._item_ys: list[int] = []
+        self._item_heights: list[int] = []
+        # 每列依次排列的条目及其底部，用于二分查找可见条目
+        self._column_items: list[list[int]] = []
+        self._column_bottoms: list[list[int]] = []
+        self._heap: list[tuple[int, int]] = []
+        self._preferred_height: int = 0
+        self._tiles: dict[int, QWidget] = {}
+        self._pool: list[QWidget] = []
+        self._panel: ZScrollPanel | None = None
+        if source is not None: self.setSource(source)
+
+    # region public
+    def source(self) -> ABCMasonrySource | None: return self._source
+
+    def setSource(self, source: ABCMasonrySource | None):
+        if self._source is not None:
+            self._source.reset.disconnect(self.relayout)
+            self._source.appended.disconnect(self._on_appended_)
+            self._clear_tiles_(recycle=False)
+        self._source = source
+        if source is not None:
+            source.reset.connect(self.relayout)
+            source.appended.connect(self._on_appended_)
+        self.relayout()
+
+    def setSpacing(self, horizontal=None, vertical=None):
+        if horizontal is not None:
+            self._spacing[0] = horizontal
+        if vertical is not None:
+            self._spacing[1] = vertical
+        self.relayout()
+
+    def setColumns(self, n: int):
+        self._columns = max(1, n)
+        self.relayout()
+
+    def columns(self) -> int: return self._columns
+
+    def setColumnWidth(self, width: int):
+        self._column_width = max(1, width)
+        self.relayout()
+
+    def columnWidth(self) -> int: return self._column_width
+
+    def setAutoAdjustColumnAmount(self, state: bool):
+        self._auto_adjust_column_amount = state
+        if state: self.adjustColumnAmount()
+
+    def calculateColumnAmount(self, width):
+        if self._column_width + self._spacing[0] <= 0:
+            return 1
+        return max(1, (width + self._spacing[0]) // (self._column_width + self._spacing[0]))
+
+    def adjustColumnAmount(self):
+        available_width = self.width() - self._margin.left - self._margin.right
+        columns = self.calculateColumnAmount(available_width)
+        if columns != self._columns: self.setColumns(columns)
+
+    def setOverscan(self, pixels: int):
+        '''设置视口上下额外准备图块的范围（像素）'''
+        self._overscan = max(0, pixels)
+        self.updateTiles()
+
+    def count(self) -> int: return len(self._item_ys)
+
+    def itemRect(self, index: int) -> QRect:
+        '''条目在视图中的位置'''
+        x = self._margin.left + self._item_columns[index] * (self._column_width + self._spacing[0])
+        return QRect(x, self._item_ys[index], self._column_width, self._item_heights[index])
+
+    def indexAt(self, pos: QPoint) -> int:
+        '''位置处的条目索引，没有条目时返回 -1'''
+        column, offset = divmod(pos.x() - self._margin.left, self._column_width + self._spacing[0])
+        if pos.x() < self._margin.left or not 0 <= column < len(self._column_items) or offset >= self._column_width: return -1
+        i = bisect_right(self._column_bottoms[column], pos.y())
+        if i >= len(self._column_items[column]): return -1
+        index = self._column_items[column][i]
+        return index if self._item_ys[index] <= pos.y() else -1
+
+    def tile(self, index: int) -> QWidget | None:
+        '''条目当前绑定的图块，条目不在可见区域时返回 None'''
+        return self._tiles.get(index)
+
+    def visibleIndexes(self) -> list[int]:
+        '''已绑定图块的条目，按索引排序'''
+        return sorted(self._tiles)
+
+    def relayout(self):
+        '''重新计算所有条目的位置，并重新绑定可见图块'''
+        self._clear_tiles_()
+        columns = max(1, int(self._columns))
+        self._item_columns, self._item_ys, self._item_heights = [], [], []
+        self._column_items = [[] for _ in range(columns)]
+        self._column_bottoms = [[] for _ in range(columns)]
+        self._heap = [(self._margin.top, i) for i in range(columns)]
+        self._place_(0)
+
+    def updateTiles(self):
+        '''按当前的可见区域绑定、回收图块，滚动或视口大小改变时自动调用'''
+        if self._source is None or not self.isVisible(): return
+        top, bottom = self._visible_range_()
+        visible = set()
+        if bottom > top:
+            for items, bottoms in zip(self._column_items, self._column_bottoms):
+                for i in range(bisect_right(bottoms, top), len(items)):
+                    index = items[i]
+                    if self._item_ys[index] >= bottom: break
+                    visible.add(index)
+        for index in [index for index in self._tiles if index not in visible]:
+            tile = self._tiles.pop(index)
+            tile.hide()
+            self._source.unbindTile(tile, index)
+            self._pool.append(tile)
+        for index in visible:
+            if index in self._tiles: continue
+            tile = self._pool.pop() if self._pool else self._source.createTile(self)
+            self._source.bindTile(tile, index)
+            tile.setGeometry(self.itemRect(index))
+            tile.show()
+            self._tiles[index] = tile
+
+    def sizeHint(self) -> QSize:
+        return QSize(self._margin.left + self._margin.right + self._columns * (self._column_width + self._spacing[0]) - self._spacing[0],
+                     self._preferred_height)
+
+    # region event
+    def event(self, event: QEvent):
+        if event.type() == QEvent.Type.ParentChange: self._attach_panel_()
+        return super().event(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._attach_panel_()
+        self.updateTiles()
+
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        self.updateTiles()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._auto_adjust_column_amount and event.size().width() != event.oldSize().width():
+            self.adjustColumnAmount()
+        self.updateTiles()
+
+    def paintEvent(self, event):
+        if ZDebug.draw_rect:
+            painter = QPainter(self)
+            ZDebug.drawRect(painter, QRectF(self.rect()))
+        event.accept()
+
+    # region private
+    def _place_(self, start: int):
+        '''为 start 之后的条目计算位置，之前的条目保持不变'''
+        count = self._source.count() if self._source is not None else 0
+        heap, width, spacing = self._heap, self._column_width, self._spacing[1]
+        for index in range(start, count):
+            y, column = heap[0]
+            height = max(0, int(self._source.itemHeight(index, width)))
+            self._item_columns.append(column)
+            self._item_ys.append(y)
+            self._item_heights.append(height)
+            self._column_items[column].append(index)
+            self._column_bottoms[column].append(y + height)
+            heapq.heapreplace(heap, (y + height + spacing, column))
+        bottom = max(used for used, _ in heap) - spacing if self._item_ys else self._margin.top
+        self._preferred_height = max(bottom, 0) + self._margin.bottom
+        self._adjust_height_()
+        self.updateTiles()
+
+    def _adjust_height_(self):
+        if self.height() == self._preferred_height and self.minimumHeight() == self._preferred_height: return
+        self.setMinimumHeight(self._preferred_height)
+        self.resize(self.width(), self._preferred_height)
+        self.updateGeometry()
+        # 滚动面板只在自身大小改变时调整内容区域，视图高度改变后需要通知它
+        self._attach_panel_()
+        if self._panel is not None: self._panel.updateContentSize()
+
+    def _visible_range_(self) -> tuple[int, int]:
+        if self._panel is not None:
+            top = -self.mapTo(self._panel, QPoint(0, 0)).y()
+            bottom = top + self._panel.height()
+        else:
+            rect = self.visibleRegion().boundingRect()
+            top, bottom = rect.top(), rect.bottom() + 1
+        return max(0, top - self._overscan), min(self.height(), bottom + self._overscan)
+
+    def _attach_panel_(self):
+        panel = self.parentWidget()
+        while panel is not None and not isinstance(panel, ZScrollPanel): panel = panel.parentWidget()
+        if panel is self._panel: return
+        if self._panel is not None:
+            self._panel.content().moved.disconnect(self._on_viewport_changed_)
+            self._panel.resized.disconnect(self._on_viewport_changed_)
+        self._panel = panel
+        if panel is not None:
+            panel.content().moved.connect(self._on_viewport_changed_)
+            panel.resized.connect(self._on_viewport_changed_)
+
+    def _clear_tiles_(self, recycle: bool = True):
+        for index, tile in self._tiles.items():
+            tile.hide()
+            if self._source is not None: self._source.unbindTile(tile, index)
+            if recycle: self._pool.append(tile)
+            else: tile.deleteLater()
+        self._tiles.clear()
+        if not recycle:
+            for tile in self._pool: tile.deleteLater()
+            self._pool.clear()
+
+    def _on_appended_(self, count: int):
+        self._place_(len(self._item_ys))
+
+    def _on_viewport_changed_(self, *args):
+        self.updateTiles()
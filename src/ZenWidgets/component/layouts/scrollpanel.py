@@ -1,6 +1,6 @@
-from PySide6.QtWidgets import *
-from PySide6.QtCore import *
-from PySide6.QtGui import *
+from PySide6.QtWidgets import QLayout,QSizePolicy,QWidget
+from PySide6.QtCore import Qt,Property,QAbstractAnimation,QObject,QPoint,QPointF,QRect,QRectF,QTimer,Signal
+from PySide6.QtGui import QColor,QMouseEvent,QPainter,QPainterPath,QPen,QPixmap,QRegion,QWheelEvent
 from ZenWidgets.component.base import (
     ZAnimatedColor,
     ZAnimatedFloat,
@@ -11,12 +11,166 @@ from ZenWidgets.component.base import (
 from ZenWidgets.core import (
     ZGlobal,
     ZDebug,
-    ZExpPropertyAnimation,
+    ZExpScalarAnimation,
+    ZKineticScroller,
     ZDirection,
     ZState
 )
 from ZenWidgets.gui import ZScrollPanelStyleData
 
+# region ABCScrollDelegate
+class ABCScrollDelegate(QObject):
+    '''
+    滚动面板虚拟模式的行数据来源
+
+    - `rowHeight` 返回固定行高；返回 None 时先用 `estimatedRowHeight` 占位，
+      行控件绑定后按其 `sizeHint` 修正
+    - 面板只为可见行（加上少量预留行）准备行控件：`createRow` 创建新控件，`bindRow` 把行数据绑定到控件，
+      控件离开可见区域后被回收，之后可能绑定到其他行
+    - 行数或所有行的数据改变后发出 `reset` ，部分行的数据改变后发出 `rowsChanged`
+    '''
+    reset = Signal()
+    rowsChanged = Signal(int, int)
+    '''数据改变的第一行与最后一行'''
+    def rowCount(self) -> int: raise NotImplementedError
+
+    def rowHeight(self, row: int) -> int | None: return None
+
+    def estimatedRowHeight(self) -> int: return 32
+
+    def createRow(self, parent: QWidget) -> QWidget: raise NotImplementedError
+
+    def bindRow(self, widget: QWidget, row: int) -> None: raise NotImplementedError
+
+    def unbindRow(self, widget: QWidget, row: int) -> None:
+        '''行控件被回收时调用'''
+
+
+# region _ZRowHeights
+class _ZRowHeights:
+    '''行高的树状数组，行偏移与按偏移查找行都是 O(log N)'''
+    def __init__(self, heights: list[int]):
+        n = len(heights)
+        tree = [0] + heights
+        for i in range(1, n + 1):
+            j = i + (i & -i)
+            if j <= n: tree[j] += tree[i]
+        self._tree = tree
+        self._heights = heights
+        self._top_bit = 1 << n.bit_length() if n else 0
+
+    def __len__(self) -> int: return len(self._heights)
+
+    def height(self, row: int) -> int: return self._heights[row]
+
+    def total(self) -> int: return self.offset(len(self._heights))
+
+    def offset(self, row: int) -> int:
+        '''第 row 行之前所有行的高度之和'''
+        result = 0
+        while row > 0:
+            result += self._tree[row]
+            row -= row & -row
+        return result
+
+    def setHeight(self, row: int, height: int) -> None:
+        delta = height - self._heights[row]
+        if delta == 0: return
+        self._heights[row] = height
+        i = row + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def rowAt(self, y: int) -> int:
+        '''包含偏移 y 的行，超出范围时返回第一行或最后一行'''
+        pos, step, n = 0, self._top_bit, len(self._heights)
+        while step:
+            if pos + step <= n and self._tree[pos + step] <= y:
+                pos += step
+                y -= self._tree[pos]
+            step >>= 1
+        return min(pos, n - 1)
+
+
+# region _ZScrollCache
+class _ZScrollCache(QWidget):
+    '''
+    滚动时覆盖在内容区域上的像素缓存
+
+    - 开始滚动时把视口内的背景与内容绘制到缓存中，之后每帧把已有像素按内容的位移平移，
+      只重新绘制新露出的条带，视口内其他子控件不再逐帧重绘
+    - 自身完全不透明（ `WA_OpaquePaintEvent` ），Qt 不会绘制被它覆盖的面板与内容
+    - 停止滚动后隐藏，由真实的内容完成最后一次绘制
+    '''
+    def __init__(self, panel: 'ZScrollPanel'):
+        super().__init__(panel)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self._panel = panel
+        self._pixmap: QPixmap | None = None
+        self._origin: QPoint = QPoint()
+        self._background: QColor = QColor()
+        self.hide()
+
+    def capture(self, background: QColor, radius: float):
+        '''按面板当前的状态重建缓存并显示'''
+        panel = self._panel
+        self._background = QColor(background)
+        # 留出面板的边框，圆角处用遮罩露出面板自身的绘制
+        self.setGeometry(panel.rect().adjusted(1, 1, -1, -1))
+        if radius > 1:
+            path = QPainterPath()
+            path.addRoundedRect(QRectF(self.rect()), radius, radius)
+            self.setMask(QRegion(path.toFillPolygon().toPolygon()))
+        else:
+            self.clearMask()
+        ratio = panel.devicePixelRatioF()
+        self._pixmap = QPixmap(self.size() * ratio)
+        self._pixmap.setDevicePixelRatio(ratio)
+        self._render_(self.rect())
+        self._origin = panel.content().pos()
+        self.show()
+        self.raise_()
+        for handle in (panel._handle_v, panel._handle_h): handle.raise_()
+
+    def release(self):
+        self.hide()
+        self._pixmap = None
+
+    def isActive(self) -> bool: return self._pixmap is not None
+
+    def paintEvent(self, event):
+        self._sync_()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        event.accept()
+
+    def _sync_(self):
+        '''按内容的位移平移缓存，并绘制新露出的区域'''
+        pos = self._panel.content().pos()
+        dx, dy = pos.x() - self._origin.x(), pos.y() - self._origin.y()
+        if dx == 0 and dy == 0: return
+        self._origin = pos
+        ratio = self._pixmap.devicePixelRatio()
+        if abs(dx) >= self.width() or abs(dy) >= self.height() or ratio != int(ratio):
+            self._render_(self.rect())
+            return
+        self._pixmap.scroll(int(dx * ratio), int(dy * ratio), self._pixmap.rect())
+        exposed = QRegion(self.rect()).subtracted(QRegion(self.rect().translated(dx, dy)))
+        for rect in exposed: self._render_(rect)
+
+    def _render_(self, rect: QRect):
+        content = self._panel.content()
+        painter = QPainter(self._pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(rect, self._background)
+        painter.end()
+        # rect 为缓存（即自身）坐标，换算到内容坐标后只绘制与其相交的子控件
+        source = rect.translated(self.pos() - content.pos())
+        content.render(self._pixmap, rect.topLeft(), QRegion(source), QWidget.RenderFlag.DrawChildren)
+
+
 # region ScrollHandle
 class ScrollHandle(ZWidget):
     bodyColorCtrl: ZAnimatedColor
@@ -31,8 +185,8 @@ class ScrollHandle(ZWidget):
         self._handle_width: int = 2
         self._handle_width_min: int = 2
         self._handle_width_max: int = 6
-        self._length_anim = ZExpPropertyAnimation(self, "handleLength")
-        self._width_anim = ZExpPropertyAnimation(self, "handleWidth")
+        self._length_anim = ZExpScalarAnimation(self, "handleLength")
+        self._width_anim = ZExpScalarAnimation(self, "handleWidth")
         self._width_anim.setBias(0.5)
         self._width_anim.setFactor(0.2)
         self._trans_timer = QTimer(self)
@@ -179,18 +333,150 @@ class ZScrollPanel(ZWidget):
         self._last_h_handle_len: float = 0.0
         self._handle_v = ScrollHandle(self,ZDirection.Vertical)
         self._handle_h = ScrollHandle(self,ZDirection.Horizontal)
+        self._scroller = ZKineticScroller(self)
+        self._scroller.offsetChanged.connect(self._on_scroll_offset_changed_)
+        self._wheel_step: int = 100
         self._content.resized.connect(self._update_handles_and_content)
+        self._scroll_cache = _ZScrollCache(self)
+        self._scroll_cache_enabled: bool = True
+        self._scroll_cache_timer = QTimer(self)
+        self._scroll_cache_timer.setSingleShot(True)
+        self._scroll_cache_timer.setInterval(60)
+        self._scroll_cache_timer.timeout.connect(self._on_scroll_settled_)
+        self._content.moved.connect(self._on_content_scrolled_)
+        self._content.resized.connect(self._drop_scroll_cache_)
+        self._delegate: ABCScrollDelegate | None = None
+        self._row_heights: _ZRowHeights | None = None
+        self._measured: set[int] = set()
+        self._rows: dict[int, QWidget] = {}
+        self._row_pool: list[QWidget] = []
+        self._overscan_rows: int = 2
+        self._scroll_row: int | None = None
+        self._scroll_y: int | None = None
+        self._updating_rows: bool = False
         self._init_style_()
 
     def content(self): return self._content
 
+    # region virtual
+    def delegate(self) -> ABCScrollDelegate | None: return self._delegate
+
+    def isVirtual(self) -> bool: return self._delegate is not None
+
+    def setDelegate(self, delegate: ABCScrollDelegate | None):
+        """设置行数据来源，开启虚拟模式
+
+        虚拟模式下内容区域的高度为所有行的高度之和，但只有可见行（加上 `overscan` 行）对应的控件存在，
+        滚动时回收离开视口的控件并绑定到新进入视口的行，开销与行数无关。
+        `scrollTo` 、滚轮与滚动条的行为与普通模式相同
+        Args:
+            delegate(ABCScrollDelegate): 行数据来源，为 None 时退出虚拟模式
+        """
+        if self._delegate is not None:
+            self._delegate.reset.disconnect(self.resetRows)
+            self._delegate.rowsChanged.disconnect(self._on_rows_changed_)
+            self._content.moved.disconnect(self._on_content_moved_)
+            self._clear_rows_(recycle=False)
+        self._delegate = delegate
+        if delegate is None:
+            self._row_heights = None
+            self.updateContentSize()
+            return
+        delegate.reset.connect(self.resetRows)
+        delegate.rowsChanged.connect(self._on_rows_changed_)
+        self._content.moved.connect(self._on_content_moved_)
+        self.resetRows()
+
+    def setOverscan(self, rows: int):
+        """设置视口上下额外准备的行数"""
+        self._overscan_rows = max(0, rows)
+        self.updateRows()
+
+    def rowCount(self) -> int: return len(self._row_heights) if self._row_heights is not None else 0
+
+    def rowRect(self, row: int) -> QRect:
+        """行在内容区域中的位置"""
+        return QRect(0, self._row_heights.offset(row), self._content.width(), self._row_heights.height(row))
+
+    def rowAt(self, y: int) -> int:
+        """内容区域中纵坐标 y 处的行，没有行时返回 -1"""
+        if not self.rowCount() or y < 0 or y >= self._row_heights.total(): return -1
+        return self._row_heights.rowAt(y)
+
+    def rowWidget(self, row: int) -> QWidget | None:
+        """行当前绑定的控件，行不在可见区域时返回 None"""
+        return self._rows.get(row)
+
+    def visibleRows(self) -> list[int]:
+        """已绑定控件的行，按行号排序"""
+        return sorted(self._rows)
+
+    def scrollToRow(self, row: int):
+        """滚动到指定行
+
+        途经的行被测量后估计的行高会被修正，滚动结束前目标位置随之重新计算
+        """
+        self.scrollTo(y=self._row_heights.offset(row))
+        self._scroll_row, self._scroll_y = row, None
+
+    def resetRows(self):
+        """按数据来源重新读取行数与行高，并重新绑定可见行"""
+        self._clear_rows_()
+        delegate = self._delegate
+        estimated = delegate.estimatedRowHeight()
+        heights = []
+        self._measured = set()
+        for row in range(delegate.rowCount()):
+            height = delegate.rowHeight(row)
+            heights.append(estimated if height is None else height)
+        self._row_heights = _ZRowHeights(heights)
+        self.updateContentSize()
+        self.updateRows()
+
+    def updateRows(self):
+        """按当前的滚动位置绑定、回收行控件，滚动时自动调用"""
+        if self._delegate is None or self._updating_rows: return
+        if not self.rowCount():
+            self._clear_rows_()
+            return
+        # 修正行高时可能移动内容区域，避免在其 moved 信号中重入
+        self._updating_rows = True
+        try:
+            self._update_rows_()
+        finally:
+            self._updating_rows = False
+
     # region public
+    def scroller(self) -> ZKineticScroller:
+        """驱动内容区域位置的滚动物理引擎，可以调整平滑系数与惯性摩擦"""
+        return self._scroller
+
+    def wheelStep(self) -> int: return self._wheel_step
+
+    def setWheelStep(self, pixels: int):
+        """设置鼠标滚轮每一格滚动的像素数，高精度滚轮按比例折算"""
+        self._wheel_step = max(1, pixels)
+
+    def isScrollCacheEnabled(self) -> bool: return self._scroll_cache_enabled
+
+    def setScrollCacheEnabled(self, enabled: bool):
+        """设置滚动时是否使用像素缓存
+
+        开启后滚动期间平移已经绘制的像素，只重绘新露出的条带；
+        面板背景不透明时才会使用，半透明背景下仍然逐帧重绘内容
+        """
+        self._scroll_cache_enabled = enabled
+        if not enabled: self._drop_scroll_cache_()
+
     def scrollTo(self, x: int = None, y: int = None):
         """滚动到指定位置
         Args:
             x(int): 水平滚动位置, None表示不改变
             y(int): 垂直滚动位置, None表示不改变
         """
+        self._scroll_row = None
+        # 虚拟列表中途经的行被测量后内容高度会变化，记录请求的位置以便重新计算目标
+        self._scroll_y = None if y is None else max(0, y)
         current_pos = self._content.pos()
         current_x, current_y = current_pos.x(), current_pos.y()
         if y is not None:
@@ -205,9 +491,19 @@ class ZScrollPanel(ZWidget):
                 current_x = -x
         final_x = int(current_x)
         final_y = int(current_y)
-        self._content.widgetPositionCtrl.moveTo(final_x, final_y)
-        self._sync_scroll_handles(final_x, final_y)
+        self._scroller.scrollTo(-final_x, -final_y)
+
 
+    def updateContentSize(self):
+        """按内容的尺寸提示与视口大小调整内容区域，内容的尺寸提示改变后调用"""
+        if self._row_heights is not None:
+            self._content.resize(self.width(), max(self._row_heights.total(), self.height()))
+            self._layout_rows_()
+            self._update_handles_and_content()
+            return
+        size_hint = self._content.sizeHint()
+        self._content.resize(max(size_hint.width(), self.width()), max(size_hint.height(), self.height()))
+        self._update_handles_and_content()
 
     def layout(self):
         return self._content.layout()
@@ -237,32 +533,117 @@ class ZScrollPanel(ZWidget):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        w, h = event.size().width(), event.size().height()
-        size_hint = self._content.sizeHint()
-        content_w = max(size_hint.width(), w)
-        content_h = max(size_hint.height(), h)
-        # 更新内容区域大小
-        self._content.resize(content_w, content_h)
-        self._update_handles_and_content()
+        self._drop_scroll_cache_()
+        self.updateContentSize()
 
 
     def wheelEvent(self, event: QWheelEvent):
-        current_x = -self._content.x()
-        current_y = -self._content.y()
         ZGlobal.tooltip.windowFadeOut()
-        if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
-            delta = event.angleDelta().x() if event.angleDelta().x() != 0 else event.angleDelta().y()
-            step = delta / 120 * 100
-            new_x = current_x - step
-            self.scrollTo(x=new_x, y=current_y)
+        self._scroll_row = self._scroll_y = None
+        horizontal = bool(event.modifiers() & Qt.KeyboardModifier.ShiftModifier)
+        pixel, angle, phase = event.pixelDelta(), event.angleDelta(), event.phase()
+        # 触摸板提供像素位移与手势阶段，手势的开始与结束事件可能不带位移
+        if not pixel.isNull() or phase in (Qt.ScrollPhase.ScrollBegin, Qt.ScrollPhase.ScrollEnd):
+            dx, dy = pixel.x(), pixel.y()
+            if horizontal and dx == 0: dx, dy = dy, 0
+            self._scroller.pixelScroll(-dx, -dy, phase)
         else:
-            delta = event.angleDelta().y()
-            step = delta / 120 * 100
-            new_y = current_y - step
-            self.scrollTo(x=current_x, y=new_y)
+            if horizontal: dx, dy = angle.x() if angle.x() != 0 else angle.y(), 0
+            else: dx, dy = 0, angle.y()
+            step = self._wheel_step / 120
+            self._scroller.scrollBy(-dx * step, -dy * step)
         event.accept()
 
     # region private
+    def _update_rows_(self):
+        top = -self._content.y()
+        anchor = self._row_heights.rowAt(top)
+        anchor_offset = self._row_heights.offset(anchor)
+        first = max(0, anchor - self._overscan_rows)
+        last = min(self.rowCount() - 1, self._row_heights.rowAt(top + self.height()) + self._overscan_rows)
+        for row in [row for row in self._rows if row < first or row > last]:
+            widget = self._rows.pop(row)
+            widget.hide()
+            self._delegate.unbindRow(widget, row)
+            self._row_pool.append(widget)
+        bound, resized = [], False
+        for row in range(first, last + 1):
+            if row in self._rows: continue
+            widget = self._row_pool.pop() if self._row_pool else self._delegate.createRow(self._content)
+            self._delegate.bindRow(widget, row)
+            self._rows[row] = widget
+            bound.append(widget)
+            resized |= self._measure_row_(row, widget)
+        if resized:
+            self._content.resize(self._content.width(), max(self._row_heights.total(), self.height()))
+            # 视口上方的行高度改变时同步调整滚动位置，保持可见内容不跳动
+            shift = self._row_heights.offset(anchor) - anchor_offset
+            if shift: self._scroller.adjust(0, shift)
+        if resized or bound: self._layout_rows_()
+        for widget in bound: widget.show()
+        if self._scroll_row is not None or self._scroll_y is not None: self._retarget_scroll_()
+
+    def _retarget_scroll_(self):
+        """行高被修正后重新计算 `scrollTo` 与 `scrollToRow` 的目标位置，到达目标后结束
+
+        修正视口上方的行高时 `adjust` 会同时平移目标，这里把目标恢复为请求的绝对位置
+        """
+        if self._scroll_row is not None:
+            if self._scroll_row >= self.rowCount():
+                self._scroll_row = None
+                return
+            requested = self._row_heights.offset(self._scroll_row)
+        else:
+            requested = self._scroll_y
+        target = min(requested, self._scroller.maximum().y())
+        if self._scroller.target().y() != target: self._scroller.scrollTo(y=target)
+        elif abs(self._scroller.offset().y() - target) < 1: self._scroll_row = self._scroll_y = None
+
+    def _measure_row_(self, row: int, widget: QWidget) -> bool:
+        """用控件的 sizeHint 修正估计的行高，返回行高是否改变"""
+        if row in self._measured or self._delegate.rowHeight(row) is not None: return False
+        self._measured.add(row)
+        height = widget.sizeHint().height()
+        if height <= 0 or height == self._row_heights.height(row): return False
+        self._row_heights.setHeight(row, height)
+        return True
+
+    def _layout_rows_(self):
+        width = self._content.width()
+        for row, widget in self._rows.items():
+            widget.setGeometry(0, self._row_heights.offset(row), width, self._row_heights.height(row))
+
+    def _clear_rows_(self, recycle: bool = True):
+        for row, widget in self._rows.items():
+            widget.hide()
+            if self._delegate is not None: self._delegate.unbindRow(widget, row)
+            if recycle: self._row_pool.append(widget)
+            else: widget.deleteLater()
+        self._rows.clear()
+        if not recycle:
+            for widget in self._row_pool: widget.deleteLater()
+            self._row_pool.clear()
+
+    def _on_rows_changed_(self, first: int, last: int):
+        for row in range(first, last + 1):
+            self._measured.discard(row)
+            height = self._delegate.rowHeight(row)
+            if height is not None: self._row_heights.setHeight(row, height)
+        for row in [row for row in self._rows if first <= row <= last]:
+            widget = self._rows.pop(row)
+            self._delegate.unbindRow(widget, row)
+            self._row_pool.append(widget)
+        self.updateContentSize()
+        self.updateRows()
+
+    def _on_content_moved_(self, pos: QPoint):
+        self.updateRows()
+
+    def _on_scroll_offset_changed_(self, offset: QPointF):
+        x, y = -round(offset.x()), -round(offset.y())
+        if self._content.x() != x or self._content.y() != y: self._content.move(x, y)
+        self._sync_scroll_handles(x, y)
+
     def _init_style_(self):
         self._update_handles_and_content()
         data = self.styleDataCtrl.data
@@ -273,7 +654,33 @@ class ZScrollPanel(ZWidget):
         self._handle_v.bodyColorCtrl.color = data.Handle
 
 
+    def _can_use_scroll_cache_(self) -> bool:
+        # 半透明背景下缓存无法完全不透明，切换主题时背景色仍在变化，这两种情况退回到逐帧重绘
+        return (self._scroll_cache_enabled and self.isVisible() and not self.size().isEmpty()
+                and self.bodyColorCtrl.color.alpha() == 255
+                and self.bodyColorCtrl.animation.state() != QAbstractAnimation.State.Running)
+
+    def _on_content_scrolled_(self, pos: QPoint):
+        if not self._scroll_cache.isActive():
+            if not self._can_use_scroll_cache_(): return
+            self._scroll_cache.capture(self.bodyColorCtrl.color, self.radiusCtrl.value)
+        else:
+            self._scroll_cache.update()
+        self._scroll_cache_timer.start()
+
+    def _on_scroll_settled_(self):
+        if self._scroller.isActive():
+            self._scroll_cache_timer.start()
+            return
+        self._drop_scroll_cache_()
+
+    def _drop_scroll_cache_(self, *args):
+        if not self._scroll_cache.isActive(): return
+        self._scroll_cache_timer.stop()
+        self._scroll_cache.release()
+
     def _style_change_handler_(self):
+        self._drop_scroll_cache_()
         data = self.styleDataCtrl.data
         self.bodyColorCtrl.setColorTo(data.Body)
         self.borderColorCtrl.setColorTo(data.Border)
@@ -295,7 +702,7 @@ class ZScrollPanel(ZWidget):
             if (self._last_v_handle_pos != handle_pos):
                 self._handle_v.opaque()
             self._last_v_handle_pos = handle_pos
-            self._handle_v.widgetPositionCtrl.moveTo(self.width() - self._handle_v.width(),int(handle_pos))
+            self._move_handle_(self._handle_v, self.width() - self._handle_v.width(), int(handle_pos))
         content_width = self._content.width()
         viewport_width = self.width()
         max_scroll_x = content_width - (viewport_width - self._handle_v.width())
@@ -307,12 +714,18 @@ class ZScrollPanel(ZWidget):
             if (self._last_h_handle_pos != handle_pos):
                 self._handle_h.opaque()
             self._last_h_handle_pos = handle_pos
-            self._handle_h.widgetPositionCtrl.moveTo(int(handle_pos),self.height() - self._handle_h.height())
+            self._move_handle_(self._handle_h, int(handle_pos), self.height() - self._handle_h.height())
+
+    def _move_handle_(self, handle: ScrollHandle, x: int, y: int):
+        # 滑块随滚动逐帧同步，直接移动而不是每帧重新开始位置动画
+        if handle.widgetPositionCtrl.isAnimating(): handle.widgetPositionCtrl.stopAnimation()
+        handle.move(x, y)
 
 
     def _update_handles_and_content(self):
         viewport = self.size()
         content= self._content.size()
+        self._scroller.setMaximum(content.width() - viewport.width(), content.height() - viewport.height())
         self._update_vertical_handle(content.height(), viewport.height())
         self._update_horizontal_handle(content.width(), viewport.width())
 
@@ -321,11 +734,8 @@ class ZScrollPanel(ZWidget):
         max_scroll = ch - vh
         if max_scroll <= 0:
             self._handle_v.hide()
-            self._content.move(self._content.x(), 0)
             return
-        content_visible_ratio = -self._content.y() / ch
-        new_scroll_pos = max(0, min(int(content_visible_ratio * ch), max_scroll))
-        self._content.widgetPositionCtrl.moveTo(self._content.x(), -new_scroll_pos)
+        new_scroll_pos = max(0, min(round(self._scroller.offset().y()), max_scroll))
         handle_h= max(30, vh * min(1.0, vh / ch))
         handle_space = vh - handle_h
         handle_pos = (new_scroll_pos / max_scroll) * handle_space
@@ -344,11 +754,8 @@ class ZScrollPanel(ZWidget):
         max_scroll = cw - vw
         if max_scroll <= 0:
             self._handle_h.hide()
-            self._content.move(0, self._content.y())
             return
-        content_visible_ratio = -self._content.x() / cw
-        new_scroll_pos = max(0, min(int(content_visible_ratio * cw), max_scroll))
-        self._content.widgetPositionCtrl.moveTo(new_scroll_pos, self._content.y())
+        new_scroll_pos = max(0, min(round(self._scroller.offset().x()), max_scroll))
         handle_w = max(30, vw * min(1.0, vw / cw))
         handle_space = vw - handle_w
         handle_pos: int = (new_scroll_pos / max_scroll) * handle_space
@@ -457,7 +457,7 @@ class ZNavigationBar(ZWidget):
         target_pos = self._get_btn_global_pos_(btn)
         distance = abs(target_pos.y() - current_pos.y())
         factor = min(0.5, max(0.2, distance / btn.height()))
-        self._indicator.widgetPositionCtrl.animation.setFactor(factor)
+        self._indicator.widgetPositionCtrl.setAnimationFactor(factor)
         self._indicator.widgetPositionCtrl.moveTo(
             target_pos.x(),
             target_pos.y() + (btn.height()-self._indicator.height())//2
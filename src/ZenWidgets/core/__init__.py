@@ -1,8 +1,13 @@
-from .enumrate import *
-from .animation import *
-from .dataclass import *
-from .converter import *
-from .utils import *
-from .debug import *
-from .globals import *
-from .enumrate import *
\ No newline at end of file
+from .utils.factory.lazy import lazyExports
+
+__getattr__, __dir__, __all__ = lazyExports(__name__, {
+    '.enumrate': ('ZDirection', 'ZPosition', 'ZState', 'ZStyle', 'ZWindowType', 'ZWrapMode'),
+    '.animation': ('ZExpAnimation', 'AnimationGroup', 'ExpAccelerateAnim', 'SqrExpAnimation', 'CounterAnimation',
+                   'ZAnimationDriver', 'ZAnimationPool', 'ZExpAnimationStore', 'ZExpPropertyAnimation',
+                   'ZExpScalarAnimation', 'ZKineticScroller', 'ownerWidget', 'isWidgetHidden'),
+    '.dataclass': ('ZMargin', 'ZMarginF', 'ZPadding', 'ZPaddingF', 'ZTextSnapshot'),
+    '.converter': ('ColorConverter', 'CoordConverter'),
+    '.utils': ('Singleton', 'Timeit', 'SingletonMeta', 'NonInstantiableMeta', 'make_getter', 'lazyExports'),
+    '.debug': ('ZDebug',),
+    '.globals': ('ZGlobal',),
+})
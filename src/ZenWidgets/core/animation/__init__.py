@@ -1,2 +1,7 @@
 from .animation import *
-from .exppropertyanim import ZExpPropertyAnimation
\ No newline at end of file
+from .driver import ZAnimationDriver
+from .visibility import ownerWidget,isWidgetHidden
+from .store import ZExpAnimationStore
+from .exppropertyanim import ZExpPropertyAnimation,ZExpScalarAnimation
+from .pool import ZAnimationPool
+from .kinetic import ZKineticScroller
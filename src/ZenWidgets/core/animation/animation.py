@@ -1,7 +1,7 @@
 from typing import Any
 import numpy
-from PySide6.QtCore import *
-from PySide6.QtGui import *
+from PySide6.QtCore import QObject,QTimer,Signal
+from .driver import ZAnimationDriver,global_fps
 
 __all__ = [
     'ZExpAnimation',
@@ -11,8 +11,6 @@ __all__ = [
     'CounterAnimation'
 ]
 
-global_fps = 60
-
 class Curve:
     @staticmethod
     def LINEAR(x):
@@ -30,16 +28,9 @@ class ABCAnimation(QObject):
         self.current_ = numpy.array(0)        # 当前值
         self.counter = 0                     # 计数器
 
-        # 构建计时器
-        self.timer = QTimer()
-        self.timer.setInterval(int(1000/global_fps))
-        self.timer.timeout.connect(self._process)  # 每经历 interval 时间，传入函数就被触发一次
-        # self.timer.setTimerType(Qt.PreciseTimer)
-
-        # 构建行为计时器
-        self.action_timer = QTimer()
-        self.action_timer.setSingleShot(True)
-        # self.action_timer.setTimerType(Qt.PreciseTimer)
+        # 不再为每个动画构建计时器，而是由全局驱动器统一推进，按间隔累计时间
+        self._interval = int(1000/global_fps)
+        self._elapsed = 0
 
     def setEnable(self, state: bool):
         self.enabled = state
@@ -53,7 +44,7 @@ class ABCAnimation(QObject):
 
     def setFPS(self, fps: int):
         """设置动画的帧率"""
-        self.timer.setInterval(int(1000 / fps))
+        self._interval = int(1000 / fps)
 
 
     def setTarget(self, target):
@@ -118,7 +109,30 @@ class ABCAnimation(QObject):
 
     def isActive(self):
         """检查动画是否正在运行 """
-        return self.timer.isActive()
+        return ZAnimationDriver().isRegistered(self)
+
+
+    def updateCurrentTime(self, delta: int):
+        """
+        由全局驱动器每帧调用，累计的时间达到动画间隔时处理一次动画
+        Args:
+            delta: 距上一帧经过的毫秒数
+        """
+        self._elapsed += delta
+        if self._elapsed < self._interval:
+            return
+        self._elapsed %= self._interval
+        self._process()
+
+
+    def _stop(self):
+        ZAnimationDriver().unregister(self)
+
+
+    def _start(self):
+        if not self.isActive():
+            self._elapsed = 0
+        ZAnimationDriver().register(self)
 
 
     def stop(self, delay: int | None = None):
@@ -128,9 +142,9 @@ class ABCAnimation(QObject):
             delay: 此操作生效前的时间延迟
         """
         if delay is None:
-            self.timer.stop()
+            self._stop()
         else:
-            self.action_timer.singleShot(delay, self.timer.stop)
+            QTimer.singleShot(delay, self, self._stop)
 
 
     def start(self, delay: int | None = None):
@@ -142,9 +156,13 @@ class ABCAnimation(QObject):
         if self.isEnabled() is False:
             return
         if delay is None:
-            self.timer.start()
+            self._start()
         else:
-            self.action_timer.singleShot(delay, self.timer.start)
+            QTimer.singleShot(delay, self, self._start)
+
+    def interval(self) -> int:
+        """返回动画的时间间隔，单位毫秒"""
+        return self._interval
 
     def setInterval(self, interval: int):
         """
@@ -152,7 +170,7 @@ class ABCAnimation(QObject):
         Args:
             interval: 时间间隔，单位毫秒
         """
-        self.timer.setInterval(interval)
+        self._interval = interval
 
 
     def try_to_start(self, delay=None):
@@ -171,6 +189,8 @@ class ZExpAnimation(ABCAnimation):
         super().__init__(parent)
         self.factor = 0.25
         self.bias = 1
+        self.frames = 1.0            # 本次处理相当于经过的帧数
+        self._delta_time = True      # 按经过的时间步进，动画速度与帧率无关
 
     def init(self, factor: float, bias: float, current: Any, target: Any, fps: int = 60):
         self.setFactor(factor)
@@ -200,14 +220,38 @@ class ZExpAnimation(ABCAnimation):
         self.bias = bias
 
 
+    def isDeltaTimeMode(self) -> bool:
+        return self._delta_time
+
+
+    def setDeltaTimeMode(self, enabled: bool):
+        """
+        设置是否按经过的时间步进
+        Args:
+            enabled: 开启时每帧都会处理动画，并按经过的毫秒数与动画间隔之比换算帧数，
+                     使用指数衰减的闭式解推进；关闭时每累计一个间隔固定推进一帧
+        """
+        self._delta_time = enabled
+
+
+    def updateCurrentTime(self, delta: int):
+        if not self._delta_time:
+            self.frames = 1.0
+            super().updateCurrentTime(delta)
+            return
+        self.frames = max(delta, 1) / self._interval
+        self._process()
+
+
     def _step_length(self):
         """ 计算当前步长 """
         dis = self._distance()
-        if (abs(dis) <= self.bias).all() is True:
+        if (abs(dis) <= self.bias * self.frames).all() is True:
             return dis
 
-        cut = numpy.array(abs(dis) <= self.bias, dtype="int8")
-        arr = abs(dis) * self.factor + self.bias  # 基本指数动画运算
+        # 逐帧递推 |d| -> |d|(1-f) - b 在 frames 帧后的闭式解，frames 为 1 时即为基本指数动画运算
+        arr = (abs(dis) + self.bias / self.factor) * (1 - (1 - self.factor) ** self.frames)
+        cut = numpy.array((abs(dis) <= self.bias * self.frames) | (arr >= abs(dis)), dtype="int8")
         arr = arr * (numpy.array(dis > 0, dtype="int8") * 2 - 1)  # 确定动画方向
         arr = arr * (1 - cut) + dis * cut  # 对于差距小于偏置的项，直接返回差距
         return arr
@@ -237,6 +281,7 @@ class ExpAccelerateAnim(ZExpAnimation):
         self.accelerate_function = lambda x: x ** 1.6
         self.step_length_bound = 0
         self.frame_counter = 0
+        self._delta_time = False     # 加速曲线按帧计数，保持固定间隔步进
 
     def setAccelerateFunction(self, function):
         self.accelerate_function = function
@@ -342,7 +387,7 @@ class CounterAnimation(ABCAnimation):
         :return:
         """
         duration = self.duration
-        interval = self.timer.interval()  # 两个值全是 毫秒 ms
+        interval = self.interval()  # 两个值全是 毫秒 ms
         return interval / duration
 
     def setCurve(self, curve_func):
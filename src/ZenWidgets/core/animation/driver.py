@@ -0,0 +1,207 @@
+from time import perf_counter
+from functools import partial
+from typing import Callable
+from PySide6.QtCore import Qt, QObject, QTimer, QElapsedTimer, QAbstractAnimation, QRect, Signal
+from PySide6.QtWidgets import QWidget
+from ZenWidgets.core.utils import Singleton
+from .store import ZExpAnimationStore
+from .governor import ZFrameRateGovernor
+from .visibility import ownerWidget
+
+__all__ = ['ZAnimationDriver']
+
+global_fps = 60
+reference_interval = 1000 / global_fps
+'''动画因子与偏置所依据的基准帧间隔（毫秒），按时间步进的动画以此换算经过的帧数'''
+
+def _jump_to_end(animation: QAbstractAnimation) -> None:
+    if animation.totalDuration() > 0: animation.setCurrentTime(animation.totalDuration())
+
+@Singleton
+class ZAnimationDriver(QObject):
+    '''
+    全局动画驱动器
+
+    - 所有动画共享同一个计时器，每帧只触发一次回调，在回调中批量推进所有活动动画
+    - 没有活动动画时计时器完全停止，不再产生任何唤醒
+    - 指数属性动画存放在 `ZExpAnimationStore` 中，每帧一次向量化步进
+    - 其他被驱动的对象需要实现 `updateCurrentTime(delta: int)` ，参数为距上一帧经过的毫秒数
+    - 控制器通过 `markDirty` 标记需要重绘的控件，同一帧内的多次标记合并为每个控件一次 `update()`
+    - 运行中的动画按所属控件建立索引，控件隐藏时只查找自己的动画
+    '''
+    ticked = Signal(int)
+    '''每帧推进完成后发出，回传本帧间隔（毫秒）'''
+    fpsChanged = Signal(int)
+    '''帧率改变时发出，需要与动画同步刷新的计时器可以据此调整间隔'''
+    def __init__(self):
+        super().__init__()
+        self._fps: int = global_fps
+        self._animations: dict[object, None] = {}
+        self._store = ZExpAnimationStore(reference_interval)
+        self._owned: dict[QWidget, dict[object, Callable[[], None]]] = {}
+        self._owners: dict[object, QWidget] = {}
+        self._clock = QElapsedTimer()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(int(1000/self._fps))
+        self._timer.timeout.connect(self._on_tick_)
+        self._dirty: dict[QWidget, QRect | None] = {}
+        self._in_tick: bool = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_)
+        self._governor = ZFrameRateGovernor(self._fps, self)
+        self._governor.fpsChanged.connect(self.setFPS)
+        self.setFPS(self._governor.fps())
+
+    # region public
+    def fps(self) -> int: return self._fps
+
+    def interval(self) -> int: return self._timer.interval()
+
+    def governor(self) -> ZFrameRateGovernor:
+        '''帧率调节器，帧率上限、省电上限等通过它设置'''
+        return self._governor
+
+    def setFPS(self, fps: int) -> None:
+        '''设置驱动器的帧率，调节器启用时会在负载变化后重新调整'''
+        if fps <= 0: raise ValueError(f"FPS must be positive, got {fps}")
+        if fps == self._fps: return
+        self._fps = fps
+        self._timer.setInterval(int(1000/fps))
+        self.fpsChanged.emit(fps)
+
+    def isActive(self) -> bool: return self._timer.isActive()
+
+    def animationCount(self) -> int: return len(self._animations) + len(self._store)
+
+    def store(self) -> ZExpAnimationStore: return self._store
+
+    def wake(self) -> None:
+        '''唤醒处于休眠状态的驱动器'''
+        if not self._timer.isActive():
+            self._clock.start()
+            self._timer.start()
+
+    def register(self, animation) -> None:
+        '''将动画加入驱动队列，驱动器处于休眠状态时会被唤醒'''
+        if animation not in self._animations: self._index_(animation)
+        self._animations[animation] = None
+        self.wake()
+
+    def unregister(self, animation) -> None:
+        '''将动画移出驱动队列，队列为空时驱动器在下一帧进入休眠'''
+        if animation not in self._animations: return
+        del self._animations[animation]
+        self._unindex_(animation)
+
+    def attach(self, animation) -> None:
+        '''将指数属性动画加入批量步进存储，驱动器处于休眠状态时会被唤醒'''
+        if animation not in self._store: self._index_(animation)
+        self._store.add(animation)
+        self.wake()
+
+    def detach(self, animation) -> None:
+        '''将指数属性动画移出批量步进存储'''
+        if animation in self._store: self._unindex_(animation)
+        self._store.remove(animation)
+
+    def watch(self, animation: QAbstractAnimation) -> None:
+        '''
+        登记控制器持有的 Qt 属性动画，运行期间同样按所属控件建立索引，
+        控件隐藏时被推进到终点
+        '''
+        animation.stateChanged.connect(self._on_watched_state_)
+
+    def isRegistered(self, animation) -> bool: return animation in self._animations
+
+    def finishAnimations(self, widget: QWidget, recursive: bool = False) -> None:
+        '''
+        让属于 widget 的运行中动画立即跳到终点并结束，用于控件隐藏或窗口最小化时
+
+        - 动画在开始运行时按 `ownerWidget()` 记录归属，这里只查找 widget 自己的动画，
+          `recursive` 为真时同时结束所有子孙控件的动画
+        - 通过 `watch` 登记的 Qt 属性动画会被推进到终点
+        '''
+        if not self._owned: return
+        if recursive:
+            owners = [owner for owner in tuple(self._owned) if owner is widget or self._is_ancestor_(widget, owner)]
+        else:
+            owners = [widget] if widget in self._owned else []
+        for owner in owners:
+            # 结束动画时会将其移出索引，因此遍历快照
+            for finish in tuple(self._owned.get(owner, {}).values()): finish()
+
+    def markDirty(self, widget: QWidget, rect: QRect | None = None) -> None:
+        '''
+        标记控件需要重绘
+
+        - 帧内的标记在批量推进结束后统一刷新，其他时机的标记在本轮事件循环结束时刷新
+        - 传入 `rect` 时只重绘该区域，同一控件的多个区域合并为外接矩形；不传则重绘整个控件
+        '''
+        if widget in self._dirty:
+            dirty = self._dirty[widget]
+            if dirty is not None: self._dirty[widget] = None if rect is None else dirty.united(rect)
+            return
+        self._dirty[widget] = None if rect is None else QRect(rect)
+        if not self._in_tick and not self._flush_timer.isActive(): self._flush_timer.start()
+
+    # region private
+    def _index_(self, animation) -> None:
+        if isinstance(animation, QAbstractAnimation):
+            owner, finish = ownerWidget(animation), partial(_jump_to_end, animation)
+        else:
+            owner_widget = getattr(animation, 'ownerWidget', None)
+            if owner_widget is None: return
+            owner, finish = owner_widget(), animation.finish
+        if owner is None: return
+        self._owners[animation] = owner
+        self._owned.setdefault(owner, {})[animation] = finish
+
+    def _unindex_(self, animation) -> None:
+        owner = self._owners.pop(animation, None)
+        if owner is None: return
+        running = self._owned[owner]
+        del running[animation]
+        if not running: del self._owned[owner]
+
+    @staticmethod
+    def _is_ancestor_(widget: QWidget, owner: QWidget) -> bool:
+        try:
+            return widget.isAncestorOf(owner)
+        except RuntimeError:
+            # 控件已被销毁
+            return False
+
+    def _on_watched_state_(self, new_state: QAbstractAnimation.State, old_state: QAbstractAnimation.State) -> None:
+        animation = self.sender()
+        if new_state == QAbstractAnimation.State.Running: self._index_(animation)
+        elif old_state == QAbstractAnimation.State.Running: self._unindex_(animation)
+
+    def _flush_(self) -> None:
+        dirty, self._dirty = self._dirty, {}
+        for widget, rect in dirty.items():
+            try:
+                if rect is None: widget.update()
+                else: widget.update(rect)
+            except RuntimeError:
+                # 控件已被销毁
+                pass
+
+    def _on_tick_(self) -> None:
+        delta = self._clock.restart()
+        start = perf_counter()
+        self._in_tick = True
+        try:
+            self._store.step(delta)
+            # 动画可能在推进过程中停止并移出队列，因此遍历快照
+            for animation in tuple(self._animations):
+                animation.updateCurrentTime(delta)
+        finally:
+            self._in_tick = False
+        self._flush_timer.stop()
+        self._flush_()
+        if not self._animations and not self._store: self._timer.stop()
+        self.ticked.emit(delta)
+        self._governor.frameFinished(delta, (perf_counter() - start) * 1000)
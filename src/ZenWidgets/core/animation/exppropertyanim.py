@@ -1,7 +1,13 @@
+import math
+import warnings
+from copy import copy
 from typing import Any,overload
 import numpy
-from PySide6.QtCore import *
-from PySide6.QtGui import *
+from PySide6.QtCore import QAbstractAnimation,QObject,QPoint,QPointF,QRect,QRectF,QSize,QSizeF,QTimer,Signal
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QWidget
+from .driver import ZAnimationDriver,reference_interval
+from .visibility import ownerWidget,isWidgetHidden
 
 class TypeConversionFuncs:
     functions = {
@@ -36,12 +42,23 @@ class TypeConversionFuncs:
     }
 
 
-class ZExpPropertyAnimation(QAbstractAnimation):
+class ZExpPropertyAnimation(QObject):
+    '''
+    指数属性动画
+
+    不再由 Qt 为每个动画单独计时，而是放入 `ZAnimationDriver` 的 `ZExpAnimationStore` ，
+    在同一帧内与其他动画一起向量化推进，接口与 `QAbstractAnimation` 保持一致（ `state` 、 `start` 、 `stop` 、 `finished` ）
+
+    目标所属的控件不可见或窗口已最小化时不会逐帧推进：启动时推迟到下一轮事件循环再检查，
+    仍不可见则直接跳到终点，这样先启动动画再 `show()` 的写法不受影响
+    '''
     valueChanged = Signal(object)
+    finished = Signal()
+    stateChanged = Signal(QAbstractAnimation.State, QAbstractAnimation.State)
 
     def __init__(self, target: QObject, property_name=None, parent=None) -> None:
         super().__init__(parent)
-        self.start_after_timer = QTimer(self)
+        self._state = QAbstractAnimation.State.Stopped
 
         self._target = target
         self._property_name = None
@@ -56,10 +73,11 @@ class ZExpPropertyAnimation(QAbstractAnimation):
 
         self._velocity_inertia = 0.0  #值介于0和1之间，值越大，动画越难加速。
         self._velocity = 0
+        self._delta_time = True       #按经过的时间步进，动画速度与帧率无关
+        self._pending = False         #启动时目标不可见，等待下一轮事件循环再决定
 
         if property_name is not None:
             self.setPropertyName(property_name)
-        if target.objectName() == 'hslider_1':print(self._target.property(self._property_name))
         self.finished.connect(self.resetStartValue)
 
 
@@ -70,8 +88,11 @@ class ZExpPropertyAnimation(QAbstractAnimation):
         if end_value is not None: self.setEndValue(end_value)
         self.resetVelocity()
 
+    def state(self) -> QAbstractAnimation.State:
+        return self._state
+
     def isRunning(self) -> bool:
-        return self.state() == QAbstractAnimation.State.Running
+        return self._state == QAbstractAnimation.State.Running
 
     def setFactor(self, factor: float):
         """
@@ -89,6 +110,7 @@ class ZExpPropertyAnimation(QAbstractAnimation):
         if not 0 < factor < 1:
             raise ValueError(f"Factor must be between 0 and 1 (exclusive), got {factor}")
         self.factor = factor
+        self._invalidate()
 
 
     def setBias(self, bias: float):
@@ -110,6 +132,7 @@ class ZExpPropertyAnimation(QAbstractAnimation):
         if bias <= 0:
             raise ValueError(f"Bias must be positive, got {bias}")
         self.bias = bias
+        self._invalidate()
 
 
     def target(self) -> QObject:
@@ -129,7 +152,7 @@ class ZExpPropertyAnimation(QAbstractAnimation):
 
     def currentValue(self, raw=False) -> Any:
         if raw is True:
-            return self._current_value
+            return copy(self._current_value)
         else:
             return self._out_func(self._current_value)
 
@@ -146,15 +169,47 @@ class ZExpPropertyAnimation(QAbstractAnimation):
         # new 2025.10.14
         if self._start_value is None:
             self.fromProperty()
-        if (self._current_value == self._end_value).all():
+        if self._reached_():
             # If current value equals end value, do not start the animation
             return
-        if self.state() != QAbstractAnimation.State.Running:
-            super().start(*args, **kwargs)
+        if self._state != QAbstractAnimation.State.Running:
+            self._setState(QAbstractAnimation.State.Running)
+            if isWidgetHidden(self.ownerWidget()):
+                self._pending = True
+                QTimer.singleShot(0, self, self._resume_)
+            else:
+                self._attach_()
+
+
+    def stop(self) -> None:
+        if self._state == QAbstractAnimation.State.Stopped:
+            return
+        self._pending = False
+        self._detach_()
+        self._setState(QAbstractAnimation.State.Stopped)
+        # 与 duration 为 -1 的 QAbstractAnimation 一致，每次停止都会发出 finished
+        self.finished.emit()
 
 
     def startAfter(self, msec: int):
-        self.start_after_timer.singleShot(msec, self.start)
+        QTimer.singleShot(msec, self, self.start)
+
+
+    def finish(self) -> None:
+        '''立即跳到终点并结束动画'''
+        if self._state != QAbstractAnimation.State.Running:
+            return
+        self._current_value = copy(self._end_value)
+        self._velocity = 0 * self._current_value
+        self._apply_(True)
+
+
+    def ownerWidget(self) -> QWidget | None:
+        '''动画目标所属的控件，目标已被销毁时返回 None'''
+        try:
+            return ownerWidget(self._target)
+        except RuntimeError:
+            return None
 
 
     def fromProperty(self):
@@ -173,6 +228,7 @@ class ZExpPropertyAnimation(QAbstractAnimation):
         self._loadConversionFuncs()
         self._end_value = self._in_func(self._target.property(name))
         self._current_value = self._in_func(self._target.property(name))
+        self._invalidate()
 
 
     def setEndValue(self, value: Any) -> None:
@@ -180,6 +236,7 @@ class ZExpPropertyAnimation(QAbstractAnimation):
             self._end_value = self._in_func(value)
         else:
             self._end_value = numpy.array(value)
+        self._invalidate()
 
 
     def setStartValue(self, value: Any) -> None:
@@ -193,6 +250,7 @@ class ZExpPropertyAnimation(QAbstractAnimation):
         else:
             self._start_value = numpy.array(value)
         self._current_value = self._start_value.copy()
+        self._invalidate()
         self.valueChanged.emit(self._current_value)
 
     def resetStartValue(self) -> None:
@@ -201,32 +259,116 @@ class ZExpPropertyAnimation(QAbstractAnimation):
 
     def resetVelocity(self):
         self._velocity = 0 * self._current_value
+        self._invalidate()
 
 
     def setVelocityInertia(self, n: float):
         '''值介于 0 和 1 之间，值越大，动画越难加速。'''
         self._velocity_inertia = n
+        self._invalidate()
 
 
-    def updateCurrentTime(self, _) -> None:
-        #print(self.distance())
-        if (self.distance() == 0).all():
-            self.stop()
-            return
-        distance = self._end_value - self._current_value
-        flag = numpy.array(abs(distance) <= self.bias, dtype="int8")
-        step = abs(distance) * self.factor + self.bias                   # 基本指数动画运算
-        step = step * (numpy.array(distance > 0, dtype="int8") * 2 - 1)  # 确定动画方向
-        step = step * (1 - flag) + distance * flag                       # 差距小于偏置的项，返回差距
+    def isDeltaTimeMode(self) -> bool:
+        return self._delta_time
 
-        self._velocity = self._velocity * self._velocity_inertia + step * (1 - self._velocity_inertia)
 
-        self._current_value = self._current_value + self._velocity
-        self.valueChanged.emit(self._current_value)
+    def setDeltaTimeMode(self, enabled: bool) -> None:
+        '''
+        设置是否按经过的时间步进
+
+        - 开启（默认）：根据两帧之间经过的毫秒数换算帧数，使用指数衰减的闭式解推进，
+          掉帧、降低帧率或高刷新率屏幕都不会改变动画的实际速度
+        - 关闭：每次驱动固定推进一帧，与旧版行为一致
+        '''
+        self._delta_time = enabled
+        self._invalidate()
+
+
+    def _setState(self, state: QAbstractAnimation.State) -> None:
+        old_state = self._state
+        self._state = state
+        self.stateChanged.emit(state, old_state)
+
+
+    def _attach_(self) -> None:
+        '''加入驱动器的批量步进存储'''
+        ZAnimationDriver().attach(self)
+
+
+    def _detach_(self) -> None:
+        ZAnimationDriver().detach(self)
+
+
+    def _rebind_(self, target: QObject, property_name: str) -> None:
+        '''由 ZAnimationPool 调用，把回收的动画绑定到新的目标属性'''
+        self._target = target
+        self.setPropertyName(property_name)
+        self.resetVelocity()
+
+
+    def _recycle_(self) -> None:
+        '''由 ZAnimationPool 调用，停止动画并恢复到刚创建时的状态'''
+        self.stop()
+        for signal in (self.valueChanged, self.finished, self.stateChanged):
+            with warnings.catch_warnings():
+                # 没有连接时 disconnect 会给出警告
+                warnings.simplefilter('ignore', RuntimeWarning)
+                try: signal.disconnect()
+                except (RuntimeError, TypeError): pass
+        self.finished.connect(self.resetStartValue)
+        self._target = None
+        self._start_value = None
+        self.factor = 1/4
+        self.bias = 0.5
+        self._velocity_inertia = 0.0
+        self._delta_time = True
+
+
+    def _resume_(self) -> None:
+        if not self._pending: return
+        self._pending = False
+        if isWidgetHidden(self.ownerWidget()): self.finish()
+        else: self._attach_()
+
+
+    def _reached_(self) -> bool:
+        return bool((self._current_value == self._end_value).all())
+
+
+    def _invalidate(self) -> None:
+        '''运行中修改了动画参数，通知存储重新打包'''
+        if self._state == QAbstractAnimation.State.Running:
+            ZAnimationDriver().store().invalidate()
+
+
+    def _apply_(self, finished: bool) -> None:
+        '''由 ZExpAnimationStore 在批量步进后调用，把当前值写回目标属性'''
+        # 打包后的当前值是存储数组的视图，每帧都会被改写，发出副本让接收方可以保存或比较
+        self.valueChanged.emit(copy(self._current_value))
         try:
             self._target.setProperty(self._property_name, self._out_func(self._current_value))
         except RuntimeError:
-            pass
+            # 目标对象已被销毁
+            finished = True
+        if finished: self.stop()
+
+
+    def updateCurrentTime(self, delta: int) -> None:
+        '''单独推进经过 delta 毫秒后的一帧，与 ZExpAnimationStore.step 的运算一致'''
+        frames = max(delta, 1) / reference_interval if self._delta_time else 1.0
+        distance = self._end_value - self._current_value
+        abs_distance = abs(distance)
+        step = (abs_distance + self.bias / self.factor) * (1 - (1 - self.factor) ** frames)  # 基本指数动画运算
+        flag = (abs_distance <= self.bias * frames) | (step >= abs_distance)
+        step = numpy.where(flag, distance, numpy.copysign(step, distance))   # 确定动画方向，差距小于偏置的项返回差距
+
+        inertia = self._velocity_inertia ** frames
+        self._velocity = self._velocity * inertia + step * (1 - inertia)
+
+        self._current_value = self._current_value + self._velocity
+        if self._velocity_inertia == 0:
+            self._current_value = numpy.where(flag, self._end_value, self._current_value)
+        self._apply_(bool((self._current_value == self._end_value).all()))
 
 
     def _loadConversionFuncs(self) -> None:
@@ -235,4 +377,74 @@ class ZExpPropertyAnimation(QAbstractAnimation):
             self._out_func = TypeConversionFuncs.functions.get(self._property_type.__name__)[1]
         else:
             self._in_func = lambda x: numpy.array(x)
-            self._out_func = lambda x: self._property_type(numpy.array(x, dtype="float32"))
\ No newline at end of file
+            self._out_func = lambda x: self._property_type(numpy.array(x, dtype="float32"))
+
+
+class ZExpScalarAnimation(ZExpPropertyAnimation):
+    '''
+    单值指数属性动画
+
+    适用于 float / int 类型的属性（透明度、长度等），数值以 Python float 保存，
+    每帧的运算完全不经过 NumPy ，缓动语义（因子、偏置、速度惯性）与 ZExpPropertyAnimation 一致
+    '''
+    def distance(self) -> float:
+        return self._end_value - self._current_value
+
+
+    def setPropertyName(self, name: str) -> None:
+        self._property_name = name
+        self._property_type = type(self._target.property(name))
+        self._in_func = float
+        self._out_func = self._property_type
+        self._end_value = float(self._target.property(name))
+        self._current_value = self._end_value
+
+
+    def setEndValue(self, value: Any) -> None:
+        self._end_value = float(value)
+
+
+    def setStartValue(self, value: Any) -> None:
+        self._start_value = float(value)
+        self._current_value = self._start_value
+        self.valueChanged.emit(self._current_value)
+
+
+    def resetVelocity(self):
+        self._velocity = 0.0
+
+
+    def _attach_(self) -> None:
+        # 单值动画由驱动器逐个调用 updateCurrentTime ，不进入向量化存储
+        ZAnimationDriver().register(self)
+
+
+    def _detach_(self) -> None:
+        ZAnimationDriver().unregister(self)
+
+
+    def _reached_(self) -> bool:
+        return self._current_value == self._end_value
+
+
+    def _invalidate(self) -> None:
+        # 参数每帧直接读取，无需通知存储
+        pass
+
+
+    def updateCurrentTime(self, delta: int) -> None:
+        frames = max(delta, 1) / reference_interval if self._delta_time else 1.0
+        distance = self._end_value - self._current_value
+        abs_distance = abs(distance)
+        step = (abs_distance + self.bias / self.factor) * (1 - (1 - self.factor) ** frames)  # 基本指数动画运算
+        if abs_distance <= self.bias * frames or step >= abs_distance:
+            step = distance                                                   # 差距小于偏置，返回差距
+        else:
+            step = math.copysign(step, distance)                              # 确定动画方向
+        inertia = self._velocity_inertia ** frames
+        self._velocity = self._velocity * inertia + step * (1 - inertia)
+        if step == distance and inertia == 0:
+            self._current_value = self._end_value
+        else:
+            self._current_value += self._velocity
+        self._apply_(self._current_value == self._end_value)
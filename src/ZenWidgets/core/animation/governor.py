@@ -0,0 +1,130 @@
+from PySide6.QtCore import Qt, QObject, Signal
+from PySide6.QtGui import QGuiApplication, QScreen
+
+__all__ = ['ZFrameRateGovernor']
+
+class ZFrameRateGovernor(QObject):
+    '''
+    动画帧率调节器
+
+    - 上限取屏幕刷新率与 `maxFPS` 中较小者，应用进入后台或窗口最小化时改用省电上限 `backgroundFPS`
+    - 每帧结束后由驱动器报告实际帧间隔与批量推进耗时：连续超时则降低帧率，持续空闲则逐步恢复
+    - 动画按经过的时间步进，帧率变化不会改变动画速度
+    '''
+    fpsChanged = Signal(int)
+    '''建议帧率改变时发出'''
+    def __init__(self, fps: int = 60, parent: QObject | None = None):
+        super().__init__(parent)
+        self._enabled: bool = True
+        self._fps: int = fps
+        self._min_fps: int = 30
+        self._max_fps: int = 144
+        self._background_fps: int = 20
+        self._screen_fps: int = fps
+        self._background: bool = False
+        self._load: float = .0                  # 批量推进耗时占帧预算比例的滑动平均
+        self._overrun_frames: int = 0
+        self._idle_frames: int = 0
+        self._overrun_load: float = 0.5         # 超过此负载视为超时
+        self._idle_load: float = 0.2            # 低于此负载视为空闲
+        self._overrun_tolerance: int = 3        # 连续超时多少帧后降低帧率
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.primaryScreenChanged.connect(self._on_screen_changed_)
+            app.applicationStateChanged.connect(self._on_application_state_changed_)
+            self._on_screen_changed_(app.primaryScreen())
+            self._background = app.applicationState() != Qt.ApplicationState.ApplicationActive
+        self._fps = self.ceiling()
+
+    # region public
+    def fps(self) -> int: return self._fps
+
+    def minFPS(self) -> int: return self._min_fps
+
+    def maxFPS(self) -> int: return self._max_fps
+
+    def backgroundFPS(self) -> int: return self._background_fps
+
+    def screenFPS(self) -> int: return self._screen_fps
+
+    def isEnabled(self) -> bool: return self._enabled
+
+    def isBackground(self) -> bool: return self._background
+
+    def ceiling(self) -> int:
+        '''当前允许的最高帧率'''
+        ceiling = min(self._max_fps, self._screen_fps)
+        if self._background: ceiling = min(ceiling, self._background_fps)
+        return max(1, ceiling)
+
+    def setEnabled(self, enabled: bool) -> None:
+        '''关闭后不再根据负载调节，帧率固定为当前上限'''
+        self._enabled = enabled
+        self._set_fps_(self.ceiling())
+
+    def setMinFPS(self, fps: int) -> None:
+        self._min_fps = max(1, fps)
+        self._set_fps_(max(self._fps, self._min_fps))
+
+    def setMaxFPS(self, fps: int) -> None:
+        '''设置帧率上限，例如嵌入式面板可以固定在 30 帧以降低 CPU 占用'''
+        self._max_fps = max(1, fps)
+        self._set_fps_(self._fps)
+
+    def setBackgroundFPS(self, fps: int) -> None:
+        '''设置应用处于后台或窗口最小化时的省电帧率上限'''
+        self._background_fps = max(1, fps)
+        self._set_fps_(self._fps)
+
+    def setBackground(self, background: bool) -> None:
+        '''手动切换省电状态，例如窗口最小化时'''
+        if self._background == background: return
+        self._background = background
+        # 回到前台时直接恢复到上限，进入后台时由 _set_fps_ 压到省电上限
+        self._set_fps_(self._fps if background else self.ceiling())
+
+    def frameFinished(self, delta: int, cost: float) -> None:
+        '''
+        由驱动器在每帧结束时调用
+
+        :param delta: 距上一帧实际经过的毫秒数
+        :param cost: 本帧批量推进所有动画花费的毫秒数
+        '''
+        if not self._enabled: return
+        budget = 1000 / self._fps
+        self._load = self._load * 0.8 + cost / budget * 0.2
+        if delta > budget * 1.5 or self._load > self._overrun_load:
+            self._overrun_frames += 1
+            self._idle_frames = 0
+        elif self._load < self._idle_load:
+            self._idle_frames += 1
+            self._overrun_frames = 0
+        if self._overrun_frames >= self._overrun_tolerance:
+            self._overrun_frames = 0
+            self._set_fps_(int(self._fps * 0.75))
+        elif self._idle_frames >= self._fps:
+            # 持续空闲约一秒后逐步恢复
+            self._idle_frames = 0
+            self._set_fps_(int(self._fps * 1.25) + 1)
+
+    # region private
+    def _set_fps_(self, fps: int) -> None:
+        fps = max(min(fps, self.ceiling()), min(self._min_fps, self.ceiling()))
+        if not self._enabled: fps = self.ceiling()
+        if fps == self._fps: return
+        self._fps = fps
+        self._load = .0
+        self.fpsChanged.emit(fps)
+
+    def _on_screen_changed_(self, screen: QScreen | None) -> None:
+        if screen is None: return
+        screen.refreshRateChanged.connect(self._on_refresh_rate_changed_)
+        self._on_refresh_rate_changed_(screen.refreshRate())
+
+    def _on_refresh_rate_changed_(self, rate: float) -> None:
+        if rate <= 0: return
+        self._screen_fps = round(rate)
+        self._set_fps_(self._fps)
+
+    def _on_application_state_changed_(self, state: Qt.ApplicationState) -> None:
+        self.setBackground(state != Qt.ApplicationState.ApplicationActive)
@@ -0,0 +1,203 @@
+import math
+from collections import deque
+from PySide6.QtCore import Qt, QObject, QElapsedTimer, QPointF, Signal
+from PySide6.QtWidgets import QWidget
+from .driver import ZAnimationDriver, reference_interval
+
+__all__ = ['ZKineticScroller']
+
+class ZKineticScroller(QObject):
+    '''
+    滚动物理引擎，每个滚动区域一个实例
+
+    - 输入只修改目标或累加位移，由 `ZAnimationDriver` 每帧推进一次，同一帧内的多个滚轮事件合并为一次位移
+    - 按刻度的滚轮输入（ `scrollBy` ）累加到目标位置，每帧按指数趋近，连续滚动时不会从当前位置重新开始
+    - 像素级输入（ `pixelScroll` ，触摸板）一比一跟随，同时记录最近的位移估计速度；
+      手势结束（ `ScrollEnd` ）后按该速度惯性滑动，速度按 `friction` 指数衰减
+    - 系统自带的惯性阶段（ `ScrollMomentum` ）直接应用，不再叠加自身的惯性
+    - 偏移为正数，范围 [0, maximum]，改变时发出 `offsetChanged`
+    '''
+    offsetChanged = Signal(QPointF)
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._offset: list[float] = [.0, .0]
+        self._target: list[float] = [.0, .0]
+        self._maximum: list[float] = [.0, .0]
+        self._pending: list[float] = [.0, .0]
+        self._velocity: list[float] = [.0, .0]  # 像素/毫秒
+        self._smoothing: float = 0.2            # 基准帧间隔内走完剩余距离的比例
+        self._bias: float = 1.0                 # 基准帧间隔内的最小步长，避免指数趋近的尾部过长
+        self._friction: float = 0.004           # 惯性速度每毫秒的衰减率
+        self._min_velocity: float = 0.02        # 低于此速度（像素/毫秒）时停止惯性
+        self._fling: bool = False
+        self._samples: deque[tuple[float, float, float]] = deque(maxlen=16)
+        self._sample_window: float = 100        # 估计速度时使用的最近输入（毫秒）
+        self._clock = QElapsedTimer()
+        self._clock.start()
+
+    # region public
+    def offset(self) -> QPointF: return QPointF(*self._offset)
+
+    def target(self) -> QPointF: return QPointF(*self._target)
+
+    def maximum(self) -> QPointF: return QPointF(*self._maximum)
+
+    def velocity(self) -> QPointF:
+        '''惯性滑动的速度（像素/毫秒）'''
+        return QPointF(*self._velocity)
+
+    def isActive(self) -> bool: return ZAnimationDriver().isRegistered(self)
+
+    def isFlinging(self) -> bool: return self._fling
+
+    def setSmoothing(self, smoothing: float) -> None:
+        '''设置按刻度滚动时每个基准帧走完剩余距离的比例，取值 (0, 1]'''
+        self._smoothing = min(1.0, max(0.01, smoothing))
+
+    def setFriction(self, friction: float) -> None:
+        '''设置惯性滑动的摩擦系数（每毫秒的速度衰减率），越大停得越快'''
+        self._friction = max(.0, friction)
+
+    def setMaximum(self, x: float, y: float) -> None:
+        '''设置最大偏移，当前偏移与目标超出范围时收回'''
+        before = tuple(self._offset)
+        self._maximum = [max(.0, x), max(.0, y)]
+        for axis in (0, 1):
+            self._target[axis] = self._clamp_(axis, self._target[axis])
+            if self._offset[axis] != self._clamp_(axis, self._offset[axis]):
+                self._offset[axis] = self._clamp_(axis, self._offset[axis])
+                self._velocity[axis] = .0
+        self._notify_(before)
+
+    def setOffset(self, x: float | None = None, y: float | None = None) -> None:
+        '''立即设置偏移并停止该方向上的运动'''
+        before = tuple(self._offset)
+        for axis, value in ((0, x), (1, y)):
+            if value is None: continue
+            self._offset[axis] = self._target[axis] = self._clamp_(axis, value)
+            self._pending[axis] = self._velocity[axis] = .0
+        self._notify_(before)
+
+    def adjust(self, dx: float, dy: float) -> None:
+        '''平移偏移与目标而不影响正在进行的运动，例如内容在视口上方插入或变高时'''
+        before = tuple(self._offset)
+        for axis, delta in ((0, dx), (1, dy)):
+            self._offset[axis] = self._clamp_(axis, self._offset[axis] + delta)
+            self._target[axis] = self._clamp_(axis, self._target[axis] + delta)
+        self._notify_(before)
+
+    def scrollTo(self, x: float | None = None, y: float | None = None) -> None:
+        '''平滑滚动到指定偏移，为 None 的方向保持不变'''
+        self._stop_fling_()
+        for axis, value in ((0, x), (1, y)):
+            if value is not None: self._target[axis] = self._clamp_(axis, value)
+        self._wake_()
+
+    def scrollBy(self, dx: float, dy: float) -> None:
+        '''按刻度的滚轮输入：在当前目标的基础上平滑滚动'''
+        self._stop_fling_()
+        self._target[0] = self._clamp_(0, self._target[0] + dx)
+        self._target[1] = self._clamp_(1, self._target[1] + dy)
+        self._wake_()
+
+    def pixelScroll(self, dx: float, dy: float, phase: Qt.ScrollPhase = Qt.ScrollPhase.NoScrollPhase) -> None:
+        '''
+        像素级输入，偏移跟随输入一比一变化
+
+        :param phase: 输入所处的手势阶段， `ScrollEnd` 时按最近的速度开始惯性滑动
+        '''
+        if phase == Qt.ScrollPhase.ScrollBegin:
+            self._stop_fling_()
+            self._samples.clear()
+        elif phase == Qt.ScrollPhase.ScrollEnd:
+            self._pending[0] += dx
+            self._pending[1] += dy
+            self._start_fling_()
+            self._wake_()
+            return
+        elif phase != Qt.ScrollPhase.ScrollMomentum:
+            self._stop_fling_()
+            self._samples.append((self._clock.nsecsElapsed() / 1e6, dx, dy))
+        self._pending[0] += dx
+        self._pending[1] += dy
+        self._wake_()
+
+    def stop(self) -> None:
+        '''停在当前偏移'''
+        self._target = list(self._offset)
+        self._pending = [.0, .0]
+        self._stop_fling_()
+        ZAnimationDriver().unregister(self)
+
+    def finish(self) -> None:
+        '''直接到达目标，用于所属控件隐藏时'''
+        before = tuple(self._offset)
+        self._offset = [self._clamp_(axis, self._target[axis] + self._pending[axis]) for axis in (0, 1)]
+        self.stop()
+        self._notify_(before)
+
+    def ownerWidget(self) -> QWidget | None:
+        '''所属的滚动区域，已被销毁时返回 None'''
+        try:
+            parent = self.parent()
+        except RuntimeError:
+            return None
+        return parent if isinstance(parent, QWidget) else None
+
+    def updateCurrentTime(self, delta: int) -> None:
+        '''由 `ZAnimationDriver` 每帧调用，delta 为距上一帧的毫秒数'''
+        delta = max(1, delta)
+        before = tuple(self._offset)
+        ratio = 1 - (1 - self._smoothing) ** (delta / reference_interval)
+        bias = self._bias * delta / reference_interval
+        decay = math.exp(-self._friction * delta)
+        moving = False
+        for axis in (0, 1):
+            if self._pending[axis]:
+                # 像素输入直接改变偏移，目标随之移动，打断按刻度的平滑滚动
+                self._offset[axis] = self._clamp_(axis, self._offset[axis] + self._pending[axis])
+                self._target[axis] = self._offset[axis]
+                self._pending[axis] = .0
+            if self._fling and self._velocity[axis]:
+                offset = self._offset[axis] + self._velocity[axis] * delta
+                self._velocity[axis] *= decay
+                clamped = self._clamp_(axis, offset)
+                if clamped != offset or abs(self._velocity[axis]) < self._min_velocity: self._velocity[axis] = .0
+                self._offset[axis] = self._target[axis] = clamped
+                moving = moving or self._velocity[axis] != .0
+            remaining = self._target[axis] - self._offset[axis]
+            if abs(remaining) <= bias:
+                self._offset[axis] = self._target[axis]
+            else:
+                self._offset[axis] += math.copysign(max(abs(remaining) * ratio, bias), remaining)
+                moving = True
+        self._fling = self._fling and moving
+        try:
+            self._notify_(before)
+        except RuntimeError:
+            # 所属的滚动区域已被销毁
+            moving = False
+        if not moving: ZAnimationDriver().unregister(self)
+
+    # region private
+    def _clamp_(self, axis: int, value: float) -> float:
+        return min(self._maximum[axis], max(.0, value))
+
+    def _wake_(self) -> None: ZAnimationDriver().register(self)
+
+    def _notify_(self, before: tuple[float, float]) -> None:
+        if tuple(self._offset) != before: self.offsetChanged.emit(self.offset())
+
+    def _stop_fling_(self) -> None:
+        self._fling = False
+        self._velocity = [.0, .0]
+
+    def _start_fling_(self) -> None:
+        now = self._clock.nsecsElapsed() / 1e6
+        samples = [sample for sample in self._samples if now - sample[0] <= self._sample_window]
+        self._samples.clear()
+        if len(samples) < 2: return
+        # 按最近一段时间的平均速度起步，单个事件的抖动不会放大为过快的惯性
+        span = max(reference_interval, now - samples[0][0])
+        self._velocity = [sum(sample[1] for sample in samples) / span, sum(sample[2] for sample in samples) / span]
+        self._fling = any(abs(v) >= self._min_velocity for v in self._velocity)
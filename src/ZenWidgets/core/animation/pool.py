@@ -0,0 +1,47 @@
+from typing import TypeVar
+from PySide6.QtCore import QObject
+from ZenWidgets.core.utils import SingletonMeta
+from .exppropertyanim import ZExpPropertyAnimation
+
+__all__ = ['ZAnimationPool']
+
+T = TypeVar('T', bound=ZExpPropertyAnimation)
+
+class ZAnimationPool(metaclass=SingletonMeta):
+    '''
+    指数属性动画对象池
+
+    - 控制器在第一次需要动画时 `acquire` ，动画结束后 `release` ，空闲的动画对象按类型缓存复用
+    - 归还时会停止动画、断开所有外部连接并解除与目标的绑定，再次取出时重新绑定目标属性
+    '''
+    def __init__(self, capacity: int = 256):
+        self._capacity: int = capacity
+        self._free: dict[type, list[ZExpPropertyAnimation]] = {}
+        self._created: int = 0
+
+    def capacity(self) -> int: return self._capacity
+
+    def setCapacity(self, capacity: int) -> None:
+        '''每种动画类型最多缓存的空闲对象数量'''
+        self._capacity = max(0, capacity)
+        for free in self._free.values(): del free[self._capacity:]
+
+    def createdCount(self) -> int: return self._created
+
+    def freeCount(self) -> int: return sum(len(free) for free in self._free.values())
+
+    def acquire(self, animation_type: type[T], target: QObject, property_name: str) -> T:
+        '''取出一个绑定到 target 属性上的动画，池中没有空闲对象时新建'''
+        free = self._free.get(animation_type)
+        if free:
+            animation = free.pop()
+            animation._rebind_(target, property_name)
+            return animation
+        self._created += 1
+        return animation_type(target, property_name)
+
+    def release(self, animation: ZExpPropertyAnimation) -> None:
+        '''归还动画，超出容量的对象直接丢弃'''
+        animation._recycle_()
+        free = self._free.setdefault(type(animation), [])
+        if len(free) < self._capacity: free.append(animation)
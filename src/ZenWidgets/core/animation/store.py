@@ -0,0 +1,95 @@
+import numpy
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .exppropertyanim import ZExpPropertyAnimation
+
+__all__ = ['ZExpAnimationStore']
+
+class ZExpAnimationStore:
+    '''
+    指数动画的结构化数组存储
+
+    - 所有运行中动画的当前值、目标值、速度、因子、偏置和惯性按顺序紧凑地存放在连续的 float64 数组中
+    - 每帧只做一次向量化的步进运算，再把每个动画对应的切片交还给它的输出转换函数
+    - 打包后动画持有的 `_current_value` 、 `_end_value` 、 `_velocity` 都是存储数组的视图，
+      动画参数在运行时被修改时需要调用 `invalidate` ，下一帧会重新打包
+    - 按时间步进的动画根据经过的毫秒数与基准帧间隔 `reference_interval` 换算帧数 k ，使用指数衰减的闭式解一次推进 k 帧
+    '''
+    def __init__(self, reference_interval: float = 1000 / 60):
+        self._reference_interval = reference_interval
+        self._animations: dict['ZExpPropertyAnimation', None] = {}
+        self._packed: list['ZExpPropertyAnimation'] = []
+        self._dirty: bool = False
+        self._current = numpy.empty(0)
+        self._end = numpy.empty(0)
+        self._velocity = numpy.empty(0)
+        self._factor = numpy.empty(0)
+        self._bias = numpy.empty(0)
+        self._inertia = numpy.empty(0)
+        self._delta_time = numpy.empty(0, dtype="bool")
+        self._offsets = numpy.empty(0, dtype="intp")
+
+    def __len__(self) -> int: return len(self._animations)
+
+    def __contains__(self, animation: 'ZExpPropertyAnimation') -> bool: return animation in self._animations
+
+    def animations(self) -> tuple['ZExpPropertyAnimation', ...]: return tuple(self._animations)
+
+    def add(self, animation: 'ZExpPropertyAnimation') -> None:
+        self._animations[animation] = None
+        self._dirty = True
+
+    def remove(self, animation: 'ZExpPropertyAnimation') -> None:
+        if animation not in self._animations: return
+        del self._animations[animation]
+        self._dirty = True
+
+    def invalidate(self) -> None:
+        '''标记存储需要在下一帧重新打包'''
+        self._dirty = True
+
+    def step(self, delta: int) -> None:
+        '''批量推进所有运行中的动画一帧'''
+        if self._dirty: self._pack_()
+        if not self._packed: return
+        cur, end, vel = self._current, self._end, self._velocity
+        factor, bias = self._factor, self._bias
+        frames = numpy.where(self._delta_time, max(delta, 1) / self._reference_interval, 1.0)
+        distance = end - cur
+        abs_distance = numpy.abs(distance)
+        # 逐帧递推 |d| -> |d|(1-f) - b 在 k 帧后的闭式解，k 为 1 时即为基本指数动画运算
+        step = (abs_distance + bias / factor) * (1 - (1 - factor) ** frames)
+        snap = (abs_distance <= bias * frames) | (step >= abs_distance)
+        numpy.copysign(step, distance, out=step)                                  # 确定动画方向
+        numpy.copyto(step, distance, where=snap)                                  # 差距小于偏置的项，返回差距
+        inertia = self._inertia ** frames
+        vel *= inertia
+        vel += step * (1 - inertia)
+        cur += vel
+        numpy.copyto(cur, end, where=snap & (self._inertia == 0))                 # 消除浮点误差，保证精确到达终点
+        done = numpy.logical_and.reduceat(cur == end, self._offsets)
+        for animation, finished in zip(self._packed, done.tolist()):
+            animation._apply_(finished)
+
+    # region private
+    def _pack_(self) -> None:
+        self._dirty = False
+        self._packed = list(self._animations)
+        if not self._packed: return
+        shapes = [numpy.shape(a._current_value) for a in self._packed]
+        sizes = [int(numpy.prod(shape)) for shape in shapes]
+        self._current = numpy.concatenate([numpy.ravel(a._current_value) for a in self._packed]).astype("float64")
+        self._end = numpy.concatenate([numpy.ravel(numpy.broadcast_to(a._end_value, shape))
+                                       for a, shape in zip(self._packed, shapes)]).astype("float64")
+        self._velocity = numpy.concatenate([numpy.ravel(numpy.broadcast_to(a._velocity, shape))
+                                            for a, shape in zip(self._packed, shapes)]).astype("float64")
+        self._factor = numpy.repeat([a.factor for a in self._packed], sizes).astype("float64")
+        self._bias = numpy.repeat([a.bias for a in self._packed], sizes).astype("float64")
+        self._inertia = numpy.repeat([a._velocity_inertia for a in self._packed], sizes).astype("float64")
+        self._delta_time = numpy.repeat([a._delta_time for a in self._packed], sizes).astype("bool")
+        self._offsets = numpy.concatenate(([0], numpy.cumsum(sizes)[:-1])).astype("intp")
+        # 动画的数值改为存储数组的视图，步进结果无需再拷贝回去
+        for animation, shape, start, size in zip(self._packed, shapes, self._offsets.tolist(), sizes):
+            animation._current_value = self._current[start:start + size].reshape(shape)
+            animation._end_value = self._end[start:start + size].reshape(shape)
+            animation._velocity = self._velocity[start:start + size].reshape(shape)
@@ -0,0 +1,15 @@
+from PySide6.QtCore import QObject
+from PySide6.QtWidgets import QWidget
+
+__all__ = ['ownerWidget', 'isWidgetHidden']
+
+def ownerWidget(obj: QObject | None) -> QWidget | None:
+    '''沿父对象链查找动画目标所属的控件，控制器的父对象即为其控件'''
+    while obj is not None and not obj.isWidgetType():
+        obj = obj.parent()
+    return obj
+
+def isWidgetHidden(widget: QWidget | None) -> bool:
+    '''控件不可见或所在窗口已最小化时，动画的中间过程不会被看到'''
+    if widget is None: return False
+    return not widget.isVisible() or widget.window().isMinimized()
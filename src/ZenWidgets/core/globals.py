@@ -1,31 +1,58 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 if TYPE_CHECKING:
     from ZenWidgets.component.info import ZToolTip
 from PySide6.QtGui import QIcon
 from ZenWidgets.core.debug import ZDebug
-from ZenWidgets.gui import ZThemeManager,ZIconPack,ZPalette,ZStyleDataManager
+from ZenWidgets.gui import ZThemeManager,ZIconPack,ZPalette,ZStyleDataManager,loadBuiltinResources
 
 __All__ = ['ZGlobal']
 
+class _ZLazyGlobal:
+    '''
+    ZGlobal 的延迟类属性
+
+    首次访问时调用 `loader(ZGlobal)` ，由它把真正的对象写入同名的类属性，之后的访问不再经过描述器
+    '''
+    __slots__ = ('name', 'loader')
+    def __init__(self, loader: Callable[[type], None]):
+        self.name: str = ''
+        self.loader = loader
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner: type):
+        self.loader(owner)
+        return owner.__dict__[self.name]
+
+
 class ZGlobal(object):
+    '''
+    全局对象
+
+    - 主题管理器、样式数据管理器与图标包都在首次访问时才创建，导入 ZenWidgets 本身不创建任何单例
+    - 首次访问 `themeManager` 、 `styleDataManager` 或 `palette` 时调用 `initZenWidgets` 完成日志与调色板的初始化
+    '''
     tooltip: 'ZToolTip' = None
-    themeManager = ZThemeManager()
-    iconPack = ZIconPack()
-    palette = ZPalette
-    styleDataManager = ZStyleDataManager()
+    palette: type[ZPalette] = _ZLazyGlobal(lambda cls: cls.initZenWidgets())
+    themeManager: ZThemeManager = _ZLazyGlobal(lambda cls: cls.initZenWidgets())
+    styleDataManager: ZStyleDataManager = _ZLazyGlobal(lambda cls: cls.initZenWidgets())
+    iconPack: ZIconPack = _ZLazyGlobal(lambda cls: setattr(cls, 'iconPack', ZIconPack()))
+    _initialized: bool = False
 
     @staticmethod
     def getBuiltinIcon(icon_path: str) -> QIcon:
         """获取内置资源中的图标"""
+        loadBuiltinResources()
         return QIcon(icon_path)
 
     @classmethod
     def initZenWidgets(cls):
+        if cls._initialized: return
+        cls._initialized = True
         ZDebug._init_logging_()
-        theme = cls.themeManager.getThemeName()
-        if theme == 'Dark':
-            ZPalette.loadDarkPalette()
-        else:
-            ZPalette.loadLightPalette()
-
-ZGlobal.initZenWidgets()
\ No newline at end of file
+        # 样式数据管理器必须先于其他对象连接主题改变信号，主题切换时它最先更新样式数据索引
+        cls.themeManager = ZThemeManager()
+        cls.styleDataManager = ZStyleDataManager()
+        # 样式数据管理器创建时已按当前主题加载了调色板
+        cls.palette = ZPalette
@@ -1 +1,2 @@
-from .property import make_getter
\ No newline at end of file
+from .property import make_getter
+from .lazy import lazyExports
\ No newline at end of file
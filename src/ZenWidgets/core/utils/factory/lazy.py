@@ -0,0 +1,28 @@
+import sys
+import importlib
+from typing import Any, Callable
+
+def lazyExports(package: str, exports: dict[str, tuple[str, ...]], unstarred: tuple[str, ...] = ()) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    '''
+    为包生成按需导入的 `__getattr__` 、 `__dir__` 与 `__all__`
+
+    - 导入包时不导入任何子模块，首次访问某个名称时才导入其所在的模块，结果缓存在包的命名空间中
+    - `from package import *` 按 `__all__` 逐个访问，效果与原先的星号导入相同
+
+    :param package: 包名，通常传入 `__name__`
+    :param exports: 模块 -> 该模块导出的名称，以 "." 开头的模块相对于 package
+    :param unstarred: 可以按名称访问但不列入 `__all__` 的名称，例如只能在特定平台上导入的模块
+    '''
+    index = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = index.get(name)
+        if module is None: raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(index))
+
+    return __getattr__, __dir__, [name for name in index if name not in unstarred]
@@ -1,4 +1,17 @@
-from .theme import *
-from .effect import *
-from .styledata import *
-from .resource import *
\ No newline at end of file
+from ZenWidgets.core.utils.factory.lazy import lazyExports
+
+__getattr__, __dir__, __all__ = lazyExports(__name__, {
+    '.theme': ('ZTheme', 'ZThemeMode', 'ABCThemeSource', 'ZStyleHintsThemeSource', 'ZRegistryThemeSource',
+               'ZThemeManager'),
+    '.effect': ('ZWidgetEffect',),
+    '.styledata': ('ZPaletteKey', 'ZStyleDataKey', 'ZPalette', 'ZThemePalette', 'ZStyleDataManager',
+                   'ZStyleDataFactory', 'ZFramelessWindowStyleData', 'ZTitleBarButtonStyleData',
+                   'ZToolTipStyleData', 'ZPanelStyleData', 'ZScrollPanelStyleData', 'ZCardStyleData',
+                   'ZButtonStyleData', 'ZRepeatButtonStyleData', 'ZLongPressButtonStyleData',
+                   'ZProgressButtonStyleData', 'ZSwitchStyleData', 'ZComboBoxStyleData', 'ZComboBoxViewStyleData',
+                   'ZComboBoxItemStyleData', 'ZToggleButtonStyleData', 'ZSliderStyleData', 'ZLineEditStyleData',
+                   'ZLoginEditStyleData', 'ZNumberEditStyleData', 'ZHeadLineStyleData', 'ZTextBlockStyleData',
+                   'ZDialogStyleData', 'ZNavigationBarStyleData', 'ZNavBarButtonStyleData',
+                   'ZNavBarToggleButtonStyleData', 'StyleDataT'),
+    '.resource': ('ZIconPack', 'ZIconRasterJob', 'loadBuiltinResources'),
+})
@@ -1,7 +1,7 @@
 import math
-from PySide6.QtCore import *
-from PySide6.QtGui import *
-from PySide6.QtWidgets import *
+from PySide6.QtCore import Qt,QPoint,QRect,QRectF
+from PySide6.QtGui import QColor,QPainter
+from PySide6.QtWidgets import QGraphicsBlurEffect,QGraphicsDropShadowEffect,QGraphicsOpacityEffect,QWidget
 
 __all__ = ['ZWidgetEffect']
 
@@ -1,2 +1,8 @@
-from .icons_rc import *
-from .parser import ZIconPack
\ No newline at end of file
+from .parser import ZIconPack
+from .raster import ZIconRasterJob
+
+__all__ = ['ZIconPack', 'ZIconRasterJob', 'loadBuiltinResources']
+
+def loadBuiltinResources() -> None:
+    '''注册内置的 Qt 资源（ ":/icons/..." ），首次使用内置资源前调用，重复调用无副作用'''
+    from . import icons_rc
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from PySide6.QtGui import QPixmap
+
+__all__ = ['ZIconCache']
+
+class ZIconCache:
+    '''
+    渲染结果的 LRU 缓存
+
+    - 按内存预算淘汰：每个条目按 `宽 × 高 × 4` 字节计入，超出预算时淘汰最久未使用的条目
+    - 记录命中、未命中与淘汰次数，用于评估缓存预算是否合适
+    '''
+    def __init__(self, budget: int = 16 * 1024 * 1024):
+        self._budget: int = budget
+        self._cost: int = 0
+        self._entries: OrderedDict[Hashable, tuple[QPixmap, int]] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __len__(self) -> int: return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool: return key in self._entries
+
+    def budget(self) -> int: return self._budget
+
+    def cost(self) -> int:
+        '''当前缓存占用的字节数'''
+        return self._cost
+
+    def setBudget(self, budget: int) -> None:
+        '''设置内存预算（字节），为 0 时不缓存'''
+        self._budget = max(0, budget)
+        self._evict_()
+
+    def get(self, key: Hashable) -> QPixmap | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, pixmap: QPixmap) -> None:
+        cost = pixmap.width() * pixmap.height() * 4
+        # 单个条目超过预算时不缓存，避免把整个缓存挤空
+        if cost > self._budget: return
+        self.remove(key)
+        self._entries[key] = (pixmap, cost)
+        self._cost += cost
+        self._evict_()
+
+    def remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None: self._cost -= entry[1]
+
+    def removeIf(self, predicate) -> None:
+        '''删除键满足 predicate 的所有条目'''
+        for key in [key for key in self._entries if predicate(key)]: self.remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._cost = 0
+
+    def stats(self) -> dict[str, int | float]:
+        '''命中次数、未命中次数、命中率、淘汰次数、条目数量与占用字节数'''
+        lookups = self._hits + self._misses
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'hitRate': self._hits / lookups if lookups else .0,
+            'evictions': self._evictions,
+            'entries': len(self._entries),
+            'cost': self._cost,
+            'budget': self._budget,
+        }
+
+    def resetStats(self) -> None:
+        self._hits = self._misses = self._evictions = 0
+
+    def _evict_(self) -> None:
+        while self._cost > self._budget and self._entries:
+            _, (_, cost) = self._entries.popitem(last=False)
+            self._cost -= cost
+            self._evictions += 1
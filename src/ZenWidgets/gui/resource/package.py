@@ -0,0 +1,211 @@
+import os
+import sys
+import mmap
+import zlib
+import struct
+import logging
+from collections.abc import Mapping, Iterator
+
+__all__ = [
+    'ZCompiledIconPackage',
+    'ZTextIconPackage',
+    'compileIconPackage',
+    'openIconPackage',
+]
+
+compiled_suffix = '.zicons'
+'''编译后的图标包扩展名，内置图标包在构建时编译，编译结果与文本图标包同名存放，随包发布'''
+
+_magic = b'ZICN'
+_version = 2
+_header = struct.Struct('<4sHHIQQI')
+'''魔数、版本、保留、图标数量、源文件大小、源文件修改时间（纳秒）、源文件 CRC32'''
+_entry = struct.Struct('<IIII')
+'''名称偏移、名称长度、数据偏移、数据长度，偏移均相对于文件开头'''
+
+
+def _crc_(path: str) -> int:
+    with open(path, 'rb') as file: return zlib.crc32(file.read())
+
+
+def _cache_path(source: str) -> str | None:
+    '''运行时编译结果的存放位置：用户缓存目录，文件名带上源文件路径的校验值以区分同名图标包'''
+    # 构建时编译图标包不依赖 PySide6 ，只在运行时需要缓存目录时才导入
+    from PySide6.QtCore import QStandardPaths
+    folder = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    if not folder: return None
+    source = os.path.abspath(source)
+    name = f'{os.path.splitext(os.path.basename(source))[0]}-{zlib.crc32(source.encode("utf-8")):08x}{compiled_suffix}'
+    return os.path.join(folder, 'ZenWidgets', 'icons', name)
+
+
+def _parse_text(path: str) -> dict[str, str]:
+    '''解析文本图标包：每行 `名称////SVG模板` ，以 ## 开头的行为注释'''
+    icons = {}
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line[0:2] == "##" or line.strip() == "": continue
+            icon_name, icon_data = line.strip().split("////")
+            icons[icon_name] = icon_data
+    return icons
+
+
+# region ZCompiledIconPackage
+class ZCompiledIconPackage(Mapping):
+    '''
+    编译后的图标包，通过 mmap 只读映射
+
+    - 文件头之后是按名称排序的定长索引，查找时在映射上二分，打开文件不解析任何图标
+    - 图标数据只在被请求时解码，未使用的图标不占用 Python 内存
+    '''
+    def __init__(self, path: str):
+        self._path = path
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _header.size:
+            self.close()
+            raise ValueError(f"不是有效的图标包: {path}")
+        magic, version, _, count, self._source_size, self._source_mtime, self._source_crc = _header.unpack_from(self._mmap, 0)
+        if magic != _magic or version != _version:
+            self.close()
+            raise ValueError(f"不是有效的图标包或版本不受支持: {path}")
+        self._count: int = count
+
+    def __len__(self) -> int: return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count): yield self._name_(i).decode('utf-8')
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._find_(name.encode('utf-8')) >= 0
+
+    def __getitem__(self, name: str) -> str:
+        i = self._find_(name.encode('utf-8')) if isinstance(name, str) else -1
+        if i < 0: raise KeyError(name)
+        _, _, offset, length = _entry.unpack_from(self._mmap, _header.size + i * _entry.size)
+        return self._mmap[offset:offset + length].decode('utf-8')
+
+    def path(self) -> str: return self._path
+
+    def isFresh(self, source: str, shipped: bool = False) -> bool:
+        '''
+        编译结果是否与文本源文件一致，只比较文件元数据，不读取源文件
+
+        :param shipped: 是否为构建时生成、随包发布的编译结果。安装或检出后修改时间不再可靠，
+            这类编译结果以构建时记录的内容为准，源文件大小一致即视为一致；
+            运行时编译到用户缓存的结果还要求修改时间一致
+        '''
+        stat = os.stat(source)
+        if stat.st_size != self._source_size: return False
+        return shipped or stat.st_mtime_ns == self._source_mtime
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    # region private
+    def _name_(self, i: int) -> bytes:
+        offset, length, _, _ = _entry.unpack_from(self._mmap, _header.size + i * _entry.size)
+        return self._mmap[offset:offset + length]
+
+    def _find_(self, key: bytes) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            name = self._name_(mid)
+            if name < key: lo = mid + 1
+            elif name > key: hi = mid
+            else: return mid
+        return -1
+
+
+# region ZTextIconPackage
+class ZTextIconPackage(Mapping):
+    '''文本图标包，首次访问时才读取并解析整个文件，作为没有编译结果时的后备'''
+    def __init__(self, path: str):
+        self._path = path
+        self._icons: dict[str, str] | None = None
+
+    def __len__(self) -> int: return len(self._load_())
+
+    def __iter__(self) -> Iterator[str]: return iter(self._load_())
+
+    def __contains__(self, name: object) -> bool: return name in self._load_()
+
+    def __getitem__(self, name: str) -> str: return self._load_()[name]
+
+    def path(self) -> str: return self._path
+
+    def _load_(self) -> dict[str, str]:
+        if self._icons is None: self._icons = _parse_text(self._path)
+        return self._icons
+
+
+def compileIconPackage(source: str, target: str | None = None) -> str:
+    '''
+    把文本图标包编译为带索引的二进制图标包
+
+    :param source: 文本图标包路径
+    :param target: 输出路径，默认与源文件同名、扩展名为 `.zicons`
+    :return: 输出路径
+    '''
+    if target is None: target = os.path.splitext(source)[0] + compiled_suffix
+    stat = os.stat(source)
+    crc = _crc_(source)
+    icons = sorted((name.encode('utf-8'), data.encode('utf-8')) for name, data in _parse_text(source).items())
+    names_offset = _header.size + len(icons) * _entry.size
+    data_offset = names_offset + sum(len(name) for name, _ in icons)
+    index = bytearray()
+    for name, data in icons:
+        index += _entry.pack(names_offset, len(name), data_offset, len(data))
+        names_offset += len(name)
+        data_offset += len(data)
+    # 先写入临时文件再替换，其他进程不会映射到写了一半的文件
+    temp = f'{target}.{os.getpid()}.tmp'
+    with open(temp, 'wb') as file:
+        file.write(_header.pack(_magic, _version, 0, len(icons), stat.st_size, stat.st_mtime_ns, crc))
+        file.write(index)
+        for name, _ in icons: file.write(name)
+        for _, data in icons: file.write(data)
+    os.replace(temp, target)
+    return target
+
+
+def openIconPackage(path: str, compile: bool = True) -> Mapping:
+    '''
+    打开图标包，优先使用与文本源文件一致的编译结果
+
+    - 依次查找与源文件同名存放的编译结果（构建时生成，随包发布）与用户缓存目录中的编译结果
+    - 都不可用时编译到用户缓存目录，运行时不会写入源文件所在的目录（例如 site-packages）
+
+    :param path: 文本图标包或编译后图标包的路径
+    :param compile: 编译结果缺失或过期时是否编译到用户缓存目录，无法编译时退回到文本图标包
+    '''
+    if path.endswith(compiled_suffix): return ZCompiledIconPackage(path)
+    cache = _cache_path(path)
+    shipped = os.path.splitext(path)[0] + compiled_suffix
+    for target in (shipped, cache):
+        if target is None or not os.path.exists(target): continue
+        try:
+            package = ZCompiledIconPackage(target)
+            if package.isFresh(path, target == shipped): return package
+            package.close()
+        except (OSError, ValueError) as e:
+            logging.warning(f"编译后的图标包无法使用: {e}")
+    if compile and cache is not None:
+        try:
+            os.makedirs(os.path.dirname(cache), exist_ok=True)
+            return ZCompiledIconPackage(compileIconPackage(path, cache))
+        except OSError as e:
+            logging.info(f"图标包无法编译，使用文本格式: {e}")
+    return ZTextIconPackage(path)
+
+
+if __name__ == '__main__':
+    # python -m ZenWidgets.gui.resource.package [文本图标包 ...]
+    # 不指定文件时把所有内置图标包编译到源文件旁，构建时由 setup.py 编译到构建目录，编译结果不提交到仓库
+    sources = sys.argv[1:]
+    if not sources:
+        folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "packages")
+        sources = [os.path.join(folder, name) for name in sorted(os.listdir(folder)) if name.endswith('.icons')]
+    for source in sources:
+        print(f"{source} -> {compileIconPackage(source)}")
@@ -1,22 +1,41 @@
 import os
+from collections import ChainMap, OrderedDict
+from collections.abc import Iterable
 
-from PySide6.QtCore import QByteArray, QSize, Qt
-from PySide6.QtGui import QPainter, QPixmap, QIcon
+from PySide6.QtCore import QByteArray, QSize, QThreadPool, Qt
+from PySide6.QtGui import QPixmap, QIcon
 from PySide6.QtSvg import QSvgRenderer
+from .package import openIconPackage, compiled_suffix
+from .cache import ZIconCache
+from .raster import ZIconRasterJob, color_placeholder, isMonochromeIcon, paintIcon
 
 
 class ZIconPack:
+    '''
+    图标包
+
+    - 内置图标包优先使用编译后的 `.zicons` 格式，通过 mmap 映射，查找时才解码单个图标
+    - 随包发布的编译结果缺失或过期时编译到用户缓存目录，无法编译时退回到按需解析的文本格式
+    - `toPixmap` 的结果按 (名称, 尺寸, 颜色, 设备像素比) 缓存在 `cache()` 中，按内存预算淘汰
+    - 单色图标只解析一次 SVG ，换色时用同一个渲染器绘制后再着色
+    - 大量图标可以通过 `rasterize` 在线程池中渲染，结果分批发回 GUI 线程
+    '''
     current_module_path = os.path.dirname(os.path.abspath(__file__))
     package_folder_path = os.path.join(current_module_path, "packages")
 
     def __init__(self):
         self._default_color = '#a8a8a8'
 
-        self._icons = {}
+        # 后加载的图标包排在前面，与逐个写入字典时后者覆盖前者的行为一致
+        self._icons = ChainMap({})
         self._icons_classified = {
             "__unclassified__": {}
         }
 
+        self._cache = ZIconCache()
+        self._renderers: OrderedDict[tuple[str, str | None], QSvgRenderer] = OrderedDict()
+        self._renderer_capacity: int = 512
+
         # load internal icon packages
         self.reload_internals()
 
@@ -28,27 +47,33 @@ class ZIconPack:
     def defaultColor(self) -> str:
         return self._default_color
 
+    def cache(self) -> ZIconCache:
+        '''渲染结果缓存，可以通过它调整内存预算或查看命中统计'''
+        return self._cache
+
+    def setRendererCapacity(self, capacity: int) -> None:
+        '''设置缓存的 SVG 渲染器数量上限'''
+        self._renderer_capacity = max(0, capacity)
+        while len(self._renderers) > self._renderer_capacity: self._renderers.popitem(last=False)
+
     def reload_internals(self) -> None:
         '''重新加载内置图标包'''
-        for package_filename in os.listdir(self.package_folder_path):
+        for package_filename in sorted(os.listdir(self.package_folder_path)):
             full_path = os.path.join(self.package_folder_path, package_filename)
+            # 编译结果与文本源文件放在一起，由文本源文件负责打开
+            if package_filename.endswith(compiled_suffix) and os.path.exists(os.path.splitext(full_path)[0] + ".icons"):
+                continue
             if os.path.isfile(full_path):
                 self.load_from_file(full_path)
 
     def load_from_file(self, path) -> None:
-        '''从文件加载图标包'''
+        '''从文件加载图标包，支持文本格式与编译后的格式'''
         class_name = os.path.basename(path)
         self.append_class(class_name)
-        with open(path, encoding="utf-8") as file:
-            for line in file.readlines():
-                if line[0:2] == "##":
-                    continue
-                if line.strip() == "":
-                    continue
-
-                line = line.strip()
-                icon_name, icon_data = line.split("////")
-                self.append(icon_name, icon_data, class_name)
+        package = openIconPackage(path)
+        # 图标包本身只读，通过 append 添加到该分类的图标写入前面的字典
+        self._icons_classified[class_name] = ChainMap({}, package)
+        self._icons.maps.insert(1, package)
 
     def append_class(self, class_name, force=False) -> None:
         '''添加图标包分类'''
@@ -60,16 +85,23 @@ class ZIconPack:
         '''添加图标'''
         self._icons[name] = data
         self._icons_classified[class_name][name] = data
+        # 同名图标被替换，丢弃旧的渲染结果
+        for key in [key for key in self._renderers if key[0] == name]: del self._renderers[key]
+        self._cache.removeIf(lambda key: key[0] == name)
 
     def get(self, name, color_code: str = None) -> bytes:
         '''获取图标数据'''
         color_code = self._default_color if color_code is None else color_code
-        return self._icons[name].replace("<<<COLOR_CODE>>>", color_code).encode()
+        return self._icons[name].replace(color_placeholder, color_code).encode()
 
     def getFromData(self, data, color_code: str = None) -> bytes:
         '''从数据获取图标数据'''
         color_code = self._default_color if color_code is None else color_code
-        return data.replace("<<<COLOR_CODE>>>", color_code).encode()
+        return data.replace(color_placeholder, color_code).encode()
+
+    def getTemplate(self, name) -> str | None:
+        '''获取带颜色占位符的图标模板，图标不存在时返回 None'''
+        return self._icons.get(name)
 
     def getByteArray(self, name, color_code: str = None) -> QByteArray:
         '''获取图标数据'''
@@ -87,25 +119,39 @@ class ZIconPack:
         '''获取图标包分类名称列表'''
         return self._icons_classified.keys()
 
-    def toPixmap(self, name: str, size: QSize = QSize(64, 64), color_code: str = None):
+    def iconNames(self, class_name: str | None = None) -> list[str]:
+        '''
+        按名称排序的图标名称列表
+        Args:
+            class_name: 分类名称，为 None 时返回所有图标
+        '''
+        if class_name is None: return sorted(self._icons.keys())
+        if class_name not in self._icons_classified:
+            raise ValueError(f"分类 {class_name} 不存在")
+        return sorted(self._icons_classified[class_name].keys())
+
+    def toPixmap(self, name: str, size: QSize = QSize(64, 64), color_code: str = None, device_pixel_ratio: float = 1.0):
         '''
         将图标转换为Pixmap
         Args:
             name: 图标名称
             size: 图标大小
             color_code: 图标颜色
+            device_pixel_ratio: 设备像素比，返回的 Pixmap 按物理像素渲染
         Returns:
-            QPixmap
+            QPixmap ，与缓存隐式共享，在其上绘制或修改时自动分离，不影响缓存中的图标
         '''
-        svg_bytes = self.get(name, color_code)
-        pixmap = QPixmap(size)
+        color_code = self._default_color if color_code is None else color_code
+        key = (name, size.width(), size.height(), color_code, device_pixel_ratio)
+        pixmap = self._cache.get(key)
+        if pixmap is not None: return QPixmap(pixmap)
+        renderer, monochrome = self._renderer_(name, color_code)
+        pixmap = QPixmap(size * device_pixel_ratio)
         pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-        svg_renderer = QSvgRenderer(svg_bytes)
-        svg_renderer.render(painter)
-        painter.end()
-        return pixmap
+        paintIcon(pixmap, renderer, monochrome, color_code)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        self._cache.put(key, pixmap)
+        return QPixmap(pixmap)
 
     def toIcon(self, name: str, size: QSize = QSize(64, 64), color_code: str = None) -> QIcon:
         '''
@@ -129,7 +175,7 @@ class ZIconPack:
             迭代器，依次返回 (图标名称, 图标Pixmap) 元组
         '''
         # 按图标名称排序后迭代，确保顺序一致
-        for name in sorted(self._icons.keys()):
+        for name in self.iconNames():
             yield name, self.toPixmap(name, size, color_code)
 
     def iconsByClass(self, class_name: str, size: QSize = QSize(64, 64), color_code: str = None) -> iter:
@@ -142,8 +188,40 @@ class ZIconPack:
         Returns:
             迭代器，依次返回 (图标名称, 图标Pixmap) 元组
         '''
-        if class_name not in self._icons_classified:
-            raise ValueError(f"分类 {class_name} 不存在")
+        for name in self.iconNames(class_name):
+            yield name, self.toPixmap(name, size, color_code)
 
-        for name in sorted(self._icons_classified[class_name].keys()):
-            yield name, self.toPixmap(name, size, color_code)
\ No newline at end of file
+    def rasterize(self, names: Iterable[str] | None = None, size: QSize = QSize(64, 64), color_code: str = None,
+                  device_pixel_ratio: float = 1.0, chunk_size: int = 32, priority: int = 0,
+                  pool: QThreadPool | None = None) -> ZIconRasterJob:
+        '''
+        在线程池中渲染图标，不阻塞 GUI 线程
+        Args:
+            names: 图标名称，按给定顺序提交，为 None 时渲染所有图标
+            size: 图标大小
+            color_code: 图标颜色
+            device_pixel_ratio: 设备像素比
+            chunk_size: 每批图标数量，每批完成后发出一次 `chunkReady`
+            priority: 线程池中的优先级
+            pool: 线程池，默认使用全局线程池
+        Returns:
+            ZIconRasterJob，结果在事件循环中分批发出，渲染结果同时写入 `cache()`
+        '''
+        color_code = self._default_color if color_code is None else color_code
+        return ZIconRasterJob(self, self.iconNames() if names is None else names, size, color_code,
+                              device_pixel_ratio, chunk_size, priority, pool)
+
+    def _renderer_(self, name: str, color_code: str) -> tuple[QSvgRenderer, bool]:
+        '''返回图标的渲染器以及是否需要在渲染后着色'''
+        for key in ((name, None), (name, color_code)):
+            renderer = self._renderers.get(key)
+            if renderer is not None:
+                self._renderers.move_to_end(key)
+                return renderer, key[1] is None
+        template = self._icons[name]
+        monochrome = isMonochromeIcon(template)
+        renderer = QSvgRenderer(QByteArray(self.getFromData(template, '#000000' if monochrome else color_code)))
+        if self._renderer_capacity:
+            self._renderers[(name, None if monochrome else color_code)] = renderer
+            while len(self._renderers) > self._renderer_capacity: self._renderers.popitem(last=False)
+        return renderer, monochrome
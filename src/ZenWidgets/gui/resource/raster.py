@@ -0,0 +1,218 @@
+import re
+import threading
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+from PySide6.QtCore import QByteArray, QObject, QRunnable, QSize, QThreadPool, QTimer, Qt, Signal
+from PySide6.QtGui import QColor, QImage, QPainter, QPaintDevice, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+if TYPE_CHECKING:
+    from .parser import ZIconPack
+
+__all__ = ['ZIconRasterJob', 'isMonochromeIcon', 'paintIcon']
+
+color_placeholder = "<<<COLOR_CODE>>>"
+_fixed_color = re.compile(r'(?:fill|stroke|stop-color|flood-color|color)\s*[=:]\s*["\']?\s*(?!none|transparent|["\'<])')
+'''去掉颜色占位符后仍然出现的固定颜色，这样的图标无法通过着色复用同一个渲染器'''
+
+
+def isMonochromeIcon(template: str) -> bool:
+    '''图标模板是否只使用颜色占位符，这样的图标可以先以黑色渲染再整体着色'''
+    return color_placeholder in template and _fixed_color.search(template.replace(color_placeholder, '')) is None
+
+
+def paintIcon(device: QPaintDevice, renderer: QSvgRenderer, monochrome: bool, color_code: str) -> None:
+    '''
+    在已经填充为透明的绘制设备上绘制图标
+
+    只使用 QPainter 与 QSvgRenderer ，绘制到 QImage 时可以在非 GUI 线程中调用
+    '''
+    painter = QPainter(device)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    renderer.render(painter)
+    if monochrome:
+        # 渲染器以黑色绘制，只保留其透明度后填充目标颜色
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+        painter.fillRect(0, 0, device.width(), device.height(), QColor(color_code))
+    painter.end()
+
+
+# region _ZRasterTask
+class _ZRasterTask(QRunnable):
+    '''在线程池中把一批图标渲染为 QImage ，完成后通过任务所属的 job 发回 GUI 线程'''
+    def __init__(self, job: 'ZIconRasterJob', icons: list[tuple[str, str]]):
+        super().__init__()
+        self.setAutoDelete(False)
+        self._job = job
+        self._icons = icons
+
+    def run(self) -> None:
+        job = self._job
+        size, color_code, ratio = job._size * job._ratio, job._color_code, job._ratio
+        images = []
+        for name, template in self._icons:
+            if not job._claim_(name): continue
+            monochrome = isMonochromeIcon(template)
+            # 渲染器不能跨线程共享，每个图标在工作线程中单独解析
+            renderer = QSvgRenderer(QByteArray(template.replace(color_placeholder, '#000000' if monochrome else color_code).encode()))
+            image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+            image.fill(Qt.GlobalColor.transparent)
+            paintIcon(image, renderer, monochrome, color_code)
+            image.setDevicePixelRatio(ratio)
+            images.append((name, image))
+        try:
+            job._imagesReady.emit(self, images)
+        except RuntimeError:
+            # job 已经被销毁，结果无人接收
+            pass
+
+
+# region ZIconRasterJob
+class ZIconRasterJob(QObject):
+    '''
+    后台栅格化一组图标，由 `ZIconPack.rasterize` 创建
+
+    - 图标按 `chunkSize` 分批提交到线程池，在工作线程中渲染为 QImage ，
+      每批完成后在 GUI 线程转换为 QPixmap 、写入图标包的缓存并通过 `chunkReady` 发出
+    - 已经缓存的图标不再渲染，在下一轮事件循环中作为第一批发出
+    - `prioritize` 把可见的图标提前到一个更高优先级的批次，已提交批次中的同名图标会被跳过
+    - `cancel` 撤回尚未开始的批次，正在渲染的批次完成后丢弃结果，取消后不再发出任何信号
+    '''
+    chunkReady = Signal(list)
+    '''一批渲染完成的图标，list[tuple[str, QPixmap]] ，顺序与提交顺序一致，修改 QPixmap 不影响缓存'''
+    finished = Signal()
+    '''所有图标都已发出'''
+    _imagesReady = Signal(object, object)
+
+    def __init__(self, pack: 'ZIconPack', names: Iterable[str], size: QSize, color_code: str,
+                 device_pixel_ratio: float = 1.0, chunk_size: int = 32, priority: int = 0,
+                 pool: QThreadPool | None = None, parent: QObject | None = None):
+        super().__init__(parent)
+        self._pack = pack
+        self._size = QSize(size)
+        self._color_code = color_code
+        self._ratio = device_pixel_ratio
+        self._chunk_size = max(1, chunk_size)
+        self._priority = priority
+        self._pool = pool or QThreadPool.globalInstance()
+        self._lock = threading.Lock()
+        self._claimed: set[str] = set()
+        self._tasks: list[_ZRasterTask] = []
+        self._pending: int = 0
+        self._total: int = 0
+        self._delivered: int = 0
+        self._cancelled: bool = False
+        self._finished: bool = False
+        self._names: set[str] = set()
+        self._imagesReady.connect(self._on_images_ready_)
+        self._submit_(names, priority)
+
+    def size(self) -> QSize: return QSize(self._size)
+
+    def colorCode(self) -> str: return self._color_code
+
+    def devicePixelRatio(self) -> float: return self._ratio
+
+    def total(self) -> int:
+        '''需要发出的图标数量'''
+        return self._total
+
+    def delivered(self) -> int:
+        '''已经发出的图标数量'''
+        return self._delivered
+
+    def isFinished(self) -> bool: return self._finished
+
+    def isCancelled(self) -> bool: return self._cancelled
+
+    def prioritize(self, names: Iterable[str]) -> None:
+        '''
+        优先渲染指定的图标，例如滚动后进入可见区域的图标
+
+        :param names: 图标名称，已经渲染或正在渲染的图标会被忽略
+        '''
+        if self._cancelled or self._finished: return
+        with self._lock: names = [name for name in names if name in self._names and name not in self._claimed]
+        self._submit_(names, self._priority + 1, count=False)
+
+    def cancel(self) -> None:
+        '''取消渲染，可以重复调用'''
+        if self._cancelled or self._finished: return
+        with self._lock: self._cancelled = True
+        # 尚未开始的批次直接从线程池撤回
+        self._tasks = [task for task in self._tasks if not self._pool.tryTake(task)]
+
+    def waitForDone(self, msecs: int = -1) -> bool:
+        '''
+        阻塞等待线程池中的批次完成，结果仍然在事件循环中发出
+
+        :return: 是否在超时前完成
+        '''
+        return self._pool.waitForDone(msecs)
+
+    # region private
+    def _key_(self, name: str) -> tuple:
+        return (name, self._size.width(), self._size.height(), self._color_code, self._ratio)
+
+    def _claim_(self, name: str) -> bool:
+        '''工作线程渲染前认领图标，避免同一个图标被两个批次重复渲染'''
+        with self._lock:
+            if self._cancelled or name in self._claimed: return False
+            self._claimed.add(name)
+            return True
+
+    def _submit_(self, names: Iterable[str], priority: int, count: bool = True) -> None:
+        cache, icons, cached = self._pack.cache(), [], []
+        for name in names:
+            # 缓存命中不计入统计，真正取用时由 toPixmap 计入
+            key = self._key_(name)
+            if key in cache:
+                if self._claim_(name): cached.append(name)
+                continue
+            template = self._pack.getTemplate(name)
+            if template is not None: icons.append((name, template))
+        if count:
+            self._total = len(cached) + len(icons)
+            self._names.update(cached)
+            self._names.update(name for name, _ in icons)
+        if cached:
+            self._pending += 1
+            QTimer.singleShot(0, self, lambda: self._on_cached_(cached))
+        for i in range(0, len(icons), self._chunk_size):
+            task = _ZRasterTask(self, icons[i:i + self._chunk_size])
+            self._tasks.append(task)
+            self._pending += 1
+            self._pool.start(task, priority)
+        if self._pending == 0: QTimer.singleShot(0, self, self._finish_)
+
+    def _on_cached_(self, names: list[str]) -> None:
+        cache = self._pack.cache()
+        pixmaps = []
+        for name in names:
+            pixmap = cache.get(self._key_(name))
+            # 等待期间可能被淘汰，此时在 GUI 线程直接渲染
+            pixmaps.append((name, QPixmap(pixmap) if pixmap is not None else
+                            self._pack.toPixmap(name, self._size, self._color_code, self._ratio)))
+        self._deliver_(pixmaps)
+
+    def _on_images_ready_(self, task: _ZRasterTask, images: list[tuple[str, QImage]]) -> None:
+        if task in self._tasks: self._tasks.remove(task)
+        if self._cancelled: return
+        cache, pixmaps = self._pack.cache(), []
+        for name, image in images:
+            pixmap = QPixmap.fromImage(image)
+            cache.put(self._key_(name), pixmap)
+            # 发出隐式共享的副本，接收方修改时不会改动缓存
+            pixmaps.append((name, QPixmap(pixmap)))
+        self._deliver_(pixmaps)
+
+    def _deliver_(self, pixmaps: list[tuple[str, QPixmap]]) -> None:
+        if self._cancelled: return
+        self._pending -= 1
+        self._delivered += len(pixmaps)
+        if pixmaps: self.chunkReady.emit(pixmaps)
+        if self._pending == 0: self._finish_()
+
+    def _finish_(self) -> None:
+        if self._finished or self._cancelled: return
+        self._finished = True
+        self.finished.emit()
@@ -1,5 +1,8 @@
+import json
+import hashlib
+import inspect
 from enum import Enum
-from dataclasses import dataclass,fields,is_dataclass
+from dataclasses import dataclass,fields,is_dataclass,replace
 import logging
 from typing import TypeVar,Dict,Union
 from PySide6.QtGui import QColor
@@ -10,7 +13,9 @@ __all__ = [
     'ZPaletteKey',
     'ZStyleDataKey',
     'ZPalette',
+    'ZThemePalette',
     'ZStyleDataManager',
+    'ZStyleDataFactory',
     'ZFramelessWindowStyleData',
     'ZTitleBarButtonStyleData',
     'ZToolTipStyleData',
@@ -179,6 +184,51 @@ dark_palette = {
     ZPaletteKey.Danger: '#D16161'
 }
 
+_builtin_palettes = {'Light': light_palette, 'Dark': dark_palette}
+_theme_palettes: Dict[str, 'ZThemePalette'] = {}
+
+
+# region ZThemePalette
+class ZThemePalette:
+    """
+    单个主题的调色板
+
+    - 每个主题一个实例，颜色只在创建时解析一次，之后只读
+    - 样式表中的动态颜色以调色板为参数求值，解析任意主题的样式数据都不需要改动全局的 `ZPalette`
+    """
+    __slots__ = ('_theme', *(key.value for key in ZPaletteKey))
+
+    def __init__(self, theme: str, palette_dict: Dict[ZPaletteKey, str]) -> None:
+        """
+        :param theme: 主题名称， 'Light' 或 'Dark'
+        :param palette_dict: 键为ZPaletteKey枚举，值为颜色字符串的字典，必须包含所有键
+        """
+        object.__setattr__(self, '_theme', theme)
+        for key in ZPaletteKey:
+            if key not in palette_dict: raise ValueError(f"调色板缺少键: {key.value}")
+            object.__setattr__(self, key.value, QColor(palette_dict[key]))
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} 是只读的")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._theme!r})"
+
+    def theme(self) -> str: return self._theme
+
+    def color(self, key: ZPaletteKey) -> QColor: return getattr(self, key.value)
+
+    def colors(self) -> Dict[ZPaletteKey, QColor]: return {key: getattr(self, key.value) for key in ZPaletteKey}
+
+    def Transparent(self) -> QColor:
+        """与主题同色的透明色"""
+        return ZPalette.Transparent_FFF if self._theme == 'Light' else ZPalette.Transparent_000
+
+    def Transparent_reverse(self) -> QColor:
+        """与主题反色的透明色"""
+        return ZPalette.Transparent_000 if self._theme == 'Light' else ZPalette.Transparent_FFF
+
+
 # region ZPalette
 class ZPalette(metaclass=NonInstantiableMeta):
     """全局唯一的调色板"""
@@ -262,296 +312,334 @@ class ZPalette(metaclass=NonInstantiableMeta):
     @classmethod
     def loadFromDict(cls, palette_dict: Dict[ZPaletteKey, str]) -> None:
         """
-        从字典加载调色板配置并更新成员变量
+        从字典加载调色板配置，修改当前主题的调色板并更新成员变量
+
+        - 未给出的键保持原值
+        - 已编译的样式数据随之失效，之后获取的样式数据使用新的颜色
 
         :param palette_dict: 键为ZPaletteKey枚举，值为颜色字符串的字典
         """
         # 获取所有字段名映射（用于校验）
         field_names = cls.__annotations__.keys()
 
-        for key, color_str in palette_dict.items():
+        for key in palette_dict:
             # 检查键是否有效
             if not isinstance(key, ZPaletteKey):
                 raise ValueError(f"无效的调色板键类型: {type(key)}, 应为ZPaletteKey")
             # 检查是否存在对应的成员变量
             if key.value not in field_names:
                 raise ValueError(f"调色板中不存在键: {key.value}")
-            # 转换颜色并赋值
-            setattr(cls, key.value, QColor(color_str))
+        theme = ZThemeManager().getThemeName()
+        colors = cls.byTheme(theme).colors()
+        colors.update(palette_dict)
+        cls.setThemePalette(theme, colors)
+
+    @classmethod
+    def loadThemePalette(cls, palette: ZThemePalette) -> None:
+        """
+        从主题调色板加载颜色到成员变量，颜色已解析，无需再次解析字符串
+        """
+        for key, color in palette.colors().items():
+            setattr(cls, key.value, QColor(color))
 
     @classmethod
     def loadLightPalette(cls) -> None:
         """
         加载内置浅色调色板
         """
-        cls.loadFromDict(light_palette)
+        cls.loadThemePalette(cls.byTheme('Light'))
 
     @classmethod
     def loadDarkPalette(cls) -> None:
         """
         加载内置深色调色板
         """
-        cls.loadFromDict(dark_palette)
+        cls.loadThemePalette(cls.byTheme('Dark'))
+
+    @classmethod
+    def byTheme(cls, theme: str) -> ZThemePalette:
+        """
+        获取指定主题的调色板，首次获取时创建
+        """
+        palette = _theme_palettes.get(theme)
+        if palette is None:
+            if theme not in _builtin_palettes: raise ValueError(f"不支持的主题: {theme}，必须是 'Light' 或 'Dark'")
+            palette = _theme_palettes[theme] = ZThemePalette(theme, _builtin_palettes[theme])
+        return palette
+
+    @classmethod
+    def setThemePalette(cls, theme: str, palette_dict: Dict[ZPaletteKey, str]) -> None:
+        """
+        替换指定主题的调色板，已编译的样式数据随之失效，下次使用时重新编译
+
+        :param palette_dict: 键为ZPaletteKey枚举，值为颜色字符串或QColor的字典，必须包含所有键
+        """
+        if theme not in _builtin_palettes: raise ValueError(f"不支持的主题: {theme}，必须是 'Light' 或 'Dark'")
+        _theme_palettes[theme] = ZThemePalette(theme, palette_dict)
+        if theme == ZThemeManager().getThemeName(): cls.loadThemePalette(_theme_palettes[theme])
+        ZStyleDataManager().clearCache()
 
 # region style_data_map
 style_data_map={
     'Light': {
         'ZFramelessWindow': {
-            ZStyleDataKey.Body: lambda: ZPalette.WindowBackground
+            ZStyleDataKey.Body: lambda p: p.WindowBackground
         },
         'ZTitleBarButton': {
             ZStyleDataKey.Icon: '#333333'
         },
         'ZToolTip': {
-            ZStyleDataKey.Body: lambda: ZPalette.PanelBody,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Text: lambda: ZPalette.Text
+            ZStyleDataKey.Body: lambda p: p.PanelBody,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Text: lambda p: p.Text
         },
         ('ZPanel','ZScrollPanel','ZComboBoxView'): {
-            ZStyleDataKey.Body: lambda: ZPalette.PanelBody,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Handle: lambda: ZPalette.ScrollHandle,
-            ZStyleDataKey.HandleBorder: lambda: ZPalette.ScrollHandle
+            ZStyleDataKey.Body: lambda p: p.PanelBody,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Handle: lambda p: p.ScrollHandle,
+            ZStyleDataKey.HandleBorder: lambda p: p.ScrollHandle
         },
         'ZCard': {
-            ZStyleDataKey.Body: lambda: ZPalette.CardBody,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Underline: lambda: ZPalette.Underline
+            ZStyleDataKey.Body: lambda p: p.CardBody,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Underline: lambda p: p.Underline
         },
         ('ZButton','ZRepeatButton','ZComboBox','ZComboBoxItem'): {
-            ZStyleDataKey.Body: lambda: ZPalette.Body,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Text: lambda: ZPalette.Text,
-            ZStyleDataKey.Icon: lambda: ZPalette.Icon,
-            ZStyleDataKey.Indicator: lambda: ZPalette.Primary
+            ZStyleDataKey.Body: lambda p: p.Body,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Text: lambda p: p.Text,
+            ZStyleDataKey.Icon: lambda p: p.Icon,
+            ZStyleDataKey.Indicator: lambda p: p.Primary
         },
         'ZLongPressButton': {
-            ZStyleDataKey.Body: lambda: ZPalette.Body,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Text: lambda: ZPalette.Text,
-            ZStyleDataKey.Icon: lambda: ZPalette.Icon,
-            ZStyleDataKey.Indicator: lambda: ZPalette.Primary,
-            ZStyleDataKey.Progress: lambda: ZPalette.Danger,
+            ZStyleDataKey.Body: lambda p: p.Body,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Text: lambda p: p.Text,
+            ZStyleDataKey.Icon: lambda p: p.Icon,
+            ZStyleDataKey.Indicator: lambda p: p.Primary,
+            ZStyleDataKey.Progress: lambda p: p.Danger,
         },
         'ZProgressButton': {
-            ZStyleDataKey.Body: lambda: ZPalette.Body,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Text: lambda: ZPalette.Text,
-            ZStyleDataKey.Icon: lambda: ZPalette.Icon,
-            ZStyleDataKey.Indicator: lambda: ZPalette.Primary,
-            ZStyleDataKey.Progress: lambda: ZPalette.Success,
+            ZStyleDataKey.Body: lambda p: p.Body,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Text: lambda p: p.Text,
+            ZStyleDataKey.Icon: lambda p: p.Icon,
+            ZStyleDataKey.Indicator: lambda p: p.Primary,
+            ZStyleDataKey.Progress: lambda p: p.Success,
         },
         'ZToggleButton': {
-            ZStyleDataKey.Body: lambda: ZPalette.Body,
-            ZStyleDataKey.BodyToggled: lambda: ZPalette.Primary,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Text: lambda: ZPalette.Text,
-            ZStyleDataKey.TextToggled: lambda: ZPalette.Text,
-            ZStyleDataKey.Icon: lambda: ZPalette.Icon,
-            ZStyleDataKey.IconToggled: lambda: ZPalette.Icon
+            ZStyleDataKey.Body: lambda p: p.Body,
+            ZStyleDataKey.BodyToggled: lambda p: p.Primary,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Text: lambda p: p.Text,
+            ZStyleDataKey.TextToggled: lambda p: p.Text,
+            ZStyleDataKey.Icon: lambda p: p.Icon,
+            ZStyleDataKey.IconToggled: lambda p: p.Icon
         },
         'ZSwitch':{
-            ZStyleDataKey.Body: lambda: ZPalette.Primary,
-            ZStyleDataKey.Border: lambda: ZPalette.BorderNeutral,
-            ZStyleDataKey.Handle: lambda: ZPalette.SwitchHandle,
+            ZStyleDataKey.Body: lambda p: p.Primary,
+            ZStyleDataKey.Border: lambda p: p.BorderNeutral,
+            ZStyleDataKey.Handle: lambda p: p.SwitchHandle,
             ZStyleDataKey.HandleToggled: ZPalette.White
         },
         'ZSlider': {
-            ZStyleDataKey.Track: lambda: ZPalette.BodyDarker,
-            ZStyleDataKey.TrackBorder: lambda: ZPalette.Border,
-            ZStyleDataKey.FillAreaStart: lambda: ZPalette.Primary,
-            ZStyleDataKey.FillAreaEnd: lambda: ZPalette.Secondary,
-            ZStyleDataKey.FillAreaBorder: lambda: ZPalette.Primary,
-            ZStyleDataKey.HandleInner: lambda: ZPalette.Secondary,
-            ZStyleDataKey.HandleOuter:lambda: ZPalette.SliderHandle,
-            ZStyleDataKey.HandleBorder: lambda: ZPalette.BorderEmphasized
+            ZStyleDataKey.Track: lambda p: p.BodyDarker,
+            ZStyleDataKey.TrackBorder: lambda p: p.Border,
+            ZStyleDataKey.FillAreaStart: lambda p: p.Primary,
+            ZStyleDataKey.FillAreaEnd: lambda p: p.Secondary,
+            ZStyleDataKey.FillAreaBorder: lambda p: p.Primary,
+            ZStyleDataKey.HandleInner: lambda p: p.Secondary,
+            ZStyleDataKey.HandleOuter:lambda p: p.SliderHandle,
+            ZStyleDataKey.HandleBorder: lambda p: p.BorderEmphasized
         },
         ('ZLineEdit','ZLoginEdit','ZNumberEdit'): {
-            ZStyleDataKey.Body: lambda: ZPalette.Body,
-            ZStyleDataKey.BodyFocused: lambda: ZPalette.PanelBody,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Text: lambda: ZPalette.Text,
-            ZStyleDataKey.PlaceHolder: lambda: ZPalette.TextMuted,
-            ZStyleDataKey.TextBackSectcted: lambda: ZPalette.Secondary,
-            ZStyleDataKey.Cursor: lambda: ZPalette.Primary,
-            ZStyleDataKey.Underline: lambda: ZPalette.Underline,
-            ZStyleDataKey.UnderlineFocused: lambda: ZPalette.Primary
+            ZStyleDataKey.Body: lambda p: p.Body,
+            ZStyleDataKey.BodyFocused: lambda p: p.PanelBody,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Text: lambda p: p.Text,
+            ZStyleDataKey.PlaceHolder: lambda p: p.TextMuted,
+            ZStyleDataKey.TextBackSectcted: lambda p: p.Secondary,
+            ZStyleDataKey.Cursor: lambda p: p.Primary,
+            ZStyleDataKey.Underline: lambda p: p.Underline,
+            ZStyleDataKey.UnderlineFocused: lambda p: p.Primary
         },
         ('ZHeadLine','ZTextBlock'):{
             ZStyleDataKey.Body: ZPalette.Transparent_000,
             ZStyleDataKey.Border: ZPalette.Transparent_000,
-            ZStyleDataKey.Text: lambda: ZPalette.Text,
-            ZStyleDataKey.TextBackSectcted: lambda: ZPalette.Primary,
-            ZStyleDataKey.Indicator: lambda: ZPalette.Primary
+            ZStyleDataKey.Text: lambda p: p.Text,
+            ZStyleDataKey.TextBackSectcted: lambda p: p.Primary,
+            ZStyleDataKey.Indicator: lambda p: p.Primary
         },
         'ZDialog': {
-            ZStyleDataKey.Body: lambda: ZPalette.PanelBody,
-            ZStyleDataKey.RegionFooter: lambda: ZPalette.Body,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
+            ZStyleDataKey.Body: lambda p: p.PanelBody,
+            ZStyleDataKey.RegionFooter: lambda p: p.Body,
+            ZStyleDataKey.Border: lambda p: p.Border,
         },
         'ZNavigationBar': {
-            ZStyleDataKey.Indicator: lambda: ZPalette.Primary
+            ZStyleDataKey.Indicator: lambda p: p.Primary
         },
         'ZNavBarButton': {
-            ZStyleDataKey.Icon: lambda: ZPalette.Icon
+            ZStyleDataKey.Icon: lambda p: p.Icon
         },
         'ZNavBarToggleButton': {
-            ZStyleDataKey.Icon: lambda: ZPalette.Icon,
-            ZStyleDataKey.IconToggled: lambda: ZPalette.Primary
+            ZStyleDataKey.Icon: lambda p: p.Icon,
+            ZStyleDataKey.IconToggled: lambda p: p.Primary
         },
     },
     # region -----------------------
     'Dark': {
         'ZFramelessWindow': {
-            ZStyleDataKey.Body: lambda: ZPalette.WindowBackground
+            ZStyleDataKey.Body: lambda p: p.WindowBackground
         },
         'ZTitleBarButton': {
             ZStyleDataKey.Icon: '#DCDCDC'
         },
         'ZToolTip': {
-            ZStyleDataKey.Body: lambda: ZPalette.PanelBody,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Text: lambda: ZPalette.Text
+            ZStyleDataKey.Body: lambda p: p.PanelBody,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Text: lambda p: p.Text
         },
         ('ZPanel','ZScrollPanel','ZComboBoxView'): {
-            ZStyleDataKey.Body: lambda: ZPalette.PanelBody,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Handle: lambda: ZPalette.ScrollHandle,
-            ZStyleDataKey.HandleBorder: lambda: ZPalette.ScrollHandle
+            ZStyleDataKey.Body: lambda p: p.PanelBody,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Handle: lambda p: p.ScrollHandle,
+            ZStyleDataKey.HandleBorder: lambda p: p.ScrollHandle
         },
         'ZCard': {
-            ZStyleDataKey.Body: lambda: ZPalette.CardBody,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Underline: lambda: ZPalette.Underline
+            ZStyleDataKey.Body: lambda p: p.CardBody,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Underline: lambda p: p.Underline
         },
         ('ZButton','ZRepeatButton','ZComboBox','ZComboBoxItem'): {
-            ZStyleDataKey.Body: lambda: ZPalette.Body,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Text: lambda: ZPalette.Text,
-            ZStyleDataKey.Icon: lambda: ZPalette.Icon,
-            ZStyleDataKey.Indicator: lambda: ZPalette.Primary
+            ZStyleDataKey.Body: lambda p: p.Body,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Text: lambda p: p.Text,
+            ZStyleDataKey.Icon: lambda p: p.Icon,
+            ZStyleDataKey.Indicator: lambda p: p.Primary
         },
         'ZLongPressButton': {
-            ZStyleDataKey.Body: lambda: ZPalette.Body,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Text: lambda: ZPalette.Text,
-            ZStyleDataKey.Icon: lambda: ZPalette.Icon,
-            ZStyleDataKey.Indicator: lambda: ZPalette.Primary,
-            ZStyleDataKey.Progress: lambda: ZPalette.Danger,
+            ZStyleDataKey.Body: lambda p: p.Body,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Text: lambda p: p.Text,
+            ZStyleDataKey.Icon: lambda p: p.Icon,
+            ZStyleDataKey.Indicator: lambda p: p.Primary,
+            ZStyleDataKey.Progress: lambda p: p.Danger,
         },
         'ZProgressButton': {
-            ZStyleDataKey.Body: lambda: ZPalette.Body,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Text: lambda: ZPalette.Text,
-            ZStyleDataKey.Icon: lambda: ZPalette.Icon,
-            ZStyleDataKey.Indicator: lambda: ZPalette.Primary,
-            ZStyleDataKey.Progress: lambda: ZPalette.Success,
+            ZStyleDataKey.Body: lambda p: p.Body,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Text: lambda p: p.Text,
+            ZStyleDataKey.Icon: lambda p: p.Icon,
+            ZStyleDataKey.Indicator: lambda p: p.Primary,
+            ZStyleDataKey.Progress: lambda p: p.Success,
         },
         'ZToggleButton': {
-            ZStyleDataKey.Body: lambda: ZPalette.Body,
-            ZStyleDataKey.BodyToggled: lambda: ZPalette.Primary,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Text: lambda: ZPalette.Text,
-            ZStyleDataKey.TextToggled: lambda: ZPalette.Text,
-            ZStyleDataKey.Icon: lambda: ZPalette.Icon,
-            ZStyleDataKey.IconToggled: lambda: ZPalette.Icon
+            ZStyleDataKey.Body: lambda p: p.Body,
+            ZStyleDataKey.BodyToggled: lambda p: p.Primary,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Text: lambda p: p.Text,
+            ZStyleDataKey.TextToggled: lambda p: p.Text,
+            ZStyleDataKey.Icon: lambda p: p.Icon,
+            ZStyleDataKey.IconToggled: lambda p: p.Icon
         },
         'ZSwitch':{
-            ZStyleDataKey.Body: lambda: ZPalette.Primary,
-            ZStyleDataKey.Border: lambda: ZPalette.BorderNeutral,
-            ZStyleDataKey.Handle: lambda: ZPalette.SwitchHandle,
+            ZStyleDataKey.Body: lambda p: p.Primary,
+            ZStyleDataKey.Border: lambda p: p.BorderNeutral,
+            ZStyleDataKey.Handle: lambda p: p.SwitchHandle,
             ZStyleDataKey.HandleToggled: ZPalette.Black_78,
         },
         'ZSlider': {
-            ZStyleDataKey.Track: lambda: ZPalette.BodyLighter,
-            ZStyleDataKey.TrackBorder: lambda: ZPalette.Border,
-            ZStyleDataKey.FillAreaStart: lambda: ZPalette.Primary,
-            ZStyleDataKey.FillAreaEnd: lambda: ZPalette.Secondary,
-            ZStyleDataKey.FillAreaBorder: lambda: ZPalette.Primary,
-            ZStyleDataKey.HandleInner: lambda: ZPalette.Secondary,
-            ZStyleDataKey.HandleOuter:lambda: ZPalette.SliderHandle,
-            ZStyleDataKey.HandleBorder: lambda: ZPalette.BorderEmphasized
+            ZStyleDataKey.Track: lambda p: p.BodyLighter,
+            ZStyleDataKey.TrackBorder: lambda p: p.Border,
+            ZStyleDataKey.FillAreaStart: lambda p: p.Primary,
+            ZStyleDataKey.FillAreaEnd: lambda p: p.Secondary,
+            ZStyleDataKey.FillAreaBorder: lambda p: p.Primary,
+            ZStyleDataKey.HandleInner: lambda p: p.Secondary,
+            ZStyleDataKey.HandleOuter:lambda p: p.SliderHandle,
+            ZStyleDataKey.HandleBorder: lambda p: p.BorderEmphasized
         },
         ('ZLineEdit','ZLoginEdit','ZNumberEdit'): {
-            ZStyleDataKey.Body: lambda: ZPalette.BodyDarker,
-            ZStyleDataKey.BodyFocused: lambda: ZPalette.PanelBody,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
-            ZStyleDataKey.Text: lambda: ZPalette.Text,
-            ZStyleDataKey.PlaceHolder: lambda: ZPalette.TextMuted,
-            ZStyleDataKey.TextBackSectcted: lambda: ZPalette.Primary,
-            ZStyleDataKey.Cursor: lambda: ZPalette.Primary,
-            ZStyleDataKey.Underline: lambda: ZPalette.Underline,
-            ZStyleDataKey.UnderlineFocused: lambda: ZPalette.Primary
+            ZStyleDataKey.Body: lambda p: p.BodyDarker,
+            ZStyleDataKey.BodyFocused: lambda p: p.PanelBody,
+            ZStyleDataKey.Border: lambda p: p.Border,
+            ZStyleDataKey.Text: lambda p: p.Text,
+            ZStyleDataKey.PlaceHolder: lambda p: p.TextMuted,
+            ZStyleDataKey.TextBackSectcted: lambda p: p.Primary,
+            ZStyleDataKey.Cursor: lambda p: p.Primary,
+            ZStyleDataKey.Underline: lambda p: p.Underline,
+            ZStyleDataKey.UnderlineFocused: lambda p: p.Primary
         },
         ('ZHeadLine','ZTextBlock'):{
             ZStyleDataKey.Body: ZPalette.Transparent_000,
             ZStyleDataKey.Border: ZPalette.Transparent_000,
-            ZStyleDataKey.Text: lambda: ZPalette.Text,
-            ZStyleDataKey.TextBackSectcted: lambda: ZPalette.Primary,
-            ZStyleDataKey.Indicator: lambda: ZPalette.Primary
+            ZStyleDataKey.Text: lambda p: p.Text,
+            ZStyleDataKey.TextBackSectcted: lambda p: p.Primary,
+            ZStyleDataKey.Indicator: lambda p: p.Primary
         },
         'ZDialog': {
-            ZStyleDataKey.Body: lambda: ZPalette.PanelBody,
-            ZStyleDataKey.RegionFooter: lambda: ZPalette.Body,
-            ZStyleDataKey.Border: lambda: ZPalette.Border,
+            ZStyleDataKey.Body: lambda p: p.PanelBody,
+            ZStyleDataKey.RegionFooter: lambda p: p.Body,
+            ZStyleDataKey.Border: lambda p: p.Border,
         },
         'ZNavigationBar': {
-            ZStyleDataKey.Indicator: lambda: ZPalette.Primary
+            ZStyleDataKey.Indicator: lambda p: p.Primary
         },
         'ZNavBarButton': {
-            ZStyleDataKey.Icon: lambda: ZPalette.Icon
+            ZStyleDataKey.Icon: lambda p: p.Icon
         },
         'ZNavBarToggleButton': {
-            ZStyleDataKey.Icon: lambda: ZPalette.Icon,
-            ZStyleDataKey.IconToggled: lambda: ZPalette.Primary
+            ZStyleDataKey.Icon: lambda p: p.Icon,
+            ZStyleDataKey.IconToggled: lambda p: p.Primary
         },
     }
 }
 
 # region Window
-@dataclass
+# 样式数据都是不可变记录，由 ZStyleDataFactory 驻留，字段相同的记录在所有控制器之间共享同一个实例，
+# 因此只按身份比较，修改字段需通过 ZStyleDataFactory.replace 得到新的记录
+@dataclass(frozen=True, eq=False)
 class ZFramelessWindowStyleData:
     Body: QColor
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZTitleBarButtonStyleData:
     Icon: QColor
 
 # region ToolTip
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZToolTipStyleData:
     Body: QColor
     Border: QColor
     Text: QColor
 
 # region Panel
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZPanelStyleData:
     Body: QColor
     Border: QColor
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZScrollPanelStyleData:
     Body: QColor
     Border: QColor
     Handle: QColor
     HandleBorder: QColor
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZCardStyleData:
     Body: QColor
     Border: QColor
     Underline: QColor
 
 # region Button
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZButtonStyleData:
     Body: QColor
     Border: QColor
     Text: QColor
     Icon: QColor
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZRepeatButtonStyleData:
     Body: QColor
     Border: QColor
@@ -559,7 +647,7 @@ class ZRepeatButtonStyleData:
     Icon: QColor
 
 # region ProgressButton
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZLongPressButtonStyleData:
     Body: QColor
     Border: QColor
@@ -567,7 +655,7 @@ class ZLongPressButtonStyleData:
     Icon: QColor
     Progress: QColor
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZProgressButtonStyleData:
     Body: QColor
     Border: QColor
@@ -576,7 +664,7 @@ class ZProgressButtonStyleData:
     Progress: QColor
 
 # region Switch
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZSwitchStyleData:
     Body: QColor
     Border: QColor
@@ -584,26 +672,26 @@ class ZSwitchStyleData:
     HandleToggled: QColor
 
 # region ComboBox
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZComboBoxStyleData:
     Body: QColor
     Border: QColor
     Text: QColor
     Icon: QColor
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZComboBoxViewStyleData:
     Body: QColor
     Border: QColor
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZComboBoxItemStyleData:
     Text: QColor
     Icon: QColor
     Indicator: QColor
 
 # region ToggleButton
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZToggleButtonStyleData:
     Body: QColor
     BodyToggled: QColor
@@ -614,7 +702,7 @@ class ZToggleButtonStyleData:
     IconToggled: QColor
 
 # region Slider
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZSliderStyleData:
     Track: QColor
     TrackBorder: QColor
@@ -626,7 +714,7 @@ class ZSliderStyleData:
     HandleBorder: QColor
 
 # region LineEdit
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZLineEditStyleData:
     Body: QColor
     BodyFocused: QColor
@@ -638,7 +726,7 @@ class ZLineEditStyleData:
     Underline: QColor
     UnderlineFocused: QColor
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZLoginEditStyleData:
     Body: QColor
     BodyFocused: QColor
@@ -649,7 +737,7 @@ class ZLoginEditStyleData:
     Underline: QColor
     UnderlineFocused: QColor
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZNumberEditStyleData:
     Body: QColor
     BodyFocused: QColor
@@ -661,7 +749,7 @@ class ZNumberEditStyleData:
     UnderlineFocused: QColor
 
 # region HeadLine
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZHeadLineStyleData:
     Body: QColor
     Border: QColor
@@ -669,7 +757,7 @@ class ZHeadLineStyleData:
     TextBackSectcted: QColor
     Indicator: QColor
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZTextBlockStyleData:
     Body: QColor
     Border: QColor
@@ -677,22 +765,22 @@ class ZTextBlockStyleData:
     TextBackSectcted: QColor
 
 # region ZDialog
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZDialogStyleData:
     Body: QColor
     RegionFooter: QColor
     Border: QColor
 
 # region NavigationBar
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZNavigationBarStyleData:
     Indicator: QColor
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZNavBarButtonStyleData:
     Icon: QColor
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ZNavBarToggleButtonStyleData:
     Icon: QColor
     IconToggled: QColor
@@ -758,14 +846,77 @@ class ZStyleDataFactory:
         'ZNavBarToggleButton': ZNavBarToggleButtonStyleData,
     }
 
+    _interned_data: dict[tuple, StyleDataT] = {}
+    _legacy_callables: set = set()
+    _interned_colors: dict[int, QColor] = {}
+    _field_names: dict[type, tuple[str, ...]] = {}
+
     @classmethod
-    def create(cls, name: str, map: dict) -> StyleDataT:
+    def internColor(cls, value) -> QColor:
+        '''返回与 value 颜色相同的共享 QColor ，调用方不应修改它'''
+        color = QColor(value)
+        rgba = color.rgba()
+        interned = cls._interned_colors.get(rgba)
+        if interned is None: interned = cls._interned_colors[rgba] = color
+        return interned
+
+    @classmethod
+    def fieldNames(cls, data_type: type) -> tuple[str, ...]:
+        names = cls._field_names.get(data_type)
+        if names is None: names = cls._field_names[data_type] = tuple(f.name for f in fields(data_type))
+        return names
+
+    @classmethod
+    def intern(cls, data: StyleDataT) -> StyleDataT:
+        '''返回与 data 字段完全相同的共享记录'''
+        data_type = type(data)
+        key = (data_type, *(getattr(data, name).rgba() for name in cls.fieldNames(data_type)))
+        interned = cls._interned_data.get(key)
+        if interned is None:
+            interned = cls._interned_data[key] = data_type(**{name: cls.internColor(getattr(data, name))
+                                                             for name in cls.fieldNames(data_type)})
+        return interned
+
+    @classmethod
+    def replace(cls, data: StyleDataT, /, **changes: QColor) -> StyleDataT:
+        '''写时复制：返回在 data 基础上修改了部分字段的共享记录，data 本身不变'''
+        if not changes: return data
+        return cls.intern(replace(data, **changes))
+
+    @classmethod
+    def evaluate(cls, value, palette: ZThemePalette):
+        '''
+        求值样式表中的动态颜色
+
+        - 以调色板为参数的可调用对象（ `lambda p: p.Body` ）直接传入 palette
+        - 兼容旧式无参数的可调用对象（ `lambda: ZPalette.Body` ）：求值时临时把 palette 载入全局的 `ZPalette` ，之后恢复
+        '''
+        try:
+            takes_palette = len(inspect.signature(value).parameters) > 0
+        except (TypeError, ValueError):
+            takes_palette = True
+        if takes_palette: return value(palette)
+        if value not in cls._legacy_callables:
+            cls._legacy_callables.add(value)
+            logging.warning(f"样式表中的无参数动态颜色已过时，请改为以调色板为参数的形式，例如 lambda p: p.Body : {value!r}")
+        snapshot = {key.value: getattr(ZPalette, key.value) for key in ZPaletteKey if hasattr(ZPalette, key.value)}
+        ZPalette.loadThemePalette(palette)
+        try:
+            return value()
+        finally:
+            for field, color in snapshot.items(): setattr(ZPalette, field, color)
+
+    @classmethod
+    def create(cls, name: str, map: dict, palette: ZThemePalette | None = None) -> StyleDataT:
         data_type = cls.dataclass_map.get(name)
         if data_type is None: raise ValueError(f"Unknown style data class for component: {name}")
-        return cls.dictToDataclass(data_type, name, map)
+        return cls.dictToDataclass(data_type, name, map, palette)
 
     @staticmethod
-    def dictToDataclass(data_type: StyleDataT, name: str, map: dict) -> StyleDataT:
+    def dictToDataclass(data_type: StyleDataT, name: str, map: dict, palette: ZThemePalette | None = None) -> StyleDataT:
+        '''
+        :param palette: 动态颜色求值所用的调色板，默认为当前主题的调色板
+        '''
         if not is_dataclass(data_type): raise TypeError(f"{data_type} is not a dataclass")
         # 获取组件对应的样式数据字典
         component_data = {}
@@ -784,76 +935,135 @@ class ZStyleDataFactory:
             if key_str in field_names:
                 # 确保值是QColor类型（处理可能的动态颜色值）
                 if callable(value):
-                    color_value = value()
-                    filtered[key_str] = QColor(color_value)
+                    if palette is None: palette = ZPalette.byTheme(ZThemeManager().getThemeName())
+                    color_value = ZStyleDataFactory.evaluate(value, palette)
+                    filtered[key_str] = ZStyleDataFactory.internColor(color_value)
                 else:
                     color_value = value
-                    filtered[key_str] = QColor(color_value)
+                    filtered[key_str] = ZStyleDataFactory.internColor(color_value)
         # 检查是否缺失必要字段
         missing = set(field_names) - set(filtered.keys())
         if missing:
             raise ValueError(f"Missing required fields for {data_type.__name__}: {missing}")
-        return data_type(**filtered)
+        return ZStyleDataFactory.intern(data_type(**filtered))
 
 # region ZStyleDataManager
 class ZStyleDataManager(metaclass=SingletonMeta):
+    """
+    样式数据管理器
+
+    - 首次使用时把 `style_data_map` 编译为两个主题的扁平索引：组件名 -> 现成的样式数据，
+      之后 `getStyleData` 、 `getStyleDataByTheme` 与主题切换都只是字典查找
+    - 动态颜色以各主题的 `ZThemePalette` 为参数求值，编译过程不读写全局的 `ZPalette`
+    - 编译结果可以通过 `saveCompiled` 写入磁盘，下次启动用 `loadCompiled` 读取，
+      文件中记录了调色板与样式表的哈希，源数据变化后旧文件自动失效
+    """
     def __init__(self) -> None:
         super().__init__()
-        self._cache: Dict[str, StyleDataT] = {}
+        self._tables: Dict[str, Dict[str, StyleDataT]] | None = None
+        self._table: Dict[str, StyleDataT] | None = None
         ZThemeManager().themeChanged.connect(self._theme_change_handler_)
-
-    def _take_palette_snapshot(self) -> Dict[str, QColor]:
-        """保存当前ZPalette的所有颜色状态"""
-        return {
-            field: getattr(ZPalette, field)
-            for field in ZPalette.__annotations__
-            if hasattr(ZPalette, field)
-        }
-
-    def _restore_palette_snapshot(self, snapshot: Dict[str, QColor]) -> None:
-        """恢复ZPalette到指定的快照状态"""
-        for field, color in snapshot.items():
-            setattr(ZPalette, field, color)
+        # 全局调色板随样式数据管理器一起加载当前主题的颜色
+        ZPalette.loadThemePalette(ZPalette.byTheme(ZThemeManager().getThemeName()))
 
     def getStyleData(self, name: str) -> StyleDataT:
         '''获取当前主题下的样式数据'''
-        # 检查缓存
-        if name in self._cache: return self._cache[name]
-        # 缓存中没有，则创建并缓存
-        style_data = ZStyleDataFactory.create(name, style_data_map[ZThemeManager().getThemeName()])
-        self._cache[name] = style_data
-        return style_data
+        if self._table is None: self._table = self.tables()[ZThemeManager().getThemeName()]
+        try:
+            return self._table[name]
+        except KeyError:
+            raise ValueError(f"Unknown style data class for component: {name}") from None
 
     def getStyleDataByTheme(self, name: str, theme: str) -> StyleDataT:
         '''获取指定主题下的样式数据'''
-        current_theme = ZThemeManager().getThemeName()
-        if theme == current_theme:
-            return self.getStyleData(name)
+        try:
+            return self.tables()[theme][name]
+        except KeyError:
+            raise ValueError(f"No style data found for component {name} in theme {theme}") from None
+
+    def tables(self) -> Dict[str, Dict[str, StyleDataT]]:
+        '''两个主题的样式数据索引，未编译时先编译'''
+        if self._tables is None: self.compile()
+        return self._tables
 
-        # 保存当前调色板状态
-        current_snapshot = self._take_palette_snapshot()
+    def compile(self) -> None:
+        '''把所有组件的样式数据一次性编译为两个主题的索引'''
+        tables: Dict[str, Dict[str, StyleDataT]] = {}
+        for theme in ('Light', 'Dark'):
+            palette = ZPalette.byTheme(theme)
+            tables[theme] = {name: ZStyleDataFactory.create(name, style_data_map[theme], palette)
+                             for name in ZStyleDataFactory.dataclass_map}
+        self._tables = tables
+        self._table = None
+
+    @staticmethod
+    def sourceHash() -> str:
+        '''调色板、样式表与数据类字段的哈希，用于判断磁盘上的编译结果是否过期'''
+        h = hashlib.sha1()
+        for theme in ('Light', 'Dark'):
+            colors = ZPalette.byTheme(theme).colors()
+            h.update(repr([(key.value, color.name(QColor.NameFormat.HexArgb)) for key, color in colors.items()]).encode())
+        for theme, components in style_data_map.items():
+            h.update(theme.encode())
+            for names, component_data in components.items():
+                h.update(repr(names).encode())
+                for key, value in component_data.items():
+                    # 动态颜色记录其引用的调色板名称，固定颜色记录其值
+                    source = value.__code__.co_names if callable(value) else QColor(value).name(QColor.NameFormat.HexArgb)
+                    h.update(repr((key.value if isinstance(key, Enum) else key, source)).encode())
+        for name, data_type in ZStyleDataFactory.dataclass_map.items():
+            h.update(repr((name, ZStyleDataFactory.fieldNames(data_type))).encode())
+        return h.hexdigest()
+
+    def saveCompiled(self, path: str) -> None:
+        '''把编译后的索引写入 JSON 文件'''
+        tables = {
+            theme: {
+                name: {field: getattr(data, field).name(QColor.NameFormat.HexArgb)
+                       for field in ZStyleDataFactory.fieldNames(type(data))}
+                for name, data in table.items()
+            }
+            for theme, table in self.tables().items()
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'hash': self.sourceHash(), 'tables': tables}, f)
+
+    def loadCompiled(self, path: str) -> bool:
+        '''
+        从 JSON 文件读取编译后的索引
+
+        :return: 文件不存在、损坏或已过期时返回 False ，此时仍会在首次使用时重新编译
+        '''
         try:
-            # 临时切换到目标主题的调色板
-            if theme == 'Light':
-                ZPalette.loadLightPalette()
-            elif theme == 'Dark':
-                ZPalette.loadDarkPalette()
-            # 创建目标主题的样式数据
-            return ZStyleDataFactory.create(name, style_data_map[theme])
-        finally:
-            # 无论是否发生异常，都恢复原始调色板状态
-            self._restore_palette_snapshot(current_snapshot)
+            with open(path, 'r', encoding='utf-8') as f:
+                compiled = json.load(f)
+            if compiled.get('hash') != self.sourceHash(): return False
+            tables = {
+                theme: {
+                    name: ZStyleDataFactory.intern(ZStyleDataFactory.dataclass_map[name](
+                        **{field: ZStyleDataFactory.internColor(color) for field, color in data.items()}))
+                    for name, data in table.items()
+                }
+                for theme, table in compiled['tables'].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.warning(f"样式数据编译缓存无法读取: {e}")
+            return False
+        self._tables = tables
+        self._table = None
+        return True
 
     def _theme_change_handler_(self, theme: str) -> None:
-        self.clearCache()
+        self._table = self.tables()[theme]
         if theme == 'Light':
             ZPalette.loadLightPalette()
         elif theme == 'Dark':
             ZPalette.loadDarkPalette()
 
     def clearCache(self) -> None:
-        """清除所有缓存的样式数据实例，用于主题切换等场景"""
-        self._cache.clear()
+        """丢弃编译后的索引，修改调色板或样式表后调用，下次使用时重新编译"""
+        self._tables = None
+        self._table = None
 
 
 # region 测试
@@ -881,17 +1091,11 @@ if __name__ == '__main__':
         except Exception as e:
             logging.info(f"{name} 样式数据获取失败: {str(e)}")
 
-    # 切换到深色调色板
-    ZPalette.loadDarkPalette()
-    # 清除缓存以重新生成样式数据
-    ZStyleDataManager().clearCache()
-    logging.info("已加载深色调色板")
-
-    # 测试深色调色板下的样式数据
+    # 深色主题的样式数据直接按主题获取，无需切换全局调色板
     logging.info("===== 测试深色调色板样式 =====")
     for name in component_names:
         try:
-            style_data = ZStyleDataManager().getStyleData(name)
+            style_data = ZStyleDataManager().getStyleDataByTheme(name, 'Dark')
             logging.info(f"---{name} 样式数据---")
             for field in fields(style_data):
                 value = getattr(style_data, field.name)
@@ -1,14 +1,20 @@
-import winreg
 import logging
-import threading
-from PySide6.QtCore import QObject, Signal, Property
-from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt, QObject, QTimer, Signal, Property
+from PySide6.QtGui import QGuiApplication, QStyleHints
 from enum import IntEnum
 from ZenWidgets.core.utils import Singleton
+try:
+    import winreg
+except ImportError:
+    # 非 Windows 平台没有 winreg ，注册表来源不可用
+    winreg = None
 
 __all__ = [
     'ZTheme',
     'ZThemeMode',
+    'ABCThemeSource',
+    'ZStyleHintsThemeSource',
+    'ZRegistryThemeSource',
     'ZThemeManager'
 ]
 
@@ -20,52 +26,172 @@ class ZThemeMode(IntEnum):
     FollowSystem = 0
     Preset = 1
 
+
+# region ABCThemeSource
+class ABCThemeSource(QObject):
+    '''
+    系统主题来源的抽象类
+
+    - `systemTheme` 返回当前系统主题，无法确定时返回 None
+    - 系统主题改变时发出 `systemThemeChanged` ，可以在任意线程发出，
+      主题管理器通过自动连接在 GUI 线程中接收
+    '''
+    systemThemeChanged = Signal(object)
+    def isAvailable(self) -> bool:
+        '''当前平台与运行状态下能否确定系统主题'''
+        return self.systemTheme() is not None
+
+    def systemTheme(self) -> ZTheme | None: raise NotImplementedError
+
+    def start(self) -> None:
+        '''开始监听系统主题变化'''
+
+    def stop(self) -> None:
+        '''停止监听系统主题变化'''
+
+
+# region ZStyleHintsThemeSource
+class ZStyleHintsThemeSource(ABCThemeSource):
+    '''
+    基于 `QStyleHints.colorScheme` 的主题来源
+
+    - 由系统事件驱动，没有轮询：Windows 与 macOS 由 Qt 接收系统通知，
+      Linux 上由 Qt 的平台主题读取 xdg-desktop-portal 的设置
+    - 需要 Qt 6.5 及以上，并且 QGuiApplication 已经创建
+    '''
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._hints: QStyleHints | None = None
+
+    def systemTheme(self) -> ZTheme | None:
+        hints = self._style_hints_()
+        if hints is None: return None
+        scheme = hints.colorScheme()
+        if scheme == Qt.ColorScheme.Dark: return ZTheme.Dark
+        if scheme == Qt.ColorScheme.Light: return ZTheme.Light
+        return None
+
+    def start(self) -> None:
+        if self._hints is not None: return
+        self._hints = self._style_hints_()
+        if self._hints is not None: self._hints.colorSchemeChanged.connect(self._on_color_scheme_changed_)
+
+    def stop(self) -> None:
+        if self._hints is None: return
+        self._hints.colorSchemeChanged.disconnect(self._on_color_scheme_changed_)
+        self._hints = None
+
+    @staticmethod
+    def _style_hints_() -> QStyleHints | None:
+        if not isinstance(QGuiApplication.instance(), QGuiApplication): return None
+        if not hasattr(QStyleHints, 'colorScheme'): return None
+        return QGuiApplication.styleHints()
+
+    def _on_color_scheme_changed_(self, scheme: Qt.ColorScheme) -> None:
+        theme = self.systemTheme()
+        if theme is not None: self.systemThemeChanged.emit(theme)
+
+
+# region ZRegistryThemeSource
+class ZRegistryThemeSource(ABCThemeSource):
+    '''
+    读取 Windows 注册表的主题来源，作为没有系统事件时的后备
+
+    - 在 GUI 线程中用计时器轮询，不再占用常驻线程
+    - 系统主题没有变化时轮询间隔按 `backoff` 倍数逐步延长到 `maxInterval` ，
+      变化后或应用回到前台时恢复为 `minInterval`
+    '''
+    registry_key = r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
+    def __init__(self, parent: QObject | None = None, min_interval: int = 500, max_interval: int = 8000, backoff: float = 2.0):
+        super().__init__(parent)
+        self._min_interval: int = min_interval
+        self._max_interval: int = max_interval
+        self._backoff: float = backoff
+        self._last_theme: ZTheme | None = None
+        self._timer: QTimer | None = None
+
+    def minInterval(self) -> int: return self._min_interval
+
+    def maxInterval(self) -> int: return self._max_interval
+
+    def backoff(self) -> float: return self._backoff
+
+    def setIntervals(self, min_interval: int, max_interval: int, backoff: float = 2.0) -> None:
+        '''设置轮询的最短、最长间隔（毫秒）与间隔延长的倍数'''
+        self._min_interval = max(1, min_interval)
+        self._max_interval = max(self._min_interval, max_interval)
+        self._backoff = max(1.0, backoff)
+        if self._timer is not None: self._timer.setInterval(self._min_interval)
+
+    def isPolling(self) -> bool: return self._timer is not None and self._timer.isActive()
+
+    def systemTheme(self) -> ZTheme | None:
+        if winreg is None: return None
+        try:
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.registry_key) as registry_key:
+                theme = winreg.QueryValueEx(registry_key, "AppsUseLightTheme")[0]
+                return ZTheme.Light if theme == 1 else ZTheme.Dark
+        except OSError:
+            return None
+
+    def start(self) -> None:
+        if self._timer is not None or winreg is None: return
+        self._last_theme = self.systemTheme()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self._min_interval)
+        self._timer.timeout.connect(self._poll_)
+        self._timer.start()
+        app = QGuiApplication.instance()
+        if isinstance(app, QGuiApplication): app.applicationStateChanged.connect(self._on_application_state_changed_)
+
+    def stop(self) -> None:
+        if self._timer is None: return
+        app = QGuiApplication.instance()
+        if isinstance(app, QGuiApplication): app.applicationStateChanged.disconnect(self._on_application_state_changed_)
+        self._timer.stop()
+        self._timer.deleteLater()
+        self._timer = None
+
+    def _poll_(self) -> None:
+        theme = self.systemTheme()
+        if theme is not None and theme != self._last_theme:
+            self._last_theme = theme
+            self._timer.setInterval(self._min_interval)
+            self.systemThemeChanged.emit(theme)
+        else:
+            self._timer.setInterval(min(self._max_interval, int(self._timer.interval() * self._backoff)))
+        self._timer.start()
+
+    def _on_application_state_changed_(self, state: Qt.ApplicationState) -> None:
+        # 用户多半是在其他窗口里修改了系统设置，回到前台时立即检查一次
+        if state == Qt.ApplicationState.ApplicationActive and self._timer is not None:
+            self._timer.setInterval(self._min_interval)
+            self._poll_()
+
+
+# region ZThemeManager
 @Singleton
 class ZThemeManager(QObject):
+    '''
+    主题管理器
+
+    - 跟随系统时从主题来源获取系统主题：优先使用事件驱动的 `ZStyleHintsThemeSource` ，
+      不可用时退回到轮询注册表的 `ZRegistryThemeSource` ，都不可用时保持当前主题
+    - 管理器可能在 QApplication 之前创建，此时系统主题的监听推迟到 `startMonitoring` 被调用时
+    '''
     themeChanged = Signal(str)
     def __init__(self):
         super().__init__()
         self._theme = ZTheme.Dark
         self._mode = ZThemeMode.FollowSystem
-        self._monitor_thread = None
-        self._stop_event = threading.Event()
+        self._source: ABCThemeSource | None = None
+        self._source_probed: bool = False
         if self._mode == ZThemeMode.FollowSystem:
             self._theme = self.getSystemTheme()
-            self._start_monitoring()
-
-    def _start_monitoring(self):
-        """启动主题监控"""
-        if self._monitor_thread is not None and self._monitor_thread.is_alive():
-            self._stop_event.set()
-            self._monitor_thread.join()
-
-        self._stop_event.clear()
-        self._monitor_thread = threading.Thread(target=self._monitor_theme, daemon=True)
-        self._monitor_thread.start()
-
-    def _stop_monitoring_internal(self):
-        """停止主题监控"""
-        if self._stop_event:
-            self._stop_event.set()
-        if self._monitor_thread and self._monitor_thread.is_alive():
-            self._monitor_thread.join()
-
-    def _monitor_theme(self):
-        """监控主题变化"""
-        while not self._stop_event.is_set():
-            if self._mode == ZThemeMode.FollowSystem:
-                current_system_theme = self.getSystemTheme()
-                if current_system_theme != self._theme:
-                    self._theme = current_system_theme
-                    # 在主线程中触发信号
-                    self.themeChanged.emit(self._theme.name)
-                    # 触发UI重绘
-                    app = QApplication.instance()
-                    if app:
-                        app.processEvents()
-            # 等待1秒或直到停止事件被设置
-            self._stop_event.wait(0.5)
+            self.startMonitoring()
 
+    # region public
     def isDarkTheme(self): return True if self._theme == ZTheme.Dark else False
 
     def isLightTheme(self): return True if self._theme == ZTheme.Light else False
@@ -78,7 +204,7 @@ class ZThemeManager(QObject):
         if self._theme == value: return
         if self._mode == ZThemeMode.FollowSystem:
             self._mode = ZThemeMode.Preset
-            self._stop_monitoring_internal()
+            self.stopMonitoring()
         self._theme = value
         self.themeChanged.emit(value.name)
 
@@ -94,25 +220,73 @@ class ZThemeManager(QObject):
         if self._mode == value: return
         self._mode = value
         if self._mode == ZThemeMode.FollowSystem:
-            self._start_monitoring()
-            current_system_theme = self.getSystemTheme()
-            if current_system_theme != self._theme:
-                self._theme = current_system_theme
-                self.themeChanged.emit(self._theme.name)
+            self.startMonitoring()
+            self._on_system_theme_changed_(self.getSystemTheme())
         else:
-            self._stop_monitoring_internal()
+            self.stopMonitoring()
 
-    @staticmethod
-    def getSystemTheme():
-        """获取Windows系统主题"""
-        try:
-            key = r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key) as registry_key:
-                theme = winreg.QueryValueEx(registry_key, "AppsUseLightTheme")[0]
-                return ZTheme.Light if theme == 1 else ZTheme.Dark
-        except WindowsError:
-            return ZTheme.Light  # 默认使用浅色主题
+    def themeSource(self) -> ABCThemeSource | None: return self._source
+
+    def setThemeSource(self, source: ABCThemeSource) -> None:
+        '''
+        替换系统主题来源，例如接入桌面环境特有的设置服务
+
+        :param source: 新的主题来源，跟随系统时立即开始监听
+        '''
+        self.stopMonitoring()
+        if self._source is not None: self._source.systemThemeChanged.disconnect(self._on_system_theme_changed_)
+        self._source = source
+        source.systemThemeChanged.connect(self._on_system_theme_changed_)
+        if self._mode == ZThemeMode.FollowSystem:
+            self.startMonitoring()
+            self._on_system_theme_changed_(self.getSystemTheme())
+
+    def startMonitoring(self) -> bool:
+        '''
+        开始监听系统主题，重复调用无副作用
+
+        :return: 是否已经在监听，QApplication 尚未创建时返回 False
+        '''
+        if not isinstance(QGuiApplication.instance(), QGuiApplication): return False
+        if self._source is None:
+            # 没有可用来源时只探测一次
+            if self._source_probed: return False
+            self._source_probed = True
+            self._source = self._create_source_()
+            if self._source is None: return False
+            self._source.systemThemeChanged.connect(self._on_system_theme_changed_)
+            # 创建管理器时可能还无法读取系统主题，来源就绪后同步一次
+            theme = self._source.systemTheme()
+            if theme is not None: self._on_system_theme_changed_(theme)
+        self._source.start()
+        return True
+
+    def stopMonitoring(self) -> None:
+        '''停止监听系统主题'''
+        if self._source is not None: self._source.stop()
+
+    def getSystemTheme(self) -> ZTheme:
+        """获取系统主题，无法确定时使用浅色主题"""
+        sources = [self._source] if self._source is not None else [ZStyleHintsThemeSource(), ZRegistryThemeSource()]
+        for source in sources:
+            theme = source.systemTheme()
+            if theme is not None: return theme
+        return ZTheme.Light  # 默认使用浅色主题
 
     def cleanup(self):
         """清理资源"""
-        self._stop_monitoring_internal()
+        self.stopMonitoring()
+
+    # region private
+    def _create_source_(self) -> ABCThemeSource | None:
+        for source_type in (ZStyleHintsThemeSource, ZRegistryThemeSource):
+            source = source_type(self)
+            if source.isAvailable(): return source
+            source.deleteLater()
+        logging.info("没有可用的系统主题来源，保持当前主题")
+        return None
+
+    def _on_system_theme_changed_(self, theme: ZTheme) -> None:
+        if self._mode != ZThemeMode.FollowSystem or theme == self._theme: return
+        self._theme = theme
+        self.themeChanged.emit(theme.name)
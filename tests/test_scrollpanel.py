@@ -0,0 +1,50 @@
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QSize
+from PySide6.QtWidgets import QApplication, QWidget
+
+app = QApplication.instance() or QApplication([])
+
+from ZenWidgets import ZScrollPanel, ABCScrollDelegate
+
+
+class _Row(QWidget):
+    def sizeHint(self): return QSize(100, 60)
+
+
+class _UnderEstimated(ABCScrollDelegate):
+    '''估计行高 30 ，实际测量为 60'''
+    def rowCount(self): return 2000
+
+    def rowHeight(self, row): return None
+
+    def estimatedRowHeight(self): return 30
+
+    def createRow(self, parent): return _Row(parent)
+
+    def bindRow(self, widget, row): pass
+
+
+def _settle(panel: ZScrollPanel):
+    for _ in range(1000):
+        app.processEvents()
+        if not panel.scroller().isActive(): return
+        time.sleep(0.005)
+
+
+def test_scroll_to_top_after_measuring_rows():
+    panel = ZScrollPanel()
+    panel.resize(400, 600)
+    panel.setDelegate(_UnderEstimated())
+    panel.show()
+    app.processEvents()
+    panel.scrollTo(y=30000)
+    _settle(panel)
+    assert panel.content().y() == -30000
+    panel.scrollTo(y=0)
+    _settle(panel)
+    assert panel.content().y() == 0
+    assert panel.visibleRows()[0] == 0